@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from scripts.ai.llm_router import get_prompt_template, apply_persona
 from scripts.ai.module_docstring_summarizer import summarize_module
@@ -8,9 +8,7 @@ from scripts.unified_code_assistant.prompt_builder import build_contextual_promp
 from scripts.unified_code_assistant.assistant_utils import get_issue_locations
 from scripts.unified_code_assistant.module_summarizer import summarize_modules
 from scripts.ai.llm_refactor_advisor import build_refactor_prompt
-from scripts.unified_code_assistant import cli_entrypoint
-import tempfile
-import json
+from scripts.unified_code_assistant.strategy import STRATEGY_SUBCATEGORY, build_strategy_prompt
 
 class AIIntegration:
     def __init__(self, config, summarizer):
@@ -20,16 +18,37 @@ class AIIntegration:
         self.config = config
         self.summarizer = summarizer
 
+    @property
+    def last_ttft_seconds(self) -> Optional[float]:
+        """
+        Seconds until the first token of the last streamed answer, or None if nothing was
+        streamed yet.
+        """
+        return (getattr(self.summarizer, "last_stream", None) or {}).get("ttft_seconds")
+
+    def _audit_prompt(self, metrics_context: str) -> str:
+        prompt = get_prompt_template("Audit Summary", self.config)
+        final_prompt = apply_persona(prompt, self.config.persona)
+        return final_prompt + "\n\n" + metrics_context
+
     def generate_audit_summary(self, metrics_context: str) -> str:
         """
         Generates an AI-driven audit summary based on provided metrics context.
         
         Combines a persona-enriched audit summary prompt with the given metrics context and returns a summarized audit report as a string.
         """
-        prompt = get_prompt_template("Audit Summary", self.config)
-        final_prompt = apply_persona(prompt, self.config.persona)
-        enriched = final_prompt + "\n\n" + metrics_context
-        return self.summarizer.summarize_entry(enriched, subcategory="Audit Summary")
+        return self.summarizer.summarize_entry(
+            self._audit_prompt(metrics_context), subcategory="Audit Summary"
+        )
+
+    def stream_audit_summary(self, metrics_context: str) -> Iterator[str]:
+        """
+        Streams the audit summary of `generate_audit_summary` chunk by chunk, for display
+        from the first token on (e.g. with ``st.write_stream``).
+        """
+        return self.summarizer.summarize_entry_stream(
+            self._audit_prompt(metrics_context), subcategory="Audit Summary"
+        )
 
     def generate_refactor_advice(self, merged_data, limit: int):
         """
@@ -44,6 +63,21 @@ class AIIntegration:
         Returns:
             A tuple containing the AI-generated refactor suggestion and the list of top offenders.
         """
+        prompt, offenders = self._refactor_prompt(merged_data, limit)
+        suggestion = self.summarizer.summarize_entry(prompt, subcategory="Refactor Advisor")
+        return suggestion, offenders
+
+    def stream_refactor_advice(self, merged_data, limit: int) -> Tuple[Iterator[str], List]:
+        """
+        Streaming variant of `generate_refactor_advice`.
+
+        Returns:
+            A tuple of the suggestion as a stream of chunks and the list of top offenders.
+        """
+        prompt, offenders = self._refactor_prompt(merged_data, limit)
+        return self.summarizer.summarize_entry_stream(prompt, subcategory="Refactor Advisor"), offenders
+
+    def _refactor_prompt(self, merged_data, limit: int) -> Tuple[str, List]:
         analysis = analyze_report(merged_data, top_n=limit)
         prompt = build_contextual_prompt(
             "What needs refactoring?",
@@ -51,14 +85,13 @@ class AIIntegration:
             analysis["summary_metrics"],
             self.config.persona
         )
-        suggestion = self.summarizer.summarize_entry(prompt, subcategory="Refactor Advisor")
-        return suggestion, analysis["top_offenders"]
+        return prompt, analysis["top_offenders"]
 
     def generate_strategic_recommendations(self, merged_data, limit: int = 30):
         """
         Generates strategic recommendations based on merged code analysis data.
         
-        Writes the merged data to a temporary JSON file and invokes a CLI assistant in strategic mode with the specified limit and persona. Returns the output generated by the CLI assistant.
+        Builds the strategic mode prompt of the assistant CLI in process, with the specified limit and persona, and summarizes it.
         
         Args:
             merged_data: The combined code analysis data to be evaluated.
@@ -67,11 +100,18 @@ class AIIntegration:
         Returns:
             The output string containing strategic recommendations.
         """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(merged_data, f)
-            f.flush()
-            args = ["assistant", f.name, "--mode", "strategic", "--top", str(limit), "--persona", self.config.persona]
-            return cli_entrypoint.call_cli_for_output(args)
+        return "".join(self.stream_strategic_recommendations(merged_data, limit))
+
+    def stream_strategic_recommendations(self, merged_data, limit: int = 30) -> Iterator[str]:
+        """
+        Streams the strategic recommendations of `generate_strategic_recommendations` chunk
+        by chunk.
+        """
+        analysis = analyze_report(merged_data, top_n=limit)
+        prompt = build_strategy_prompt(
+            analysis["severity_data"], analysis["summary_metrics"], limit, self.config.persona
+        )
+        return self.summarizer.summarize_entry_stream(prompt, subcategory=STRATEGY_SUBCATEGORY)
 
     def chat_general(self, user_query, merged_data):
         """
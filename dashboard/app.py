@@ -44,6 +44,16 @@ config = ConfigManager.load_config()
 summarizer = AISummarizer()
 ai = AIIntegration(config, summarizer)
 
+
+def show_first_token_time() -> None:
+    """
+    Shows how long the answer just streamed took to its first token.
+    """
+    ttft = ai.last_ttft_seconds
+    if ttft is not None:
+        st.caption(f"First token after {ttft:.2f}s")
+
+
 summary = compute_executive_summary(merged_data, strictness_data)
 for i, (label, val) in enumerate(summary.items()):
     if i % 3 == 0:
@@ -63,9 +73,10 @@ with st.expander("\U0001F4DA AI Report Summary", expanded=True):
             f"Avg Severity: {summary['avg_severity']}; "
             f"Overall Coverage: {summary['overall_coverage']}%"
         ) + "; ".join(f"{m}: {cov*100:.1f}%" for m, cov in low_cov)
-        st.session_state["audit_summary"] = ai.generate_audit_summary(metrics_ctx)
-    if st.session_state["audit_summary"]:
+        st.session_state["audit_summary"] = st.write_stream(ai.stream_audit_summary(metrics_ctx))
         st.success("AI summary generated!")
+        show_first_token_time()
+    elif st.session_state["audit_summary"]:
         st.write(st.session_state["audit_summary"])
 
 st.markdown("---")
@@ -92,8 +103,10 @@ with st.expander("\U0001F916 Refactor Advisor", expanded=True):
         st.session_state["offender_df"] = None
     refactor_limit = st.slider("Number of files to analyze:", 5, 50, 30, step=5, key="refactor_limit")
     if st.button("Generate Refactor Suggestions"):
-        suggestions, offenders = ai.generate_refactor_advice(merged_data, limit=refactor_limit)
-        st.session_state["refactor_suggestions"] = suggestions
+        stream, offenders = ai.stream_refactor_advice(merged_data, limit=refactor_limit)
+        st.session_state["refactor_suggestions"] = st.write_stream(stream)
+        st.success("Refactor suggestions generated!")
+        show_first_token_time()
         df = pd.DataFrame([
             {
                 "File": os.path.basename(fp),
@@ -106,8 +119,7 @@ with st.expander("\U0001F916 Refactor Advisor", expanded=True):
             for fp, score, errors, lint_issues, cx, cov in offenders
         ])
         st.session_state["offender_df"] = df
-    if st.session_state["refactor_suggestions"]:
-        st.success("Refactor suggestions generated!")
+    elif st.session_state["refactor_suggestions"]:
         st.markdown(st.session_state["refactor_suggestions"])
     if st.session_state.get("offender_df") is not None:
         st.dataframe(st.session_state["offender_df"].style.background_gradient(subset=["Severity Score"]))
@@ -118,8 +130,11 @@ with st.expander("Get AI-Powered Recommendations", expanded=True):
     if "strategic_recommendations" not in st.session_state:
         st.session_state["strategic_recommendations"] = ""
     if st.button("Generate Strategic Recommendations"):
-        st.session_state["strategic_recommendations"] = ai.generate_strategic_recommendations(merged_data, limit=file_limit)
-    if st.session_state["strategic_recommendations"]:
+        st.session_state["strategic_recommendations"] = st.write_stream(
+            ai.stream_strategic_recommendations(merged_data, limit=file_limit)
+        )
+        show_first_token_time()
+    elif st.session_state["strategic_recommendations"]:
         st.markdown(st.session_state["strategic_recommendations"])
 
 st.markdown("---")
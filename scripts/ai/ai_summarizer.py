@@ -3,7 +3,8 @@ This module provides the AISummarizer class for generating summaries of text ent
 using a configurable large language model (LLM).
 
 It supports both single-entry and bulk summarization, with the ability to use
-subcategory-specific prompts loaded from configuration. If the primary summarization
+subcategory-specific prompts loaded from configuration. Single entries can also be
+streamed chunk by chunk, with time-to-first-token recorded for each call. If the primary summarization
 method fails, the module falls back to the Ollama chat API to attempt summarization.
 Logging is integrated throughout for monitoring and debugging,
 and configuration is loaded at initialization for flexible model and prompt management.
@@ -14,9 +15,12 @@ in workflows requiring concise, context-aware summaries.
 
 import ollama
 import logging
+import time
 from requests.exceptions import RequestException
+from scripts.ai import llm_cache
+from scripts.ai.llm_cache import LLMResponseCache
 from scripts.config.config_loader import load_config, get_config_value
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +44,57 @@ class AISummarizer:
         self.prompts_by_subcategory: Dict[str, Any] = get_config_value(
             config, "prompts_by_subcategory", {}
         )  # Load prompts categorized by subcategory
+        self.cache: Optional[LLMResponseCache] = llm_cache.cache_from_config(
+            config
+        )  # Shared response cache, None when llm_cache_enabled is false
+        self.last_stream: Dict[str, Any] = {}  # Timings of the latest summarize_entry_stream
         logger.info("[INIT] AISummarizer initialized with model: %s", self.model)
 
-    def _fallback_summary(self, full_prompt: str) -> str:
+    def _cached(
+        self, kind: str, full_prompt: str, bypass_cache: bool
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Looks up the response to `full_prompt`; returns ``(key, response)`` where `key` is None
+        when caching is off and `response` is None on a miss (or when `bypass_cache` is set).
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(self.model, full_prompt, kind=kind)  # Hash of call kind, model, prompt
+        if bypass_cache:
+            return key, None
+        try:
+            return key, self.cache.get(key)
+        except Exception as e:  # A broken cache must never fail the summary
+            logger.warning("Could not read LLM response cache: %s", e)
+            return key, None
+
+    def _store(self, key: Optional[str], response: str) -> None:
+        """Caches a valid response under `key` (from `_cached`)."""
+        if key is not None:
+            try:
+                self.cache.put(key, self.model, response)
+            except Exception as e:  # A broken cache must never fail the summary
+                logger.warning("Could not cache LLM response: %s", e)
+
+    def _generate(self, full_prompt: str, bypass_cache: bool = False) -> Optional[str]:
+        """
+        Returns the model's stripped response to `full_prompt`, from the cache when possible.
+
+        Returns None if the model returned no text; errors of the LLM call propagate.
+        """
+        key, cached = self._cached("generate", full_prompt, bypass_cache)
+        if cached is not None:
+            return cached  # Identical prompt answered before
+        response = ollama.generate(
+            model=self.model, prompt=full_prompt
+        )  # Generate summary using the LLM
+        result = response.get("response")
+        if not isinstance(result, str):
+            return None
+        self._store(key, result.strip())
+        return result.strip()
+
+    def _fallback_summary(self, full_prompt: str, bypass_cache: bool = False) -> str:
         """
         Attempts to generate a summary using the Ollama chat API as a fallback.
         
@@ -50,49 +102,127 @@ class AISummarizer:
         """
         logger.info("[AI] Attempting fallback approach (chat)")
         try:
+            key, cached = self._cached("chat", full_prompt, bypass_cache)
+            if cached is not None:
+                return cached  # Identical prompt answered before
             response = ollama.chat(
                 model=self.model, messages=[{"role": "user", "content": full_prompt}]
             )  # Use the chat API to get a response
             content = response.get("message", {}).get("content", "")
-            return (
-                content.strip() if isinstance(content, str) else "Fallback failed: Invalid format"
-            )  # Ensure content is valid before returning
+            if not isinstance(content, str):
+                return "Fallback failed: Invalid format"  # Ensure content is valid before returning
+            self._store(key, content.strip())
+            return content.strip()
         except (KeyError, TypeError, RequestException) as e:
             logger.error("[FallbackError] Ollama fallback failed: %s", e, exc_info=True)
             return "Fallback failed: Ollama not available"  # Handle exceptions gracefully
 
-    def summarize_entry(self, entry_text: str, subcategory: Optional[str] = None) -> str:
+    def summarize_entry(
+        self, entry_text: str, subcategory: Optional[str] = None, bypass_cache: bool = False
+    ) -> str:
         """
         Generates a summary for a single text entry using the configured LLM model and an optional subcategory-specific prompt.
         
         Args:
             entry_text: The text to be summarized.
             subcategory: Optional subcategory to select a specialized prompt.
+            bypass_cache: Ask the model even if the response is cached (and refresh the cache).
         
         Returns:
             The generated summary, or a fallback message if summarization fails.
         """
-        prompt: str = self.prompts_by_subcategory.get(
-            subcategory, self.prompts_by_subcategory.get("_default", "Summarize this:")
-        ).strip()  # Select prompt based on subcategory or use default
-        full_prompt: str = f"{prompt}\n\n{entry_text}"  # Combine prompt with entry text
+        full_prompt: str = self._entry_prompt(entry_text, subcategory)  # Prompt + entry text
 
         try:
             logger.debug(
                 "[AI] Single-entry prompt:\n%s", full_prompt
             )  # Log the full prompt for debugging
-            response = ollama.generate(
-                model=self.model, prompt=full_prompt
-            )  # Generate summary using the LLM
-            result: str = response.get("response")
+            result = self._generate(full_prompt, bypass_cache)  # Cached or fresh LLM response
             return (
-                result.strip() if isinstance(result, str) else self._fallback_summary(full_prompt)
+                result if result is not None else self._fallback_summary(full_prompt, bypass_cache)
             )  # Return result or fallback if the response is invalid
         except Exception as e:
             logger.warning("summarize_entry failed: %s", e, exc_info=True)
-            return self._fallback_summary(full_prompt)  # Fallback on error
+            return self._fallback_summary(full_prompt, bypass_cache)  # Fallback on error
+
+    def _entry_prompt(self, entry_text: str, subcategory: Optional[str]) -> str:
+        """Combines the subcategory's prompt (or the default one) with a single entry."""
+        prompt: str = self.prompts_by_subcategory.get(
+            subcategory, self.prompts_by_subcategory.get("_default", "Summarize this:")
+        ).strip()  # Select prompt based on subcategory or use default
+        return f"{prompt}\n\n{entry_text}"  # Combine prompt with entry text
 
-    def summarize_entries_bulk(self, entries: List[str], subcategory: Optional[str] = None) -> str:
+    def _bulk_prompt(self, entries: List[str], subcategory: Optional[str]) -> str:
+        """Combines the subcategory's prompt (or the default one) with a list of entries."""
+        prompt_intro: str = self.prompts_by_subcategory.get(
+            subcategory, self.prompts_by_subcategory.get("_default", "Summarize these points:")
+        ).strip()  # Select prompt based on subcategory or use default
+        combined_text: str = "\n".join(
+            f"- {entry}" for entry in entries
+        )  # Combine entries into a single string
+        return f"{prompt_intro}\n\n{combined_text}"  # Combine prompt with combined entries
+
+    def summarize_entry_stream(
+        self, entry_text: str, subcategory: Optional[str] = None, bypass_cache: bool = False
+    ) -> Iterator[str]:
+        """
+        Streaming variant of `summarize_entry`: yields the response in chunks as the model
+        produces them, so callers can show the answer from the first token on.
+
+        A cached response is yielded as one chunk. If the model fails before its first chunk,
+        the fallback summary is yielded instead. Timings of the call (time to first token,
+        total time, number of chunks, whether it was cached) are kept in `last_stream`.
+
+        Args:
+            entry_text: The text to be summarized.
+            subcategory: Optional subcategory to select a specialized prompt.
+            bypass_cache: Ask the model even if the response is cached (and refresh the cache).
+
+        Yields:
+            Consecutive pieces of the summary.
+        """
+        full_prompt: str = self._entry_prompt(entry_text, subcategory)  # Prompt + entry text
+        started = time.perf_counter()
+        stats: Dict[str, Any] = {"ttft_seconds": None, "total_seconds": None, "chunks": 0}
+        self.last_stream = stats
+
+        def emit(text: str) -> str:
+            if stats["ttft_seconds"] is None:
+                stats["ttft_seconds"] = time.perf_counter() - started
+                logger.info("[AI] First token after %.3fs", stats["ttft_seconds"])
+            stats["chunks"] += 1
+            return text
+
+        key, cached = self._cached("generate", full_prompt, bypass_cache)
+        stats["cached"] = cached is not None
+        if cached is not None:
+            yield emit(cached)  # Identical prompt answered before
+        else:
+            parts: List[str] = []
+            try:
+                response = ollama.generate(model=self.model, prompt=full_prompt, stream=True)
+                if isinstance(response, Mapping):  # Server or client without streaming
+                    response = [response]
+                for chunk in response:
+                    text = chunk.get("response") or ""
+                    if not parts and not text.strip():
+                        continue  # Skip leading whitespace, as summarize_entry strips it
+                    parts.append(text.lstrip() if not parts else text)
+                    yield emit(parts[-1])
+            except Exception as e:
+                logger.warning("summarize_entry_stream failed: %s", e, exc_info=True)
+                if not parts:
+                    yield emit(self._fallback_summary(full_prompt, bypass_cache))  # Fallback
+            else:
+                if parts:
+                    self._store(key, "".join(parts).strip())
+                else:
+                    yield emit(self._fallback_summary(full_prompt, bypass_cache))  # No text
+        stats["total_seconds"] = time.perf_counter() - started
+
+    def summarize_entries_bulk(
+        self, entries: List[str], subcategory: Optional[str] = None, bypass_cache: bool = False
+    ) -> str:
         """
         Generates a summary for multiple text entries using the configured LLM model and subcategory-specific prompts.
         
@@ -101,6 +231,7 @@ class AISummarizer:
         Args:
             entries: List of text entries to summarize.
             subcategory: Optional subcategory to select a specific summarization prompt.
+            bypass_cache: Ask the model even if the response is cached (and refresh the cache).
         
         Returns:
             The generated summary as a string, or a fallback message if summarization is unsuccessful.
@@ -109,24 +240,13 @@ class AISummarizer:
             logger.warning("[EmptyInput] summarize_entries_bulk received empty list")
             return "No entries provided"
 
-        prompt_intro: str = self.prompts_by_subcategory.get(
-            subcategory, self.prompts_by_subcategory.get("_default", "Summarize these points:")
-        ).strip()  # Select prompt based on subcategory or use default
-        combined_text: str = "\n".join(
-            f"- {entry}" for entry in entries
-        )  # Combine entries into a single string
-        full_prompt: str = (
-            f"{prompt_intro}\n\n{combined_text}"  # Combine prompt with combined entries
-        )
+        full_prompt: str = self._bulk_prompt(entries, subcategory)  # Prompt + combined entries
 
         try:
-            response = ollama.generate(
-                model=self.model, prompt=full_prompt
-            )  # Generate summary using the LLM
-            result: str = response.get("response")
+            result = self._generate(full_prompt, bypass_cache)  # Cached or fresh LLM response
             return (
-                result.strip() if isinstance(result, str) else self._fallback_summary(full_prompt)
+                result if result is not None else self._fallback_summary(full_prompt, bypass_cache)
             )  # Return result or fallback if the response is invalid
         except Exception as e:
             logger.warning("summarize_entries_bulk failed: %s", e, exc_info=True)
-            return self._fallback_summary(full_prompt)  # Fallback on error
+            return self._fallback_summary(full_prompt, bypass_cache)  # Fallback on error
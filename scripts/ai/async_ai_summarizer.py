@@ -0,0 +1,233 @@
+"""
+async_ai_summarizer.py
+
+This module provides AsyncAISummarizer, an asyncio-native variant of AISummarizer for callers
+that fan out many LLM requests (module summaries, per-offender recommendations, batch
+summarization).
+
+Core features include:
+- One persistent ``ollama.AsyncClient`` per event loop instead of a new HTTP connection per call.
+- ``summarize_*_async`` coroutines whose network waits overlap, bounded by a concurrency
+  semaphore (``llm_max_concurrency``) and a per-request timeout (``llm_request_timeout_seconds``).
+- Retries with exponential backoff (``llm_max_retries``, ``llm_retry_backoff_seconds``) before
+  falling back to the chat API, so a transient error no longer costs the real answer. When the
+  fallback fails too, the coroutines return None rather than an error text.
+- The prompts and the response cache of AISummarizer; the synchronous methods keep working.
+- ``summarize_entry_many`` / ``summarize_entries_bulk_many`` to run a whole fan-out from
+  synchronous code.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import ollama
+
+from scripts.ai.ai_summarizer import AISummarizer
+from scripts.config.config_loader import get_config_value, load_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF_SECONDS = 0.5
+
+#: Shown in reports in place of a summary whose LLM request failed.
+SUMMARY_UNAVAILABLE = "Summary unavailable: LLM request failed."
+
+#: ``(entry_text, subcategory)`` of one `summarize_entry` call.
+EntryRequest = Tuple[str, Optional[str]]
+#: ``(entries, subcategory)`` of one `summarize_entries_bulk` call.
+BulkRequest = Tuple[List[str], Optional[str]]
+
+
+class AsyncAISummarizer(AISummarizer):
+    """
+    AISummarizer with asyncio coroutines sharing one client, a concurrency limit, timeouts
+    and retries.
+
+    Attributes:
+        max_concurrency (int): Most LLM requests in flight at once.
+        timeout_seconds (float): Time limit of a single request.
+        max_retries (int): Retries of a failed request before the chat fallback.
+        backoff_seconds (float): Wait before the first retry; doubled for every further one.
+    """
+
+    def __init__(self, client_factory: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Initializes the summarizer from configuration.
+
+        Args:
+            client_factory (Optional[Callable[[], Any]]): Creates the async client of an event
+                loop. Defaults to ``ollama.AsyncClient``.
+        """
+        super().__init__()
+        config: Dict[str, Any] = load_config()
+        self.max_concurrency = max(
+            1, int(get_config_value(config, "llm_max_concurrency", DEFAULT_MAX_CONCURRENCY))
+        )
+        self.timeout_seconds = float(
+            get_config_value(config, "llm_request_timeout_seconds", DEFAULT_TIMEOUT_SECONDS)
+        )
+        self.max_retries = max(
+            0, int(get_config_value(config, "llm_max_retries", DEFAULT_MAX_RETRIES))
+        )
+        self.backoff_seconds = float(
+            get_config_value(config, "llm_retry_backoff_seconds", DEFAULT_BACKOFF_SECONDS)
+        )
+        self._client_factory = client_factory or ollama.AsyncClient
+        self._client: Any = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # Client and limits
+    # ------------------------------------------------------------------
+    def _bind(self) -> Tuple[Any, asyncio.Semaphore]:
+        """Returns the client and semaphore of the running loop, creating them on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._client = self._client_factory()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    async def aclose(self) -> None:
+        """Closes the client of the running loop; the next call opens a new one."""
+        client, self._client, self._loop = self._client, None, None
+        inner = getattr(client, "_client", None)  # The client's httpx session
+        if inner is not None and hasattr(inner, "aclose"):
+            await inner.aclose()
+
+    async def _request(self, call: Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Runs `call(client)` within the concurrency limit and timeout, retrying failures with
+        exponential backoff. The last error propagates once the retries are used up.
+        """
+        client, semaphore = self._bind()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with semaphore:
+                    return await asyncio.wait_for(call(client), self.timeout_seconds)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_seconds * 2**attempt
+                logger.warning(
+                    "LLM request failed (%s); retry %d/%d in %.1fs",
+                    e,
+                    attempt + 1,
+                    self.max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    # ------------------------------------------------------------------
+    # Coroutines
+    # ------------------------------------------------------------------
+    async def _complete(self, full_prompt: str, bypass_cache: bool) -> Optional[str]:
+        key, cached = self._cached("generate", full_prompt, bypass_cache)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._request(
+                lambda client: client.generate(model=self.model, prompt=full_prompt)
+            )
+            result = response.get("response")
+        except Exception as e:
+            logger.warning("Async LLM request failed after retries: %s", e, exc_info=True)
+            result = None
+        if isinstance(result, str):
+            self._store(key, result.strip())
+            return result.strip()
+        return await self._fallback_summary_async(full_prompt, bypass_cache)
+
+    async def _fallback_summary_async(
+        self, full_prompt: str, bypass_cache: bool = False
+    ) -> Optional[str]:
+        """
+        Async counterpart of `_fallback_summary`, using the chat API of the shared client.
+        Returns None if the chat call fails too.
+        """
+        logger.info("[AI] Attempting fallback approach (chat)")
+        key, cached = self._cached("chat", full_prompt, bypass_cache)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._request(
+                lambda client: client.chat(
+                    model=self.model, messages=[{"role": "user", "content": full_prompt}]
+                )
+            )
+            content = response.get("message", {}).get("content", "")
+        except Exception as e:
+            logger.error("[FallbackError] Ollama fallback failed: %s", e, exc_info=True)
+            return None
+        if not isinstance(content, str):
+            logger.error("[FallbackError] Invalid chat response format: %r", content)
+            return None
+        self._store(key, content.strip())
+        return content.strip()
+
+    async def summarize_entry_async(
+        self, entry_text: str, subcategory: Optional[str] = None, bypass_cache: bool = False
+    ) -> Optional[str]:
+        """Coroutine version of `summarize_entry`; returns None if the LLM call failed."""
+        return await self._complete(self._entry_prompt(entry_text, subcategory), bypass_cache)
+
+    async def summarize_entries_bulk_async(
+        self, entries: List[str], subcategory: Optional[str] = None, bypass_cache: bool = False
+    ) -> Optional[str]:
+        """Coroutine version of `summarize_entries_bulk`; returns None if the LLM call failed."""
+        if not entries:
+            logger.warning("[EmptyInput] summarize_entries_bulk_async received empty list")
+            return "No entries provided"
+        return await self._complete(self._bulk_prompt(entries, subcategory), bypass_cache)
+
+    # ------------------------------------------------------------------
+    # Synchronous fan-out
+    # ------------------------------------------------------------------
+    def _run_all(self, coroutines: List[Awaitable[Optional[str]]]) -> List[Optional[str]]:
+        async def run() -> List[Optional[str]]:
+            try:
+                return list(await asyncio.gather(*coroutines))
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    def summarize_entry_many(self, requests: Sequence[EntryRequest]) -> List[Optional[str]]:
+        """
+        Runs `summarize_entry` for every ``(entry_text, subcategory)`` request concurrently.
+
+        Must be called without a running event loop; inside one, await
+        `summarize_entry_async` directly.
+
+        Returns:
+            List[Optional[str]]: One summary per request, in order; None where it failed.
+        """
+        return self._run_all([self.summarize_entry_async(text, sub) for text, sub in requests])
+
+    def summarize_entries_bulk_many(self, requests: Sequence[BulkRequest]) -> List[Optional[str]]:
+        """
+        Runs `summarize_entries_bulk` for every ``(entries, subcategory)`` request
+        concurrently; see `summarize_entry_many`.
+        """
+        return self._run_all(
+            [self.summarize_entries_bulk_async(entries, sub) for entries, sub in requests]
+        )
+
+
+def summarize_entry_many(summarizer: Any, requests: Sequence[EntryRequest]) -> List[Optional[str]]:
+    """
+    Summarizes ``(entry_text, subcategory)`` requests, concurrently when `summarizer` is an
+    AsyncAISummarizer and one after another otherwise.
+
+    Returns:
+        List[Optional[str]]: One summary per request, in order; None where an async request
+        failed.
+    """
+    if isinstance(summarizer, AsyncAISummarizer):
+        return summarizer.summarize_entry_many(requests)
+    return [summarizer.summarize_entry(text, subcategory=sub) for text, sub in requests]
@@ -0,0 +1,234 @@
+"""
+llm_cache.py
+
+This module defines LLMResponseCache, a persistent cache of LLM responses shared by everything
+that prompts the model through AISummarizer.
+
+Core features include:
+- Keying responses by the SHA-256 of (call kind, model, full prompt, generation options), so
+  re-running an audit or summary over unchanged input makes no LLM calls.
+- Persisting entries in a small SQLite file, so separate CLI runs and the GUI share one cache
+  and every stored response survives the process.
+- Expiring entries after a TTL, and least-recently-used eviction once the configured number
+  of entries or total response size is exceeded. Recency is recorded at most once per
+  `touch_seconds` per entry, so repeated hits stay read-only.
+- Hit, miss, store and eviction counters for monitoring.
+- A process-wide registry so all AISummarizer instances share one connection per file.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from scripts.config.config_loader import get_absolute_path, get_config_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "cache/llm_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_MB = 256
+DEFAULT_TOUCH_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+"""
+
+
+class LLMResponseCache:
+    """
+    Persistent mapping of a prompt key to the model's response text.
+
+    Attributes:
+        path (Path): Location of the SQLite cache file.
+        ttl_seconds (float): Age after which a response is discarded; 0 keeps responses forever.
+        max_entries (int): Maximum number of responses kept before LRU eviction.
+        max_bytes (int): Maximum total size of the kept responses before LRU eviction.
+        touch_seconds (float): Minimum age of an entry's ``last_used`` before a hit rewrites it.
+        stats (Dict[str, int]): ``hits``, ``misses``, ``stores`` and ``evictions`` counters.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        touch_seconds: float = DEFAULT_TOUCH_SECONDS,
+    ) -> None:
+        """
+        Opens (and if needed creates) the cache file.
+
+        Args:
+            path (Path): Location of the SQLite cache file.
+            ttl_seconds (float, optional): Age after which responses expire. Defaults to 30 days.
+            max_entries (int, optional): Maximum number of responses. Defaults to 10 000.
+            max_bytes (int, optional): Maximum total response size. Defaults to 256 MB.
+            touch_seconds (float, optional): How stale ``last_used`` must be before a hit
+                updates it. Defaults to 60 seconds.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.touch_seconds = max(0.0, float(touch_seconds))
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def key(
+        model: str, prompt: str, options: Optional[Mapping[str, Any]] = None, kind: str = "generate"
+    ) -> str:
+        """Returns the cache key of a call: a hash of its kind, model, prompt and options."""
+        payload = json.dumps(
+            [kind, model, prompt, dict(options or {})], sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached response for `key`, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created, last_used FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats["evictions"] += 1
+                row = None
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            if now - row[2] >= self.touch_seconds:
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            self.stats["hits"] += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Stores `response` under `key`, evicting old responses to stay within the limits."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now),
+            )
+            self.stats["stores"] += 1
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,)
+            )
+            self.stats["evictions"] += cursor.rowcount
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        for key, entry_size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            size -= entry_size
+            self.stats["evictions"] += 1
+
+    def info(self) -> Dict[str, int]:
+        """Returns the counters plus the number of cached ``entries`` and their ``bytes``."""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {**self.stats, "entries": count, "bytes": size}
+
+    def clear(self) -> None:
+        """Drops every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_registry: Dict[str, LLMResponseCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_llm_cache(path: Path, **limits: Any) -> LLMResponseCache:
+    """
+    Returns the process-wide cache for `path`, creating it on first use.
+
+    Args:
+        path (Path): Location of the SQLite cache file.
+        **limits: ``ttl_seconds``, ``max_entries`` and ``max_bytes``, as for LLMResponseCache;
+            applied to an existing instance as well.
+
+    Returns:
+        LLMResponseCache: The shared cache instance.
+    """
+    key = str(Path(path).resolve())
+    with _registry_lock:
+        cache = _registry.get(key)
+        if cache is None:
+            cache = LLMResponseCache(path, **limits)
+            _registry[key] = cache
+        else:
+            for name, value in limits.items():
+                setattr(cache, name, value)
+        return cache
+
+
+def cache_from_config(config: Dict[str, Any]) -> Optional[LLMResponseCache]:
+    """
+    Returns the shared cache configured by ``llm_cache_*`` settings, or None when
+    ``llm_cache_enabled`` is false or the cache file cannot be opened.
+    """
+    if not get_config_value(config, "llm_cache_enabled", True):
+        return None
+    path = Path(get_absolute_path(get_config_value(config, "llm_cache_path", DEFAULT_CACHE_PATH)))
+    try:
+        return get_llm_cache(
+            path,
+            ttl_seconds=float(
+                get_config_value(config, "llm_cache_ttl_seconds", DEFAULT_TTL_SECONDS)
+            ),
+            max_entries=int(get_config_value(config, "llm_cache_max_entries", DEFAULT_MAX_ENTRIES)),
+            max_bytes=int(get_config_value(config, "llm_cache_max_mb", DEFAULT_MAX_MB))
+            * 1024
+            * 1024,
+        )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("LLM response cache disabled; cannot open %s: %s", path, e)
+        return None
+
+
+def clear_llm_cache_registry() -> None:
+    """Closes and forgets all shared cache instances (their files are left untouched)."""
+    with _registry_lock:
+        for cache in _registry.values():
+            cache.close()
+        _registry.clear()
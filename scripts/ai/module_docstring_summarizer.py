@@ -9,6 +9,11 @@ from pathlib import Path
 import argparse
 
 from scripts.ai.ai_summarizer import AISummarizer
+from scripts.ai.async_ai_summarizer import (
+    SUMMARY_UNAVAILABLE,
+    AsyncAISummarizer,
+    summarize_entry_many,
+)
 from scripts.config.config_manager import ConfigManager
 from scripts.ai.llm_router import get_prompt_template, apply_persona
 
@@ -30,7 +35,22 @@ def summarize_module(
     """
     if not doc_entries:
         return "No docstrings found."  # Early exit if no docstrings are provided
+    return summarizer.summarize_entry(
+        build_module_prompt(doc_entries, config), subcategory="Module Functionality"
+    )  # Generate and return the summary
 
+
+def build_module_prompt(doc_entries: list, config: ConfigManager) -> str:
+    """
+    Builds the summarization prompt for a module from its docstring entries.
+
+    Args:
+        doc_entries: List of docstring entries, each representing a function or class.
+        config: Configuration providing the prompt template and persona.
+
+    Returns:
+        The persona-adjusted prompt listing each entry's name and description.
+    """
     summaries = []
     for entry in doc_entries:
         name = entry.get("name", "unknown")  # Get the name of the function or class
@@ -41,12 +61,7 @@ def summarize_module(
         "Module Functionality", config
     )  # Get the prompt template for the summarization
     full_prompt = f"{prompt}\n\n{joined}"  # Combine prompt with the summary entries
-    final_prompt = apply_persona(
-        full_prompt, config.persona
-    )  # Apply persona adjustments to the prompt
-    return summarizer.summarize_entry(
-        final_prompt, subcategory="Module Functionality"
-    )  # Generate and return the summary
+    return apply_persona(full_prompt, config.persona)  # Apply persona adjustments to the prompt
 
 
 def run(input_path: str, output_path: str | None = None, path_filter: str | None = None) -> None:
@@ -56,8 +71,8 @@ def run(input_path: str, output_path: str | None = None, path_filter: str | None
     Processes each file in the report, optionally filtering by file path substring, and generates a summary of its documented functions using an AI summarizer. Outputs the results either to a Markdown file or to standard output.
     """
     config = ConfigManager.load_config()  # Load configuration settings
-    summarizer = AISummarizer()  # Initialize the summarizer
-    summaries = {}
+    summarizer = AsyncAISummarizer()  # Initialize the summarizer; modules are summarized concurrently
+    prompts = {}
 
     with open(input_path, "r", encoding="utf-8") as f:
         report = json.load(f)  # Load the JSON report data
@@ -68,10 +83,14 @@ def run(input_path: str, output_path: str | None = None, path_filter: str | None
         funcs = data.get("docstrings", {}).get("functions", [])  # Get functions' docstrings
         if not funcs:
             continue  # Skip if no functions have docstrings
-        summary = summarize_module(
-            file_path, funcs, summarizer, config
-        )  # Summarize the module's docstrings
-        summaries[file_path] = summary  # Store the summary for the file
+        prompts[file_path] = build_module_prompt(funcs, config)  # Prompt from the module's docstrings
+
+    results = summarize_entry_many(
+        summarizer, [(prompt, "Module Functionality") for prompt in prompts.values()]
+    )  # Summarize all modules, overlapping the LLM calls
+    summaries = {
+        path: result or SUMMARY_UNAVAILABLE for path, result in zip(prompts, results)
+    }  # Placeholder where a request failed
 
     if output_path:
         out_path = Path(output_path)
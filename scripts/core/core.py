@@ -11,7 +11,10 @@ Key public methods / attributes re-exposed
 -----------------------------------------
 * **save_entry**          – add a new idea to JSON + Markdown & update tracker
 * **log_new_entry**       – alias of *save_entry* (used by integration tests)
+* **save_entry_async**    – queue an entry for the background writer, returns a Future
+* **save_entries_bulk**   – import many entries with one write per target file
 * **generate_global_summary** – force batch summarisation via `SummaryEngine`
+* **force_summary_all**   – summarise every pending batch with concurrent LLM calls
 * **generate_summary**    – backward-compat shim (date arg ignored)
 * **search_summaries** / **search_raw_logs** – thin wrappers around the FAISS
   indexers (gracefully degrade to empty list when indices are disabled in
@@ -27,19 +30,24 @@ swapping our bespoke `_initialize_environment` with the clearer
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Union, List, Dict, Any
+from typing import Union, Iterable, List, Mapping, Dict, Any, Optional, Tuple
 
 from scripts.ai.ai_summarizer import AISummarizer
+from scripts.ai.async_ai_summarizer import AsyncAISummarizer
 from scripts.config.config_loader import get_effective_config, get_config_value
 from scripts.core.environment_bootstrapper import EnvironmentBootstrapper
-from scripts.core.markdown_logger import MarkdownLogger
+from scripts.core.markdown_logger import DEFAULT_ASSEMBLE_INTERVAL, MarkdownLogger
 from scripts.paths import ZephyrusPaths
 from scripts.utils.file_utils import read_json
 from scripts.core.log_manager import LogManager
+from scripts.core.log_storage import DEFAULT_COMPACT_EVERY, create_log_storage
 from scripts.core.summary_tracker import SummaryTracker
-from scripts.core.summary_engine import SummaryEngine
+from scripts.core.summary_engine import DEFAULT_MAX_CONCURRENCY, SummaryEngine
+from scripts.core.write_pipeline import WritePipeline
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +70,7 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
            CORRECTION_TIMESTAMP_KEY (str): Key for correction timestamps.
            CONTENT_KEY (str): Key for content in logs.
            TIMESTAMP_KEY (str): Key for timestamps in logs.
+           SEARCH_MODES (Dict[str, str]): Raw log search modes and the indexer method serving each.
            BATCH_SIZE (int): Number of entries to process in a batch.
            ai_summarizer (AISummarizer): Instance of the AI summarizer.
            log_manager (LogManager): Instance of the log manager.
@@ -85,6 +94,13 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
     CONTENT_KEY = "content"  # Key for content in logs
     TIMESTAMP_KEY = "timestamp"  # Key for timestamps in logs
 
+    # Raw log search modes → RawLogIndexer method
+    SEARCH_MODES = {
+        "hybrid": "hybrid_search",  # Reciprocal rank fusion of vector + BM25
+        "lexical": "lexical_search",  # BM25 only; no embedding model needed
+        "vector": "search",  # FAISS only
+    }
+
     # ------------------------------------------------------------------
     # 🚀 Construction
     # ------------------------------------------------------------------
@@ -105,13 +121,20 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
         self.paths = ZephyrusPaths.from_config(self.script_dir)  # Resolve required paths
 
         # 1) Ensure on-disk environment exists (dirs / baseline files)
-        EnvironmentBootstrapper(self.paths).bootstrap()  # Bootstrap environment
+        log_backend = get_config_value(self.config, "log_storage_backend", "json")
+        EnvironmentBootstrapper(
+            self.paths, create_json_log=log_backend in ("json", "journal")
+        ).bootstrap()  # Bootstrap environment; sharded/SQLite logs need no JSON log file
 
         # 2) Core runtime collaborators
         self.BATCH_SIZE: int = max(
             1, int(get_config_value(self.config, "batch_size", 5))
         )  # Get batch size from config
-        self.ai_summarizer = AISummarizer()  # Instantiate AI summarizer
+        self.ai_summarizer = (
+            AsyncAISummarizer()
+            if get_config_value(self.config, "llm_async_client", False)
+            else AISummarizer()
+        )  # Instantiate AI summarizer; the async one shares a client and overlaps batch calls
         self.log_manager = LogManager(
             self.paths.json_log_file,
             self.paths.txt_log_file,
@@ -119,9 +142,29 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
             self.TIMESTAMP_FORMAT,
             self.CONTENT_KEY,
             self.TIMESTAMP_KEY,
+            storage=create_log_storage(
+                log_backend,
+                self.paths.json_log_file,
+                compact_every=int(
+                    get_config_value(
+                        self.config, "log_journal_compact_every", DEFAULT_COMPACT_EVERY
+                    )
+                ),
+                db_path=self.paths.sqlite_db_file,
+            ),  # Raw log backend: rewritten JSON, append-only journal or SQLite
         )  # Instantiate log manager
-        self.md_logger = MarkdownLogger(self.paths.export_dir)  # Instantiate markdown logger
-        self.summary_tracker = SummaryTracker(paths=self.paths)  # Instantiate summary tracker
+        self.md_logger = MarkdownLogger(
+            self.paths.export_dir,
+            mode=get_config_value(self.config, "markdown_export_mode", "rewrite"),
+            assemble_interval=float(
+                get_config_value(
+                    self.config, "markdown_assemble_interval_seconds", DEFAULT_ASSEMBLE_INTERVAL
+                )
+            ),  # Sections mode: delay of the document assembly after a write burst
+        )  # Instantiate markdown logger: rewrite per entry, or append per-day sections
+        self.summary_tracker = SummaryTracker(
+            paths=self.paths, log_manager=self.log_manager
+        )  # Instantiate summary tracker
         self.summary_engine = SummaryEngine(
             self.ai_summarizer,
             self.log_manager,
@@ -130,7 +173,12 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
             self.CONTENT_KEY,
             self.TIMESTAMP_KEY,
             self.BATCH_SIZE,
+            max_concurrency=int(
+                get_config_value(self.config, "summary_max_concurrency", DEFAULT_MAX_CONCURRENCY)
+            ),  # Concurrent LLM calls of summarize_all
         )  # Instantiate summary engine
+        self._write_pipeline: Optional[WritePipeline] = None  # Started by save_entry_async
+        self._write_pipeline_lock = threading.Lock()  # Guards lazy pipeline start-up
 
         # 3) Validate / rebuild tracker once on start-up
         if (
@@ -138,7 +186,9 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
             or not self.summary_tracker.validate()
         ):
             logger.warning("[INIT] Rebuilding summary tracker from scratch …")
-            self.summary_tracker.rebuild()  # Rebuild summary tracker
+            self.summary_tracker.rebuild(
+                refresh_indexes=False
+            )  # Rebuild tracker counts; indexes catch up on first search
             if not self.summary_tracker.validate():
                 raise RuntimeError(
                     "SummaryTracker rebuild failed validation – data is inconsistent."
@@ -151,7 +201,7 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
         """
         Saves a new log entry to both the JSON log and Markdown export.
         
-        Adds the entry under the specified main category and subcategory, updates the summary tracker, and returns whether the Markdown export succeeded.
+        Adds the entry under the specified main category and subcategory, updates the summary tracker, extends the raw log index if it is open, and returns whether the Markdown export succeeded.
         
         Args:
             main_category: The primary category for the log entry.
@@ -162,23 +212,174 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
             True if the entry was successfully exported to Markdown; False otherwise.
         """
         date_str = datetime.now().strftime(self.DATE_FORMAT)  # Get current date string
+        if self._write_pipeline is not None:  # Queue behind pending async saves to keep order
+            try:
+                future = self._write_pipeline.submit((date_str, main_category, subcategory, entry))
+                return bool(future.result())  # Wait for the background writer
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Failed to save entry: %s", exc, exc_info=True)  # Log error
+                return False  # Return failure
+        return self._commit_entries([(date_str, main_category, subcategory, entry)])[0]
+
+    # alias used by integration tests
+    log_new_entry = save_entry  # Alias for save_entry
+
+    def save_entry_async(self, main_category: str, subcategory: str, entry: str) -> "Future[bool]":
+        """
+        Queues a new log entry for the background writer and returns immediately.
+
+        Bursts of queued entries are written together: one log write, one write per
+        Markdown document and one tracker write. Entries are written in submission order,
+        and the Future resolves once its entry is on disk.
+
+        Args:
+            main_category: The primary category for the log entry.
+            subcategory: The subcategory for the log entry.
+            entry: The content of the log entry.
+
+        Returns:
+            Future resolving to True if the entry was exported to Markdown, as `save_entry`.
+        """
+        date_str = datetime.now().strftime(self.DATE_FORMAT)  # Date of submission, not of the write
+        return self._get_write_pipeline().submit((date_str, main_category, subcategory, entry))
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every entry queued by `save_entry_async` so far has been written.
+
+        Args:
+            timeout: Seconds to wait at most; None waits indefinitely.
+
+        Returns:
+            False if the timeout expired first, True otherwise.
+        """
+        if self._write_pipeline is None:  # Nothing was ever queued
+            return True
+        return self._write_pipeline.flush(timeout)
+
+    def _get_write_pipeline(self) -> WritePipeline:
+        """Starts the background writer on first use; it flushes itself at interpreter exit."""
+        with self._write_pipeline_lock:
+            if self._write_pipeline is None:
+                self._write_pipeline = WritePipeline(
+                    self._commit_entries,
+                    max_batch=int(get_config_value(self.config, "write_pipeline_max_batch", 500)),
+                    linger_seconds=float(
+                        get_config_value(self.config, "write_pipeline_linger_ms", 5)
+                    )
+                    / 1000.0,
+                    name="zephyrus-save-entry",
+                )  # Single worker keeps writes in submission order
+        return self._write_pipeline
+
+    def _commit_entries(self, items: List[Tuple[str, str, str, str]]) -> List[bool]:
+        """
+        Writes a batch of ``(date_str, main_category, subcategory, entry)`` items.
+
+        The log is written once, each Markdown document once and the tracker once; an open
+        raw log index is then extended with the new records.
+
+        Returns:
+            One Markdown-export success flag per item; all False if the entries were not saved.
+        """
         try:
-            self.log_manager.append_entry(
-                date_str, main_category, subcategory, entry
-            )  # Append entry to log
-            md_ok = self.md_logger.log(
-                date_str, main_category, subcategory, entry
-            )  # Log to markdown
-            self.summary_tracker.update(
-                main_category, subcategory, new_entries=1
-            )  # Update summary tracker
-            return md_ok  # Return markdown export success
+            with self.log_manager.transaction():  # Entries and their tracker counts commit together
+                records = [
+                    (*item[:3], record)
+                    for item, record in zip(items, self.log_manager.append_entries(items))
+                ]  # One storage write for the batch
+                self._track_new_records(records)  # One tracker write for the batch
+            md_ok = self._publish_records(records)  # Markdown and index follow the log
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("Failed to save entry: %s", exc, exc_info=True)  # Log error
-            return False  # Return failure
+            return [False] * len(items)  # Return failure
+        return [md_ok] * len(items)  # Return markdown export success
 
-    # alias used by integration tests
-    log_new_entry = save_entry  # Alias for save_entry
+    def save_entries_bulk(self, entries: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+        """
+        Imports many entries (e.g. from another tool) as one group commit.
+
+        The entries are validated and grouped by date in memory, then the log, each Markdown
+        document and the tracker are written once, and an open raw log index is extended with
+        the new records in one incremental update. See `LogManager.save_entries_bulk` for the
+        accepted entry fields.
+
+        Args:
+            entries: Mappings with ``main_category``, ``subcategory``, content and optional
+                timestamp/date, such as rows from `scripts.utils.file_io.iter_records`.
+
+        Returns:
+            Dict with the number of ``entries`` imported and whether the ``markdown`` export
+            succeeded.
+
+        Raises:
+            ValueError: If an entry is invalid; nothing is imported then.
+        """
+        self.flush_writes()  # Keep imports ordered after queued saves
+        with self.log_manager.transaction():  # Entries and their tracker counts commit together
+            records = self.log_manager.save_entries_bulk(entries)  # One storage write
+            self._track_new_records(records)  # One tracker write for the import
+        md_ok = self._publish_records(records) if records else True  # Markdown and index
+        return {"entries": len(records), "markdown": md_ok}
+
+    def _track_new_records(self, records: List[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """Adds records just appended to the log to the tracker counts, in one tracker write."""
+        new_counts: Dict[Tuple[str, str], int] = {}  # New entries per (main, sub)
+        for _, main_category, subcategory, _ in records:
+            key = (main_category, subcategory)
+            new_counts[key] = new_counts.get(key, 0) + 1
+        with self.summary_tracker.deferred_writes():  # One tracker write for the batch
+            for (main_category, subcategory), count in new_counts.items():
+                self.summary_tracker.update(main_category, subcategory, new_entries=count)
+
+    def _publish_records(self, records: List[Tuple[str, str, str, Dict[str, Any]]]) -> bool:
+        """
+        Brings the Markdown exports and raw log index up to date with records just appended
+        to the log, writing each of them once.
+
+        Returns:
+            True if the Markdown export succeeded.
+        """
+        md_ok = self.md_logger.log_many(
+            (*record[:3], record[3][self.CONTENT_KEY]) for record in records
+        )  # One write per Markdown document
+        groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}  # Records per index key
+        for date_str, main_category, subcategory, record in records:
+            groups.setdefault((date_str, main_category, subcategory), []).append(record)
+        self._index_new_entries([(*key, group) for key, group in groups.items()])
+        return md_ok
+
+    def _index_new_entries(self, groups: List[Tuple[str, str, str, List[Dict[str, Any]]]]) -> None:
+        """
+        Appends freshly logged ``(date_str, main_category, subcategory, records)`` groups to
+        the raw log index when it is already open; the index files are written later, in
+        one save for many entries.
+
+        A closed index is left alone, so saving never loads the embedding model or the
+        index; its high-water mark lags and the next search or `update_index` catches it up.
+        Indexing failures are logged and never fail the save itself.
+        """
+        indexer = getattr(self.summary_tracker, "open_raw_indexer", None)  # Only an open index
+        if not indexer or not hasattr(indexer, "append_entries_many"):
+            return
+        try:
+            indexer.append_entries_many(groups)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Incremental raw index update failed: %s", exc, exc_info=True)
+
+    def export_markdown(self) -> Dict[str, int]:
+        """
+        Regenerates all Markdown exports from the raw log in one streaming pass.
+
+        The log is read shard by shard (see `LogManager.iter_log_shards`) and every category
+        document is written once.
+
+        Returns:
+            Dict[str, int]: Number of ``documents`` and ``entries`` written.
+        """
+        return self.md_logger.export_all(
+            self.log_manager.iter_log_shards(), content_key=self.CONTENT_KEY
+        )  # Stream the log into the Markdown documents
 
     # ------------------------------------------------------------------
     # 🧠  Summarisation API
@@ -198,6 +399,20 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
             main_category, subcategory
         )  # Summarize using summary engine
 
+    def force_summary_all(self, max_concurrency: Optional[int] = None) -> Dict[str, int]:
+        """
+        Summarizes every pending batch of every subcategory, running the LLM calls concurrently.
+
+        The summaries and tracker counts are written once, after all calls finished.
+
+        Args:
+            max_concurrency: Concurrent LLM calls; defaults to ``summary_max_concurrency``.
+
+        Returns:
+            Number of batches ``summarized`` and of pending batches that ``failed``.
+        """
+        return self.summary_engine.summarize_all(max_concurrency)  # Drain the backlog
+
     # backwards-compat shim for unit-tests that still pass a *date* arg
     def generate_summary(self, _date_str: str, main_category: str, subcategory: str) -> bool:
         """
@@ -220,7 +435,14 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
     # ------------------------------------------------------------------
     # 🔍  Search helpers (gracefully degrade when FAISS indexers are stubbed)
     # ------------------------------------------------------------------
-    def _safe_search(self, indexer_attr: str, query: str, top_k: int) -> List[Any]:
+    def _safe_search(
+        self,
+        indexer_attr: str,
+        query: str,
+        top_k: int,
+        method: str = "search",
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
         """
         Safely performs a search on a specified FAISS indexer attribute of the summary tracker.
         
@@ -230,45 +452,163 @@ class ZephyrusLoggerCore:  # pylint: disable=too-many-instance-attributes
             indexer_attr: Name of the summary tracker attribute representing the FAISS indexer.
             query: The search query string.
             top_k: Maximum number of results to return.
+            method: Name of the indexer's search method to call. Defaults to "search".
+            filters: Optional metadata filters (main_category, subcategory, date_from, date_to).
         
         Returns:
             A list of search results, or an empty list if the search fails.
         """
         indexer = getattr(self.summary_tracker, indexer_attr, None)  # Get indexer attribute
-        if indexer and hasattr(indexer, "search"):  # Check if indexer has search method
+        if indexer and hasattr(indexer, method):  # Check if indexer has the search method
+            kwargs = {"filters": filters} if filters else {}  # Only pass filters when given
             try:
-                return indexer.search(query, top_k=top_k)  # type: ignore[attr-defined]  # Perform search
+                return getattr(indexer, method)(query, top_k=top_k, **kwargs)  # Perform search
             except Exception as exc:  # pragma: no cover
                 logger.error(
                     "Search via %s failed: %s", indexer_attr, exc, exc_info=True
                 )  # Log error
         return []  # Return empty list if search fails
 
-    def search_summaries(self, query: str, top_k: int = 5) -> List[Any]:
+    def _safe_search_many(
+        self,
+        indexer_attr: str,
+        queries: List[str],
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Any]]:
+        """
+        Safely performs a batched search on a specified FAISS indexer attribute of the summary tracker.
+        
+        If the indexer or its search_many method is unavailable, or if an exception occurs during search, returns one empty list per query.
+        
+        Args:
+            indexer_attr: Name of the summary tracker attribute representing the FAISS indexer.
+            queries: The search query strings.
+            top_k: Maximum number of results to return per query.
+            filters: Optional metadata filters applied to every query.
+        
+        Returns:
+            A list of result lists, one per query, in input order.
+        """
+        queries = list(queries)
+        indexer = getattr(self.summary_tracker, indexer_attr, None)  # Get indexer attribute
+        if indexer and hasattr(indexer, "search_many"):  # Check if indexer supports batched search
+            kwargs = {"filters": filters} if filters else {}  # Only pass filters when given
+            try:
+                return indexer.search_many(queries, top_k=top_k, **kwargs)  # type: ignore[attr-defined]  # Perform batched search
+            except Exception as exc:  # pragma: no cover
+                logger.error(
+                    "Batched search via %s failed: %s", indexer_attr, exc, exc_info=True
+                )  # Log error
+        return [[] for _ in queries]  # One empty result list per query
+
+    def search_summaries(
+        self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
         """
         Searches summary entries for the most relevant matches to a query using vector similarity.
         
         Args:
         	query: The search query string.
         	top_k: Maximum number of results to return.
+        	filters: Optional metadata filters: main_category / subcategory (a value or a list of values)
+        		and inclusive date_from / date_to ("YYYY-MM-DD"). Applied inside the index search.
         
         Returns:
         	A list of the top-k most relevant summary search results, or an empty list if search fails.
         """
-        return self._safe_search("summary_indexer", query, top_k)  # Search summaries
+        return self._safe_search(
+            "summary_indexer", query, top_k, filters=filters
+        )  # Search summaries
 
-    def search_raw_logs(self, query: str, top_k: int = 5) -> List[Any]:
+    def search_raw_logs(
+        self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
         """
         Searches raw log entries for the most relevant matches to a query using vector similarity.
         
         Args:
         	query: The search query string.
         	top_k: Maximum number of results to return.
+        	filters: Optional metadata filters: main_category / subcategory (a value or a list of values)
+        		and inclusive date_from / date_to ("YYYY-MM-DD"). Applied inside the index search.
         
         Returns:
         	A list of the top-k most relevant raw log entries matching the query.
         """
-        return self._safe_search("raw_indexer", query, top_k)  # Search raw logs
+        return self._safe_search(
+            "raw_indexer", query, top_k, filters=filters
+        )  # Search raw logs
+
+    def search_raw_logs_hybrid(
+        self,
+        query: str,
+        top_k: int = 5,
+        mode: str = "hybrid",
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """
+        Searches raw log entries by keywords, by vector similarity, or by both.
+        
+        "lexical" ranks entries with a BM25 inverted index and never loads the embedding model,
+        "vector" is the same as `search_raw_logs`, and "hybrid" fuses both rankings with
+        reciprocal rank fusion so exact identifiers and semantically related ideas both surface.
+        
+        Args:
+        	query: The search query string.
+        	top_k: Maximum number of results to return.
+        	mode: One of "hybrid", "lexical" or "vector". Defaults to "hybrid".
+        	filters: Optional metadata filters: main_category / subcategory (a value or a list of values)
+        		and inclusive date_from / date_to ("YYYY-MM-DD"). Applied inside the index search.
+        
+        Returns:
+        	A list of the top-k raw log entries, or an empty list if the mode is unknown or search fails.
+        """
+        method = self.SEARCH_MODES.get(mode)  # Resolve indexer method for the mode
+        if method is None:
+            logger.error("Unknown search mode %r; expected one of %s", mode, list(self.SEARCH_MODES))
+            return []
+        return self._safe_search(
+            "raw_indexer", query, top_k, method=method, filters=filters
+        )  # Search raw logs
+
+    def search_summaries_many(
+        self, queries: List[str], top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Any]]:
+        """
+        Searches summary entries for several queries with one batched embedding call and one FAISS search.
+        
+        Args:
+        	queries: The search query strings.
+        	top_k: Maximum number of results to return per query.
+        	filters: Optional metadata filters: main_category / subcategory (a value or a list of values)
+        		and inclusive date_from / date_to ("YYYY-MM-DD"). Applied inside the index search.
+        
+        Returns:
+        	One list of the top-k summary search results per query, in input order.
+        """
+        return self._safe_search_many(
+            "summary_indexer", queries, top_k, filters=filters
+        )  # Batched summary search
+
+    def search_raw_logs_many(
+        self, queries: List[str], top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Any]]:
+        """
+        Searches raw log entries for several queries with one batched embedding call and one FAISS search.
+        
+        Args:
+        	queries: The search query strings.
+        	top_k: Maximum number of results to return per query.
+        	filters: Optional metadata filters: main_category / subcategory (a value or a list of values)
+        		and inclusive date_from / date_to ("YYYY-MM-DD"). Applied inside the index search.
+        
+        Returns:
+        	One list of the top-k raw log entries per query, in input order.
+        """
+        return self._safe_search_many(
+            "raw_indexer", queries, top_k, filters=filters
+        )  # Batched raw log search
 
     # ------------------------------------------------------------------
     # 🛠  Internal helpers (only the bare minimum kept public for tests)
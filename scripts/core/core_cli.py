@@ -5,8 +5,13 @@ This module provides a command-line interface for the Zephyrus Logger applicatio
 allowing users to log entries, summarize categories, and search through logs.
 """
 
+from pathlib import Path
+from typing import Optional
+
 import typer
 from scripts.core.core import ZephyrusLoggerCore
+from scripts.core.sqlite_store import SQLiteStore
+from scripts.utils.file_io import iter_records
 
 app = typer.Typer()
 core = ZephyrusLoggerCore(".")
@@ -47,8 +52,31 @@ def summarize(main: str, sub: str) -> None:
         typer.echo("⚠️  Not enough entries or summarization failed.")
 
 
+@app.command("summarize-all")
+def summarize_all(concurrency: Optional[int] = None) -> None:
+    """
+    Summarizes every pending batch of every subcategory with concurrent LLM calls.
+
+    Args:
+        concurrency: Number of LLM calls at once; defaults to summary_max_concurrency.
+    """
+    counts = core.force_summary_all(concurrency)
+    typer.echo(f"🧠 Summarized {counts['summarized']} batches.")
+    if counts["failed"]:
+        typer.echo(f"⚠️  {counts['failed']} batches are still pending.")
+
+
 @app.command()
-def search(query: str, top_k: int = 5, kind: str = "summary") -> None:
+def search(
+    query: str,
+    top_k: int = 5,
+    kind: str = "summary",
+    mode: str = "vector",
+    main_category: Optional[str] = None,
+    subcategory: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> None:
     """
     Searches summaries or raw logs and displays the top results.
     
@@ -56,15 +84,93 @@ def search(query: str, top_k: int = 5, kind: str = "summary") -> None:
         query: The search query string.
         top_k: Maximum number of results to display.
         kind: Specifies whether to search 'summary' or 'raw' logs. Defaults to 'summary'.
+        mode: Raw log search mode: 'vector', 'lexical' or 'hybrid'. Defaults to 'vector'.
+        main_category: Only return entries of this main category.
+        subcategory: Only return entries of this subcategory.
+        date_from: Only return entries dated on or after this day (YYYY-MM-DD).
+        date_to: Only return entries dated on or before this day (YYYY-MM-DD).
     """
+    filters = {
+        key: value
+        for key, value in (
+            ("main_category", main_category),
+            ("subcategory", subcategory),
+            ("date_from", date_from),
+            ("date_to", date_to),
+        )
+        if value is not None
+    }
     results = (
-        core.search_summaries(query, top_k)
+        core.search_summaries(query, top_k, filters=filters)
         if kind == "summary"
-        else core.search_raw_logs(query, top_k)
+        else core.search_raw_logs_hybrid(query, top_k, mode=mode, filters=filters)
     )
     for i, res in enumerate(results):
         typer.echo(f"{i+1}. {res}")
 
 
+@app.command("migrate-sqlite")
+def migrate_sqlite(force: bool = False) -> None:
+    """
+    Copies the log, correction summaries and tracker into the SQLite database.
+
+    They are read through the configured storage backend (JSON, journal or shards), so the
+    migration covers whatever that backend holds. Set "log_storage_backend": "sqlite" in
+    config afterwards to switch over.
+
+    Args:
+        force: Replace the database contents if it already holds data.
+    """
+    core.flush_writes()
+    core.summary_tracker.flush()
+    store = SQLiteStore(core.paths.sqlite_db_file)
+    try:
+        counts = store.migrate(
+            core.log_manager.read_logs(),
+            core.log_manager.read_correction_summaries(),
+            core.summary_tracker.snapshot(),
+            force=force,
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+    typer.echo(
+        f"✅ Migrated {counts['entries']} entries, {counts['summaries']} summaries and "
+        f"{counts['tracker']} tracker rows into {store.db_path}."
+    )
+
+
+@app.command("export-markdown")
+def export_markdown() -> None:
+    """
+    Regenerates all Markdown exports from the log in one streaming pass.
+    """
+    counts = core.export_markdown()
+    typer.echo(
+        f"✅ Exported {counts['entries']} entries into {counts['documents']} Markdown documents."
+    )
+
+
+@app.command("import-entries")
+def import_entries(path: Path, fmt: Optional[str] = typer.Option(None, "--format")) -> None:
+    """
+    Imports entries from a JSON Lines or CSV file in one group commit.
+
+    Each row needs main_category, subcategory and content; timestamp and date are optional.
+    The file is streamed, and the log, Markdown exports and tracker are written once.
+
+    Args:
+        path: The .jsonl/.csv file to import (optionally .gz/.bz2/.xz compressed).
+        fmt: 'jsonl' or 'csv'; defaults to the file extension.
+    """
+    try:
+        counts = core.save_entries_bulk(iter_records(path, fmt))
+    except (OSError, ValueError) as e:
+        typer.echo(f"❌ Import failed, nothing was saved: {e}")
+        raise typer.Exit(code=1)
+    status = "✅" if counts["markdown"] else "⚠️  Markdown export failed;"
+    typer.echo(f"{status} Imported {counts['entries']} entries from {path}.")
+
+
 if __name__ == "__main__":
     app()
@@ -28,16 +28,22 @@ class EnvironmentBootstrapper:
                                    configuration file is missing.
     """
 
-    def __init__(self, paths: ZephyrusPaths, default_batch_size: int = 5) -> None:
+    def __init__(
+        self, paths: ZephyrusPaths, default_batch_size: int = 5, create_json_log: bool = True
+    ) -> None:
         """
         Initializes the EnvironmentBootstrapper with paths and a default batch size.
         
         Args:
         	paths: Contains locations for logs, exports, and configuration files.
         	default_batch_size: Default batch size used if the configuration file is missing.
+        	create_json_log: Create an empty JSON log if it is missing. Storage backends that
+        		keep the raw log elsewhere (shards, SQLite) pass False, so no stale empty
+        		``zephyrus_log.json`` reappears next to their data.
         """
         self.paths = paths  # Store the paths for later use
         self.default_batch_size = default_batch_size  # Set default batch size
+        self.create_json_log = create_json_log  # Only the json/journal backends use the file
 
     def bootstrap(self) -> None:
         """
@@ -60,9 +66,11 @@ class EnvironmentBootstrapper:
         """
         Initializes required log and configuration files for the Zephyrus Logger environment.
         
-        Creates empty or default-initialized files if they do not exist, including the JSON log, text log, correction summaries, and configuration files. If the correction summaries file exists but is empty, it is reinitialized as an empty JSON file. The configuration file is recreated with a default batch size if missing.
+        Creates empty or default-initialized files if they do not exist, including the JSON log (unless `create_json_log` is False), text log, correction summaries, and configuration files. If the correction summaries file exists but is empty, it is reinitialized as an empty JSON file. The configuration file is recreated with a default batch size if missing.
         """
-        if not self.paths.json_log_file.exists():  # Check if log file exists
+        if (
+            self.create_json_log and not self.paths.json_log_file.exists()
+        ):  # Check if log file exists
             logger.info("Creating empty log file: %s", self.paths.json_log_file)
             write_json(self.paths.json_log_file, {})  # Create empty log file
 
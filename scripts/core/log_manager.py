@@ -3,7 +3,8 @@ log_manager.py
 
 This module provides the LogManager class for managing log entries and correction summaries.
 It includes functionality for reading and writing log data in both JSON and plain text formats,
-as well as handling timestamps and content keys for structured logging. The LogManager is essential
+as well as handling timestamps and content keys for structured logging. The raw log itself is
+kept by a pluggable storage backend (see scripts.core.log_storage). The LogManager is essential
 for the Zephyrus Logger application to maintain a reliable logging system.
 
 Dependencies:
@@ -11,11 +12,14 @@ Dependencies:
 - datetime
 - logging
 - scripts.utils.file_utils
+- scripts.core.log_storage
 """
 
 from pathlib import Path
 from datetime import datetime
 import logging
+from typing import Any, ContextManager, Iterable, List, Mapping, Optional, Tuple
+from scripts.core.log_storage import JsonLogStorage, LogStorage, Record
 from scripts.utils.file_utils import read_json, write_json
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,7 @@ class LogManager:
         timestamp_format: str,
         content_key: str,
         timestamp_key: str,
+        storage: Optional[LogStorage] = None,
     ):
         """
         Initializes a LogManager instance.
@@ -41,6 +46,8 @@ class LogManager:
             timestamp_format (str): Timestamp format for log entries.
             content_key (str): Key used to store the content of a log entry in the JSON file.
             timestamp_key (str): Key used to store the timestamp of a log entry in the JSON file.
+            storage (Optional[LogStorage]): Backend holding the raw log. Defaults to a
+                JsonLogStorage over `json_log_file`.
         """
         self.json_log_file = json_log_file
         self.txt_log_file = txt_log_file
@@ -48,14 +55,17 @@ class LogManager:
         self.timestamp_format = timestamp_format
         self.content_key = content_key
         self.timestamp_key = timestamp_key
+        self.storage = storage if storage is not None else JsonLogStorage(json_log_file)
 
-    def _safe_read_or_create_json(self, filepath: Path) -> dict:
+    def _safe_read_or_create_json(self, filepath: Path, use_cache: bool = False) -> dict:
         """
         Safely reads a JSON file or creates it if it doesn't exist.
         If the file doesn't exist, it will create an empty JSON object.
 
         Args:
             filepath (Path): Path to the JSON file.
+            use_cache (bool): Return the shared parsed object from the `read_json` cache;
+                the caller must not modify it. Defaults to False.
 
         Returns:
             dict: The parsed JSON data or an empty dictionary if the file couldn't be loaded.
@@ -67,20 +77,34 @@ class LogManager:
                 f.write("{}")
 
         try:
-            return read_json(filepath)
+            return read_json(filepath, use_cache=use_cache)
         except Exception as e:
             logger.error(f"Failed to read or parse file '{filepath}': {e}")
             return {}
 
     def read_logs(self) -> dict:
         """
-        Reads the JSON log file and returns its contents. If the file doesn't exist, it will create an empty JSON object.
+        Reads the raw log and returns its contents. If the file doesn't exist, it will create an empty JSON object.
+
+        The JSON backend shares the parsed log between readers until the file changes, so
+        treat the result as read-only; use `update_logs` to modify the log.
 
         Returns:
-            dict: The parsed JSON data or an empty dictionary if the file couldn't be loaded.
+            dict: The nested date/category/subcategory view, or an empty dictionary if the log couldn't be loaded.
+        """
+
+        return self.storage.read_logs()
+
+    def iter_log_shards(self):
         """
+        Yields the raw log in consecutive ``(counts, reader)`` parts, one per shard with the
+        sharded backend and a single part (with unknown counts) otherwise.
 
-        return self._safe_read_or_create_json(self.json_log_file)
+        Returns:
+            Iterator: ``(counts, reader)`` pairs; `counts` is the nested date/category/
+            subcategory entry count of the part, or None when unknown.
+        """
+        return self.storage.iter_shards()
 
     def update_logs(self, update_func) -> None:
         """
@@ -92,11 +116,22 @@ class LogManager:
         Args:
             update_func (Callable[[dict], None]): The function to call to update the JSON data.
         """
-        data = self.read_logs()
-        update_func(data)
-        write_json(self.json_log_file, data)
+        self.storage.update(update_func)
+
+    def transaction(self) -> ContextManager[Any]:
+        """
+        Commits the storage writes made inside the block atomically, where the backend
+        supports it (SQLite): e.g. appended entries together with the tracker counts of them.
+        """
+        return self.storage.transaction()
+
+    def compact_logs(self) -> None:
+        """
+        Folds pending journal appends into the JSON log file (a no-op for the JSON backend).
+        """
+        self.storage.compact()
 
-    def append_entry(self, date_str: str, main_category: str, subcategory: str, entry: str) -> None:
+    def append_entry(self, date_str: str, main_category: str, subcategory: str, entry: str) -> dict:
         """
         Appends a new log entry to the JSON log file.
 
@@ -105,25 +140,106 @@ class LogManager:
             main_category (str): The main category of the log entry.
             subcategory (str): The subcategory of the log entry.
             entry (str): The content of the log entry.
+
+        Returns:
+            dict: The stored record, so callers (e.g. the raw indexer) can process it
+            without re-reading the log.
         """
+        record = {
+            self.timestamp_key: datetime.now().strftime(self.timestamp_format),
+            self.content_key: entry,
+        }
+        self.storage.append(date_str, main_category, subcategory, record)
+        return record
 
-        def updater(data: dict) -> None:
-            """
-            Updates the JSON data to append a new log entry.
+    def append_entries(self, items: Iterable[Tuple[str, ...]]) -> List[dict]:
+        """
+        Appends several log entries with a single write of the storage backend.
 
-            Args:
-                data (dict): The current JSON data.
-            """
-            data.setdefault(date_str, {}).setdefault(main_category, {}).setdefault(
-                subcategory, []
-            ).append(
-                {
-                    self.timestamp_key: datetime.now().strftime(self.timestamp_format),
-                    self.content_key: entry,
-                }
-            )
+        Args:
+            items (Iterable[Tuple[str, ...]]): ``(date_str, main_category, subcategory, entry)``
+                tuples, stored in order. An optional fifth element is the entry's timestamp;
+                it defaults to now.
 
-        self.update_logs(updater)
+        Returns:
+            List[dict]: The stored records, in the order of `items`.
+        """
+        now = datetime.now().strftime(self.timestamp_format)
+        records = []
+        for date_str, main_category, subcategory, entry, *timestamp in items:
+            record = {
+                self.timestamp_key: timestamp[0] if timestamp and timestamp[0] else now,
+                self.content_key: entry,
+            }
+            records.append((date_str, main_category, subcategory, record))
+        if records:
+            self.storage.append_many(records)
+        return [record for *_, record in records]
+
+    def save_entries_bulk(self, entries: Iterable[Mapping[str, Any]]) -> List[Record]:
+        """
+        Validates and appends many imported entries with a single write of the storage backend.
+
+        Each entry is a mapping with ``main_category``, ``subcategory`` and the content (under
+        the content key or ``entry``). The timestamp (under the timestamp key, in the log's
+        format or ISO 8601) defaults to now, and ``date`` defaults to the timestamp's day.
+        Records are grouped by date, keeping the input order within a day. Nothing is written
+        if any entry is invalid.
+
+        Args:
+            entries (Iterable[Mapping[str, Any]]): The entries to import, e.g. rows streamed
+                by `scripts.utils.file_io.iter_records`.
+
+        Returns:
+            List[Record]: The stored ``(date_str, main_category, subcategory, record)`` tuples.
+
+        Raises:
+            ValueError: If an entry lacks a category or content, or has an unreadable timestamp
+                or date.
+        """
+        now = datetime.now()
+        records: List[Record] = []
+        for n, entry in enumerate(entries, 1):
+            main_category = str(entry.get("main_category") or "").strip()
+            subcategory = str(entry.get("subcategory") or "").strip()
+            content = entry.get(self.content_key) or entry.get("entry")
+            if not main_category or not subcategory or not content:
+                raise ValueError(
+                    f"Entry {n} needs main_category, subcategory and {self.content_key}."
+                )
+            timestamp = self._parse_timestamp(entry.get(self.timestamp_key), n) or now
+            date_str = self._parse_date(entry.get("date"), n) or timestamp.strftime("%Y-%m-%d")
+            record = {
+                self.timestamp_key: timestamp.strftime(self.timestamp_format),
+                self.content_key: str(content),
+            }
+            records.append((date_str, main_category, subcategory, record))
+        records.sort(key=lambda record: record[0])
+        if records:
+            self.storage.append_many(records)
+        return records
+
+    def _parse_timestamp(self, value: Any, n: int) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.strptime(str(value), self.timestamp_format)
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError:
+            raise ValueError(f"Entry {n} has an unreadable timestamp: {value!r}.") from None
+
+    @staticmethod
+    def _parse_date(value: Any, n: int) -> Optional[str]:
+        # Normalized to the zero-padded form the log's date keys sort by.
+        if not value:
+            return None
+        try:
+            return datetime.strptime(str(value).strip(), "%Y-%m-%d").strftime("%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"Entry {n} has an unreadable date: {value!r}.") from None
 
     def get_unsummarized_batch(
         self, main_category: str, subcategory: str, summarized_total: int, batch_size: int
@@ -140,17 +256,23 @@ class LogManager:
         Returns:
             list: A list of log entries, each represented as a dictionary with 'timestamp' and 'content' keys.
         """
-        logs = self.read_logs()
-        entries = []
-        count = 0
-        for date in sorted(logs.keys()):
-            for entry in logs[date].get(main_category, {}).get(subcategory, []):
-                if count >= summarized_total:
-                    entries.append(entry)
-                    if len(entries) == batch_size:
-                        return entries
-                count += 1
-        return []
+        return self.storage.unsummarized_batch(
+            main_category, subcategory, summarized_total, batch_size
+        )
+
+    def read_correction_summaries(self) -> dict:
+        """
+        Reads the correction summaries, from the storage backend when it keeps them.
+
+        The JSON file is parsed once and shared until it changes, so treat the result as
+        read-only.
+
+        Returns:
+            dict: The nested "global" → main category → subcategory view of the summaries.
+        """
+        if self.storage.stores_summaries:
+            return self.storage.read_summaries()
+        return self._safe_read_or_create_json(self.correction_summaries_file, use_cache=True)
 
     def update_correction_summaries(
         self, main_category: str, subcategory: str, new_data: dict
@@ -170,8 +292,32 @@ class LogManager:
                     - "start": The start timestamp of the batch.
                     - "end": The end timestamp of the batch.
         """
+        if self.storage.stores_summaries:
+            self.storage.append_summary(main_category, subcategory, new_data)
+            return
         data = self._safe_read_or_create_json(self.correction_summaries_file)
         data.setdefault("global", {}).setdefault(main_category, {}).setdefault(
             subcategory, []
         ).append(new_data)
-        write_json(self.correction_summaries_file, data)
+        write_json(self.correction_summaries_file, data, indent=None)
+
+    def update_correction_summaries_many(self, records: Iterable[Tuple[str, str, dict]]) -> None:
+        """
+        Appends several correction summaries with a single write.
+
+        Args:
+            records (Iterable[Tuple[str, str, dict]]): ``(main_category, subcategory, new_data)``
+                tuples, appended in order; see `update_correction_summaries` for `new_data`.
+        """
+        records = list(records)
+        if not records:
+            return
+        if self.storage.stores_summaries:
+            self.storage.append_summaries(records)
+            return
+        data = self._safe_read_or_create_json(self.correction_summaries_file)
+        for main_category, subcategory, new_data in records:
+            data.setdefault("global", {}).setdefault(main_category, {}).setdefault(
+                subcategory, []
+            ).append(new_data)
+        write_json(self.correction_summaries_file, data, indent=None)
@@ -0,0 +1,512 @@
+"""
+log_storage.py
+
+This module provides the storage backends behind LogManager for the raw idea log.
+
+Backends:
+- JsonLogStorage: the nested ``date → main_category → subcategory → [entries]`` JSON file,
+  rewritten on every change (the original behaviour).
+- JournalLogStorage: the same JSON file as a compacted snapshot plus an append-only JSON Lines
+  journal. Saving an entry is one small append and fsync, independent of the log's size;
+  the journal is folded into the snapshot every ``compact_every`` entries.
+- SQLiteLogStorage (scripts.core.sqlite_store): raw log, correction summaries and tracker
+  counts in one SQLite database.
+- ShardedLogStorage (scripts.core.sharded_log_storage): one JSON file per month plus a manifest
+  of entry counts; saving an entry rewrites only its month.
+
+All return the same nested view from `read_logs`, so consumers are unaffected by the choice.
+The file-based backends keep that view in memory together with an EntryPositions index, so
+`unsummarized_batch` fetches the next batch of a subcategory by offset instead of scanning the log.
+"""
+
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from contextlib import nullcontext
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from scripts.utils.file_utils import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+LOG_STORAGE_BACKENDS = ("json", "journal", "sqlite", "sharded")
+DEFAULT_COMPACT_EVERY = 500
+
+#: Nested ``{date: {main_category: {subcategory: [entries]}}}`` log view.
+Logs = Dict[str, Dict[str, Dict[str, List[Dict[str, Any]]]]]
+#: Nested ``{date: {main_category: {subcategory: entry count}}}``.
+Counts = Dict[str, Dict[str, Dict[str, int]]]
+#: A part of the log: its entry counts when known up front, and a reader for its entries.
+#: One entry to store: ``(date, main_category, subcategory, entry)``.
+Record = Tuple[str, str, str, Dict[str, Any]]
+Shard = Tuple[Optional[Counts], Callable[[], Logs]]
+
+
+def _read_or_create(path: Path, use_cache: bool = False) -> Logs:
+    """
+    Reads the JSON log file, creating an empty one if it does not exist.
+
+    With `use_cache` the parsed log may be shared with other readers and must not be modified.
+    """
+    if not path.exists():
+        logger.info(f"File '{path}' not found. Creating new file.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{}")
+    return read_json(path, use_cache=use_cache)
+
+
+def _add(data: Logs, date_str: str, main_category: str, subcategory: str, entry: dict) -> None:
+    data.setdefault(date_str, {}).setdefault(main_category, {}).setdefault(subcategory, []).append(
+        entry
+    )
+
+
+class EntryPositions:
+    """
+    Ordered positions of the entries of every (main_category, subcategory).
+
+    Entries of a subcategory are ordered by date key, then by position within the date; per
+    subcategory the index keeps the sorted date keys and their entry counts, so the entry at
+    any offset is found by binary search over the running totals.
+    """
+
+    def __init__(self) -> None:
+        self._dates: Dict[Tuple[str, str], List[str]] = {}
+        self._counts: Dict[Tuple[str, str], List[int]] = {}
+        self._starts: Dict[Tuple[str, str], List[int]] = {}
+
+    @classmethod
+    def from_logs(cls, logs: Logs) -> "EntryPositions":
+        positions = cls()
+        for date_str, categories in logs.items():
+            for main_category, subcats in categories.items():
+                for subcategory, entries in subcats.items():
+                    positions.add(date_str, main_category, subcategory, len(entries))
+        return positions
+
+    def add(self, date_str: str, main_category: str, subcategory: str, count: int = 1) -> None:
+        """Records `count` entries appended under `date_str`."""
+        key = (main_category, subcategory)
+        dates = self._dates.setdefault(key, [])
+        counts = self._counts.setdefault(key, [])
+        i = bisect_left(dates, date_str)
+        if i < len(dates) and dates[i] == date_str:
+            counts[i] += count
+        else:
+            dates.insert(i, date_str)
+            counts.insert(i, count)
+        self._starts.pop(key, None)
+
+    def count(self, main_category: str, subcategory: str) -> int:
+        """Number of entries of a subcategory."""
+        return sum(self._counts.get((main_category, subcategory), ()))
+
+    def locate(
+        self, main_category: str, subcategory: str, offset: int, size: int
+    ) -> Optional[List[Tuple[str, int, int]]]:
+        """
+        Returns ``(date, start, stop)`` slices covering entries ``offset .. offset + size``
+        of a subcategory, or None if fewer than `size` entries follow `offset`.
+        """
+        key = (main_category, subcategory)
+        counts = self._counts.get(key)
+        if not counts or size <= 0:
+            return None
+        starts = self._starts.get(key)
+        if starts is None:
+            starts = self._starts[key] = [0, *accumulate(counts)][:-1]
+        if offset + size > starts[-1] + counts[-1]:
+            return None
+
+        slices = []
+        i = bisect_right(starts, offset) - 1
+        while size > 0:
+            start = offset - starts[i]
+            stop = min(counts[i], start + size)
+            slices.append((self._dates[key][i], start, stop))
+            size -= stop - start
+            offset += stop - start
+            i += 1
+        return slices
+
+
+class LogStorage:
+    """
+    Interface of a raw log storage backend.
+    """
+
+    #: Whether correction summaries and tracker counts are kept by this backend as well
+    #: (otherwise they stay in their JSON files).
+    stores_summaries: bool = False
+
+    def read_logs(self) -> Logs:
+        """Returns the full nested log view."""
+        raise NotImplementedError
+
+    def append(self, date_str: str, main_category: str, subcategory: str, entry: dict) -> None:
+        """Durably appends one entry."""
+        raise NotImplementedError
+
+    def append_many(self, records: List[Record]) -> None:
+        """Durably appends several entries, in order, with as few writes as the backend allows."""
+        for record in records:
+            self.append(*record)
+
+    def update(self, update_func: Callable[[Logs], None]) -> None:
+        """Applies `update_func` to the nested view in place and persists the result."""
+        raise NotImplementedError
+
+    def compact(self) -> None:
+        """Folds pending appends into the primary file; a no-op where nothing is pending."""
+
+    def transaction(self) -> ContextManager[None]:
+        """
+        Groups the writes made inside the block (entries, summaries and tracker counts) into
+        one atomic transaction where the backend supports it; a no-op otherwise.
+        """
+        return nullcontext()
+
+    def iter_shards(self) -> Iterator[Shard]:
+        """
+        Yields the log in consecutive parts, so consumers can process one part at a time and
+        skip parts whose counts show nothing new. Unsharded backends yield one part with
+        unknown counts.
+        """
+        yield None, self.read_logs
+
+    def unsummarized_batch(
+        self, main_category: str, subcategory: str, offset: int, batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the `batch_size` entries following the first `offset` of a subcategory,
+        ordered by date and insertion, or an empty list if fewer remain.
+
+        Served from the in-memory view and its EntryPositions index in O(batch_size); the
+        view is only re-read when the files were changed by someone else.
+        """
+        with self._lock:
+            logs, positions = self._indexed_view()
+            slices = positions.locate(main_category, subcategory, offset, batch_size)
+            if slices is None:
+                return []
+            return [
+                entry
+                for date_str, start, stop in slices
+                for entry in logs[date_str][main_category][subcategory][start:stop]
+            ]
+
+    # ------------------------------------------------------------------
+    # In-memory view of file-based backends
+    # ------------------------------------------------------------------
+    _view: Optional[Logs] = None
+    _positions: Optional[EntryPositions] = None
+    _view_signature: Any = None
+
+    def _signature(self) -> Any:
+        """Cheap fingerprint (sizes and mtimes) of the backing files."""
+        raise NotImplementedError
+
+    def _read_view(self) -> Logs:
+        """Reads a private copy of the log for the view, which appends update in place."""
+        return self.read_logs()
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _indexed_view(self) -> Tuple[Logs, EntryPositions]:
+        """Returns the cached view and index, re-reading them if the files changed."""
+        signature = self._signature()
+        if self._view is None or signature != self._view_signature:
+            self._view = self._read_view()
+            self._positions = EntryPositions.from_logs(self._view)
+            self._view_signature = self._signature()
+        return self._view, self._positions
+
+    def _note_appends(self, before: Any, records: List[Record]) -> None:
+        """Applies appends made by this storage to the cached view, if it was current."""
+        if self._view is None:
+            return
+        if self._view_signature != before:
+            self._view = None
+            return
+        for date_str, main_category, subcategory, entry in records:
+            _add(self._view, date_str, main_category, subcategory, entry)
+            self._positions.add(date_str, main_category, subcategory)
+        self._view_signature = self._signature()
+
+
+class JsonLogStorage(LogStorage):
+    """
+    Stores the log as a single nested JSON file that is rewritten on every change.
+
+    Attributes:
+        json_log_file (Path): Path to the JSON log file.
+    """
+
+    def __init__(self, json_log_file: Path) -> None:
+        self.json_log_file = Path(json_log_file)
+        self._lock = threading.RLock()
+
+    def _signature(self) -> Any:
+        return self._stat(self.json_log_file)
+
+    def read_logs(self) -> Logs:
+        # Shared with other readers through the parsed-JSON cache; never modified here.
+        return self._load(use_cache=True)
+
+    def _read_view(self) -> Logs:
+        return self._load()
+
+    def _load(self, use_cache: bool = False) -> Logs:
+        try:
+            return _read_or_create(self.json_log_file, use_cache=use_cache)
+        except Exception as e:
+            logger.error(f"Failed to read or parse file '{self.json_log_file}': {e}")
+            return {}
+
+    def append(self, date_str: str, main_category: str, subcategory: str, entry: dict) -> None:
+        self.append_many([(date_str, main_category, subcategory, entry)])
+
+    def append_many(self, records: List[Record]) -> None:
+        # One rewrite of the file however many entries are added.
+        with self._lock:
+            before = self._signature()
+            data = self._load()
+            for record in records:
+                _add(data, *record)
+            write_json(self.json_log_file, data, indent=None)
+            self._note_appends(before, records)
+
+    def update(self, update_func: Callable[[Logs], None]) -> None:
+        with self._lock:
+            data = self._load()
+            update_func(data)
+            write_json(self.json_log_file, data, indent=None)
+            self._view = None
+
+
+class JournalLogStorage(LogStorage):
+    """
+    Stores the log as a JSON snapshot plus an append-only JSON Lines journal.
+
+    Each journal line holds one entry with its date, main category and subcategory. Reads
+    replay the journal over the snapshot. Compaction first renames the journal aside, then
+    atomically replaces the snapshot, then deletes the renamed journal; an interrupted
+    compaction is completed on the next access, and a torn last journal line (a crash
+    mid-append) is skipped.
+
+    Attributes:
+        json_log_file (Path): Path to the JSON snapshot (the usual log file).
+        journal_path (Path): Path to the journal (``<log stem>.journal.jsonl``).
+        compact_every (int): Journal entries after which the journal is compacted
+            automatically; 0 disables automatic compaction.
+    """
+
+    def __init__(self, json_log_file: Path, compact_every: int = DEFAULT_COMPACT_EVERY) -> None:
+        self.json_log_file = Path(json_log_file)
+        self.journal_path = self.json_log_file.with_name(f"{self.json_log_file.stem}.journal.jsonl")
+        self.compacting_path = self.journal_path.with_name(
+            f"{self.json_log_file.stem}.journal.compacting.jsonl"
+        )
+        self.compact_every = max(0, int(compact_every))
+        self._lock = threading.RLock()
+        self._pending = -1  # journal entries since the last compaction; -1 until counted
+
+    def _signature(self) -> Any:
+        return (
+            self._stat(self.json_log_file),
+            self._stat(self.journal_path),
+            self._stat(self.compacting_path),
+        )
+
+    # ------------------------------------------------------------------
+    # Journal I/O
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _iter_journal(path: Path) -> Iterator[Tuple[str, str, str, dict]]:
+        """Yields ``(date, main_category, subcategory, entry)`` records of a journal file."""
+        if not path.exists():
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    yield (
+                        record["date"],
+                        record["main_category"],
+                        record["subcategory"],
+                        record["entry"],
+                    )
+                except (ValueError, KeyError) as e:
+                    logger.warning("Skipping unreadable journal line %s:%d: %s", path, line_no, e)
+
+    def _write_snapshot(self, data: Logs) -> None:
+        write_json(self.json_log_file, data, indent=None)
+
+    def _read_snapshot(self) -> Logs:
+        try:
+            return _read_or_create(self.json_log_file)
+        except Exception as e:
+            logger.error(f"Failed to read or parse file '{self.json_log_file}': {e}")
+            return {}
+
+    @staticmethod
+    def _contains_tail(data: Logs, records: List[Tuple[str, str, str, dict]]) -> bool:
+        """Whether every subcategory of `data` already ends with its entries in `records`."""
+        groups: Dict[Tuple[str, str, str], List[dict]] = {}
+        for date_str, main_category, subcategory, entry in records:
+            groups.setdefault((date_str, main_category, subcategory), []).append(entry)
+        for (date_str, main_category, subcategory), entries in groups.items():
+            stored = data.get(date_str, {}).get(main_category, {}).get(subcategory, [])
+            if stored[-len(entries) :] != entries:
+                return False
+        return True
+
+    def _recover(self) -> None:
+        """Completes a compaction that was interrupted after renaming the journal."""
+        if not self.compacting_path.exists():
+            return
+        records = list(self._iter_journal(self.compacting_path))
+        data = self._read_snapshot()
+        if not self._contains_tail(data, records):
+            logger.info("Completing interrupted journal compaction of %s.", self.json_log_file)
+            for record in records:
+                _add(data, *record)
+            self._write_snapshot(data)
+        self.compacting_path.unlink()
+
+    # ------------------------------------------------------------------
+    # LogStorage API
+    # ------------------------------------------------------------------
+    def read_logs(self) -> Logs:
+        with self._lock:
+            self._recover()
+            data = self._read_snapshot()
+            pending = 0
+            for record in self._iter_journal(self.journal_path):
+                _add(data, *record)
+                pending += 1
+            self._pending = pending
+            return data
+
+    def append(self, date_str: str, main_category: str, subcategory: str, entry: dict) -> None:
+        self.append_many([(date_str, main_category, subcategory, entry)])
+
+    def append_many(self, records: List[Record]) -> None:
+        # All lines go out in one write and one fsync.
+        lines = "".join(
+            json.dumps(
+                {
+                    "date": date_str,
+                    "main_category": main_category,
+                    "subcategory": subcategory,
+                    "entry": entry,
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            for date_str, main_category, subcategory, entry in records
+        )
+        with self._lock:
+            if self._pending < 0:
+                self._recover()
+                self._pending = sum(1 for _ in self._iter_journal(self.journal_path))
+            before = self._signature()
+            fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, lines.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._note_appends(before, records)
+            self._pending += len(records)
+            if self.compact_every and self._pending >= self.compact_every:
+                self.compact()
+
+    def update(self, update_func: Callable[[Logs], None]) -> None:
+        self._compact(update_func)
+
+    def compact(self) -> None:
+        """Folds the journal into the JSON snapshot and starts an empty journal."""
+        self._compact(None)
+
+    def _compact(self, update_func: Optional[Callable[[Logs], None]]) -> None:
+        with self._lock:
+            # Compaction alone leaves the view unchanged; only its fingerprint moves.
+            in_sync = (
+                update_func is None
+                and self._view is not None
+                and self._view_signature == self._signature()
+            )
+            self._recover()
+            if update_func is None and not self.journal_path.exists():
+                self._pending = 0
+                return
+            if self.journal_path.exists():
+                os.replace(self.journal_path, self.compacting_path)
+            data = self._read_snapshot()
+            for record in self._iter_journal(self.compacting_path):
+                _add(data, *record)
+            if update_func is not None:
+                update_func(data)
+            self._write_snapshot(data)
+            if self.compacting_path.exists():
+                self.compacting_path.unlink()
+            self._pending = 0
+            if in_sync:
+                self._view_signature = self._signature()
+            else:
+                self._view = None
+
+
+def create_log_storage(
+    backend: str,
+    json_log_file: Path,
+    compact_every: int = DEFAULT_COMPACT_EVERY,
+    db_path: Optional[Path] = None,
+) -> LogStorage:
+    """
+    Creates the log storage backend named by the ``log_storage_backend`` config key.
+
+    Args:
+        backend (str): One of `LOG_STORAGE_BACKENDS`.
+        json_log_file (Path): Path to the JSON log file (the snapshot for ``journal``).
+        compact_every (int, optional): Journal compaction interval, in entries.
+        db_path (Optional[Path], optional): Database file for ``sqlite``; defaults to
+            ``zephyrus.db`` next to `json_log_file`.
+
+    ``sharded`` keeps its shards in ``<log stem>_shards`` next to `json_log_file`.
+
+    Returns:
+        LogStorage: The storage backend.
+
+    Raises:
+        ValueError: If `backend` is unknown.
+    """
+    if backend == "json":
+        return JsonLogStorage(json_log_file)
+    if backend == "journal":
+        return JournalLogStorage(json_log_file, compact_every=compact_every)
+    if backend == "sqlite":
+        from scripts.core.sqlite_store import SQLiteLogStorage, SQLiteStore
+
+        return SQLiteLogStorage(
+            SQLiteStore(db_path or Path(json_log_file).with_name("zephyrus.db"))
+        )
+    if backend == "sharded":
+        from scripts.core.sharded_log_storage import ShardedLogStorage
+
+        return ShardedLogStorage(json_log_file)
+    raise ValueError(f"Unsupported log_storage_backend: {backend}")
@@ -4,15 +4,36 @@ Markdown Logger Module
 This module provides the MarkdownLogger class, which is responsible
 for logging entries to Markdown files. It handles the creation and
 updating of Markdown files in the specified export directory.
+
+Export modes:
+- ``rewrite``: each entry rewrites its category document (the original behaviour).
+- ``sections``: each entry is appended to a per-day section file under
+  ``<export_dir>/.sections/<category>/``; the category documents are assembled from
+  their sections shortly after each write burst (``assemble_interval``), on demand
+  (``assemble``) and at interpreter exit.
+
+Both modes, and ``export_all``, list the entries under each date newest first.
 """
 
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import atexit
+import os
 import re
 import logging
+import threading
+import weakref
 from scripts.utils.file_utils import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
+MARKDOWN_EXPORT_MODES = ("rewrite", "sections")
+SECTIONS_DIR = ".sections"
+TITLE_FILE = ".title"
+DEFAULT_ASSEMBLE_INTERVAL = 5.0
+_ENTRY_START = re.compile(r"(?m)^(?=- \*\*)")  # Start of an entry line (entries may span lines)
+
 
 class MarkdownLogger:
     """
@@ -23,16 +44,43 @@ class MarkdownLogger:
 
     Attributes:
         export_dir (Path): The directory where Markdown files will be saved.
+        mode (str): One of `MARKDOWN_EXPORT_MODES`.
+        assemble_interval (float): In sections mode, seconds after a write burst until the
+            changed documents are assembled; bursts within the interval share one assembly.
     """
 
-    def __init__(self, export_dir: Path) -> None:
+    def __init__(
+        self,
+        export_dir: Path,
+        mode: str = "rewrite",
+        assemble_interval: float = DEFAULT_ASSEMBLE_INTERVAL,
+    ) -> None:
         """
         Initializes a MarkdownLogger to write entries to Markdown files in the specified directory.
         
         Args:
             export_dir: Directory where Markdown files will be stored.
+            mode: ``rewrite`` or ``sections`` (see the module docstring).
+            assemble_interval: Delay of the assembly after a write burst in sections mode;
+                0 assembles right after every burst.
+
+        Raises:
+            ValueError: If `mode` is unknown.
         """
+        if mode not in MARKDOWN_EXPORT_MODES:
+            raise ValueError(f"Unsupported markdown_export_mode: {mode}")
         self.export_dir = export_dir
+        self.mode = mode
+        self.sections_dir = Path(export_dir) / SECTIONS_DIR
+        self.assemble_interval = max(0.0, float(assemble_interval))
+        self._lock = threading.Lock()
+        self._assemble_timer: Optional[threading.Timer] = None
+        if mode == "sections":
+            ref = weakref.ref(self)
+            atexit.register(lambda: ref() is not None and ref().assemble())
+
+    def _document_path(self, main_category: str) -> Path:
+        return self.export_dir / (sanitize_filename(main_category) + ".md")
 
     def log(self, date_str: str, main_category: str, subcategory: str, entry: str) -> bool:
         """
@@ -40,24 +88,228 @@ class MarkdownLogger:
         
         Creates or updates a Markdown file named after the main category, adding the entry under the specified date header and subcategory. Returns True if the operation succeeds, or False if an error occurs.
         """
+        return self.log_many([(date_str, main_category, subcategory, entry)])
+
+    def log_many(self, items: Iterable[Tuple[str, str, str, str]]) -> bool:
+        """
+        Logs several ``(date_str, main_category, subcategory, entry)`` items, in order.
+
+        Each category document (or, in sections mode, each day's section file) is written
+        once however many of the items it receives. Returns True if every write succeeded.
+        """
+        by_category: Dict[str, List[Tuple[str, str, str]]] = {}
+        for date_str, main_category, subcategory, entry in items:
+            by_category.setdefault(main_category, []).append((date_str, subcategory, entry))
+        ok = True
+        for main_category, entries in by_category.items():
+            if self.mode == "sections":
+                ok = self._append_sections(main_category, entries) and ok
+            else:
+                ok = self._rewrite_document(main_category, entries) and ok
+        if self.mode == "sections" and by_category:
+            self._schedule_assemble()
+        return ok
+
+    def _rewrite_document(self, main_category: str, entries: List[Tuple[str, str, str]]) -> bool:
         try:
             md_filename = sanitize_filename(main_category) + ".md"
             md_path = self.export_dir / md_filename
-            date_header = f"## {date_str}"
-            md_content = f"- **{subcategory}**: {entry}\n"
-
-            if md_path.exists():
-                content = md_path.read_text(encoding="utf-8")
-                if date_header in content:
-                    updated = re.sub(f"({date_header}\n)", f"\1{md_content}", content, count=1)
-                else:
-                    updated = f"{content}\n{date_header}\n\n{md_content}"
-            else:
-                updated = f"# {main_category}\n\n{date_header}\n\n{md_content}"
+            content = md_path.read_text(encoding="utf-8") if md_path.exists() else None
+
+            by_date: Dict[str, List[str]] = {}
+            for date_str, subcategory, entry in entries:
+                by_date.setdefault(date_str, []).append(f"- **{subcategory}**: {entry}\n")
 
-            md_path.write_text(updated, encoding="utf-8")
+            for date_str, lines in by_date.items():
+                date_header = f"## {date_str}"
+                if content is None:
+                    content = f"# {main_category}\n\n{date_header}\n\n{lines.pop(0)}"
+                elif date_header not in content:
+                    content = f"{content}\n{date_header}\n\n{lines.pop(0)}"
+                if lines:
+                    # Each entry lands right under its date header, so later ones come first;
+                    # one substitution per date keeps large imports linear in the document size.
+                    block = "".join(reversed(lines))
+                    content = re.sub(
+                        f"({re.escape(date_header)}\n\n?)",  # Below the blank line, if any
+                        lambda m: m.group(1) + block,
+                        content,
+                        count=1,
+                    )
+
+            md_path.write_text(content, encoding="utf-8")
             return True
 
         except Exception as e:
             logger.error("Markdown log failed: %s", e, exc_info=True)
             return False
+
+    # ------------------------------------------------------------------
+    # Sections mode
+    # ------------------------------------------------------------------
+    def _section_path(self, date_str: str, main_category: str) -> Path:
+        """The day's section file of a category, creating the category directory if needed."""
+        category_dir = self.sections_dir / sanitize_filename(main_category)
+        if not category_dir.exists():
+            category_dir.mkdir(parents=True)
+            (category_dir / TITLE_FILE).write_text(main_category, encoding="utf-8")
+        return category_dir / f"{sanitize_filename(date_str)}.md"
+
+    def _append_sections(self, main_category: str, entries: List[Tuple[str, str, str]]) -> bool:
+        """Appends entry lines to their days' section files; O(1) in the document size."""
+        by_date: Dict[str, List[str]] = {}
+        for date_str, subcategory, entry in entries:
+            by_date.setdefault(date_str, []).append(f"- **{subcategory}**: {entry}\n")
+        try:
+            with self._lock:
+                for date_str, lines in by_date.items():
+                    with open(self._section_path(date_str, main_category), "a", encoding="utf-8") as f:
+                        f.writelines(lines)
+            return True
+        except Exception as e:
+            logger.error("Markdown section append failed: %s", e, exc_info=True)
+            return False
+
+    def _schedule_assemble(self) -> None:
+        """Assembles the changed documents `assemble_interval` seconds after a write burst."""
+        if not self.assemble_interval:
+            self.assemble()
+            return
+        with self._lock:
+            if self._assemble_timer is None:
+                self._assemble_timer = threading.Timer(self.assemble_interval, self._timed_assemble)
+                self._assemble_timer.daemon = True
+                self._assemble_timer.start()
+
+    def _timed_assemble(self) -> None:
+        with self._lock:
+            self._assemble_timer = None
+        try:
+            self.assemble()
+        except Exception as e:
+            logger.error("Markdown assembly failed: %s", e, exc_info=True)
+
+    def assemble(self, main_category: Optional[str] = None) -> int:
+        """
+        Rebuilds the category documents whose sections changed since they were last assembled.
+
+        Args:
+            main_category: Only assemble this category. Defaults to all categories.
+
+        Returns:
+            int: The number of documents written.
+        """
+        if main_category is None and self._assemble_timer is not None:
+            with self._lock:
+                if self._assemble_timer is not None:  # Everything is assembled below
+                    self._assemble_timer.cancel()
+                    self._assemble_timer = None
+        if not self.sections_dir.exists():
+            return 0
+        if main_category is not None:
+            category_dirs = [self.sections_dir / sanitize_filename(main_category)]
+        else:
+            category_dirs = sorted(p for p in self.sections_dir.iterdir() if p.is_dir())
+        written = 0
+        with self._lock:
+            for category_dir in category_dirs:
+                sections = sorted(category_dir.glob("*.md"))
+                if not sections:
+                    continue
+                doc_path = self.export_dir / (category_dir.name + ".md")
+                doc_mtime = doc_path.stat().st_mtime_ns if doc_path.exists() else -1
+                if all(p.stat().st_mtime_ns < doc_mtime for p in sections):
+                    continue
+                title_path = category_dir / TITLE_FILE
+                title = (
+                    title_path.read_text(encoding="utf-8")
+                    if title_path.exists()
+                    else category_dir.name
+                )
+                with _atomic_text(doc_path) as doc:
+                    doc.write(f"# {title}\n")
+                    for section in sections:
+                        # Sections are append-only logs; documents list the newest entry first.
+                        lines = _ENTRY_START.split(section.read_text(encoding="utf-8"))
+                        doc.write(f"\n## {section.stem}\n\n")
+                        doc.writelines(reversed(lines))
+                written += 1
+        return written
+
+    # ------------------------------------------------------------------
+    # Bulk export
+    # ------------------------------------------------------------------
+    def export_all(
+        self,
+        shards: Iterable[Tuple[Any, Callable[[], Dict[str, Any]]]],
+        content_key: str = "content",
+    ) -> Dict[str, int]:
+        """
+        Regenerates every category document (and, in sections mode, every section file) from
+        the log in a single streaming pass.
+
+        Each document is written to a temp file and renamed into place once complete. Section
+        files keep their entries oldest first, documents newest first.
+
+        Args:
+            shards: The log as ``(counts, reader)`` parts in date order, e.g.
+                `LogManager.iter_log_shards()`; each part is read once and released.
+            content_key: Key of the entry text in the log records.
+
+        Returns:
+            Dict[str, int]: Number of ``documents`` and ``entries`` written.
+        """
+        docs: Dict[str, IO[str]] = {}
+        entries = 0
+        with self._lock, ExitStack() as stack:
+            if self.mode == "sections":
+                self._clear_sections()
+            for _, read in shards:
+                data = read()
+                for date_str in sorted(data):
+                    for main_category, subcats in data[date_str].items():
+                        lines = [
+                            f"- **{subcategory}**: {record.get(content_key, '')}\n"
+                            for subcategory, records in subcats.items()
+                            for record in records
+                        ]
+                        if not lines:
+                            continue
+                        doc = docs.get(main_category)
+                        if doc is None:
+                            doc = docs[main_category] = stack.enter_context(
+                                _atomic_text(self._document_path(main_category))
+                            )
+                            doc.write(f"# {main_category}\n")
+                        doc.write(f"\n## {date_str}\n\n")
+                        doc.writelines(reversed(lines))  # Newest first, as in the other modes
+                        if self.mode == "sections":
+                            section = self._section_path(date_str, main_category)
+                            with open(section, "a", encoding="utf-8") as f:
+                                f.writelines(lines)
+                        entries += len(lines)
+        logger.info("Exported %d entries into %d Markdown documents.", entries, len(docs))
+        return {"documents": len(docs), "entries": entries}
+
+    def _clear_sections(self) -> None:
+        if not self.sections_dir.exists():
+            return
+        for category_dir in self.sections_dir.iterdir():
+            if category_dir.is_dir():
+                for path in category_dir.iterdir():
+                    path.unlink()
+                category_dir.rmdir()
+
+
+@contextmanager
+def _atomic_text(path: Path) -> Iterator[IO[str]]:
+    """Opens a temp file for writing that replaces `path` only if the block succeeds."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
@@ -0,0 +1,234 @@
+"""
+sharded_log_storage.py
+
+This module provides the month-sharded storage backend for the raw idea log, selected with
+``"log_storage_backend": "sharded"``.
+
+Core features include:
+- One JSON file per month (``<log stem>_shards/YYYY-MM.json``), so saving an entry rewrites
+  only the shard of its date and write latency stays flat as the log grows.
+- A small manifest with the per date/category/subcategory entry counts of every shard, used
+  to find the shards holding an unsummarized batch and to skip unchanged shards when the
+  raw index catches up.
+- Shards validated against the manifest by size and mtime on open; a shard changed behind
+  the manifest's back (e.g. a crash between the shard and manifest writes) is recounted.
+- A one-time split of an existing single-file log into shards, after which the single file
+  is renamed (``<log file>.migrated``) so nothing keeps reading or re-splitting a stale copy.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from scripts.core.log_storage import Counts, Logs, LogStorage, Record, Shard, _add
+from scripts.utils.file_utils import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+MIGRATED_SUFFIX = ".migrated"
+
+
+def shard_key(date_str: str) -> str:
+    """The shard (``YYYY-MM``) holding a ``YYYY-MM-DD`` date key."""
+    return date_str[:7]
+
+
+def _count(data: Logs) -> Counts:
+    return {
+        date_str: {
+            main_category: {subcategory: len(entries) for subcategory, entries in subcats.items()}
+            for main_category, subcats in categories.items()
+        }
+        for date_str, categories in data.items()
+    }
+
+
+class ShardedLogStorage(LogStorage):
+    """
+    Stores the log as one nested JSON file per month plus a manifest of entry counts.
+
+    `read_logs` merges the shards in month order; the merged view shares the parsed shards
+    with other readers, so it must not be modified.
+
+    Attributes:
+        json_log_file (Path): The single-file log, split into shards on first use and then
+            renamed with `MIGRATED_SUFFIX`.
+        shard_dir (Path): Directory of the shards and manifest (``<log stem>_shards``).
+        manifest_path (Path): Path to the manifest.
+    """
+
+    def __init__(self, json_log_file: Path, shard_dir: Optional[Path] = None) -> None:
+        self.json_log_file = Path(json_log_file)
+        self.shard_dir = (
+            Path(shard_dir)
+            if shard_dir is not None
+            else self.json_log_file.with_name(f"{self.json_log_file.stem}_shards")
+        )
+        self.manifest_path = self.shard_dir / MANIFEST_NAME
+        self._lock = threading.RLock()
+        self._shards: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            self._open()
+
+    def shard_path(self, key: str) -> Path:
+        return self.shard_dir / f"{key}.json"
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+    def _open(self) -> None:
+        """Loads the manifest and brings it in line with the shard files on disk."""
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        manifest = read_json(self.manifest_path) if self.manifest_path.exists() else {}
+        self._shards = manifest.get("shards", {})
+        on_disk = {p.stem for p in self.shard_dir.glob("*.json") if p.name != MANIFEST_NAME}
+        changed = False
+        for key in set(self._shards) - on_disk:
+            del self._shards[key]
+            changed = True
+        for key in sorted(on_disk):
+            info = self._shards.get(key)
+            if info is None or self._stat_of(key) != (info.get("size"), info.get("mtime_ns")):
+                logger.info("Recounting log shard %s.", key)
+                self._record(key, read_json(self.shard_path(key)))
+                changed = True
+        if not self._shards and self.json_log_file.exists():
+            self._split_single_file()
+        if changed or not self.manifest_path.exists():
+            self._save_manifest()
+
+    def _split_single_file(self) -> None:
+        data = read_json(self.json_log_file)
+        if data:
+            logger.info(
+                "Splitting %s into monthly shards under %s.", self.json_log_file, self.shard_dir
+            )
+            for key, shard in self._group(data).items():
+                self._write_shard(key, shard)
+        # The manifest goes first, so a crash before the rename only repeats the split.
+        self._save_manifest()
+        migrated = self.json_log_file.with_name(self.json_log_file.name + MIGRATED_SUFFIX)
+        os.replace(self.json_log_file, migrated)
+        logger.info(
+            "Renamed the single-file log to %s; the shards are now authoritative.", migrated
+        )
+
+    def _stat_of(self, key: str) -> Optional[tuple]:
+        st = self._stat(self.shard_path(key))
+        return None if st is None else (st[1], st[0])
+
+    def _record(self, key: str, data: Logs) -> None:
+        size, mtime_ns = self._stat_of(key) or (0, 0)
+        self._shards[key] = {"size": size, "mtime_ns": mtime_ns, "counts": _count(data)}
+
+    def _save_manifest(self) -> None:
+        write_json(
+            self.manifest_path,
+            {"version": MANIFEST_VERSION, "shards": dict(sorted(self._shards.items()))},
+            indent=None,
+        )
+
+    def _write_shard(self, key: str, data: Logs) -> None:
+        write_json(self.shard_path(key), data, indent=None)
+        self._record(key, data)
+
+    @staticmethod
+    def _group(data: Logs) -> Dict[str, Logs]:
+        shards: Dict[str, Logs] = {}
+        for date_str, categories in data.items():
+            shards.setdefault(shard_key(date_str), {})[date_str] = categories
+        return shards
+
+    def _load_shard(self, key: str, use_cache: bool = False) -> Logs:
+        path = self.shard_path(key)
+        return read_json(path, use_cache=use_cache) if path.exists() else {}
+
+    # ------------------------------------------------------------------
+    # LogStorage API
+    # ------------------------------------------------------------------
+    def read_logs(self) -> Logs:
+        with self._lock:
+            keys = sorted(self._shards)
+        merged: Logs = {}
+        for key in keys:
+            merged.update(self._load_shard(key, use_cache=True))
+        return merged
+
+    def append(self, date_str: str, main_category: str, subcategory: str, entry: dict) -> None:
+        self.append_many([(date_str, main_category, subcategory, entry)])
+
+    def append_many(self, records: List[Record]) -> None:
+        # Each touched shard is rewritten once, then the manifest once.
+        by_shard: Dict[str, List[Record]] = {}
+        for record in records:
+            by_shard.setdefault(shard_key(record[0]), []).append(record)
+        with self._lock:
+            for key, shard_records in by_shard.items():
+                data = self._load_shard(key)
+                for record in shard_records:
+                    _add(data, *record)
+                self._write_shard(key, data)
+            self._save_manifest()
+
+    def update(self, update_func: Callable[[Logs], None]) -> None:
+        with self._lock:
+            data: Logs = {}
+            for key in sorted(self._shards):
+                data.update(self._load_shard(key))
+            update_func(data)
+            shards = self._group(data)
+            for key in set(self._shards) - set(shards):
+                self.shard_path(key).unlink(missing_ok=True)
+                del self._shards[key]
+            for key, shard in shards.items():
+                self._write_shard(key, shard)
+            self._save_manifest()
+
+    def unsummarized_batch(
+        self, main_category: str, subcategory: str, offset: int, batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Reads only the shards overlapping entries ``offset .. offset + batch_size`` of a
+        subcategory; earlier (already summarized) shards are skipped using manifest counts.
+        """
+        with self._lock:
+            per_shard = [
+                (
+                    key,
+                    sum(
+                        categories.get(main_category, {}).get(subcategory, 0)
+                        for categories in info["counts"].values()
+                    ),
+                )
+                for key, info in sorted(self._shards.items())
+            ]
+        if batch_size <= 0 or offset + batch_size > sum(n for _, n in per_shard):
+            return []
+
+        batch: List[Dict[str, Any]] = []
+        start = 0
+        for key, n in per_shard:
+            if start + n > offset and n:
+                data = self._load_shard(key, use_cache=True)
+                entries = [
+                    entry
+                    for date_str in sorted(data)
+                    for entry in data[date_str].get(main_category, {}).get(subcategory, [])
+                ]
+                skip = max(0, offset - start)
+                batch.extend(entries[skip : skip + batch_size - len(batch)])
+                if len(batch) == batch_size:
+                    break
+            start += n
+        return batch
+
+    def iter_shards(self) -> Iterator[Shard]:
+        with self._lock:
+            keys = sorted(self._shards)
+            counts = {key: self._shards[key]["counts"] for key in keys}
+        for key in keys:
+            yield counts[key], lambda key=key: self._load_shard(key, use_cache=True)
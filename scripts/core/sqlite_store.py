@@ -0,0 +1,464 @@
+"""
+sqlite_store.py
+
+This module provides the SQLite storage engine for the raw log, the correction summaries and
+the summary tracker, selected with ``"log_storage_backend": "sqlite"``.
+
+Core features include:
+- One database file in WAL mode, so readers never block the single writer and every write is
+  a short transaction instead of a whole-file rewrite.
+- Entries and summaries indexed on (main_category, subcategory, date), so unsummarized batches,
+  tracker counts and validation are indexed queries rather than full-file scans.
+- Tracker counts updated with atomic upserts, and rebuilt from the data in one transaction.
+  Nested transactions join the outermost one, so rows and the counts of them commit together.
+- SQLiteLogStorage, the LogStorage backend exposing the same nested views as the JSON files.
+- A one-shot migration from the existing JSON files.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from scripts.core.log_storage import Logs, LogStorage, Record
+from scripts.utils.file_utils import read_json
+
+logger = logging.getLogger(__name__)
+
+#: Nested ``{main_category: {subcategory: {"summarized_total": n, "logged_total": n}}}``.
+Tracker = Dict[str, Dict[str, Dict[str, int]]]
+
+SUMMARY_DATE_KEY = "global"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    main_category TEXT NOT NULL,
+    subcategory TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_category ON entries (main_category, subcategory, date, id);
+CREATE INDEX IF NOT EXISTS idx_entries_date ON entries (date, main_category, subcategory);
+CREATE TABLE IF NOT EXISTS summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    main_category TEXT NOT NULL,
+    subcategory TEXT NOT NULL,
+    data TEXT NOT NULL,
+    has_summary INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_category ON summaries (main_category, subcategory);
+CREATE TABLE IF NOT EXISTS tracker (
+    main_category TEXT NOT NULL,
+    subcategory TEXT NOT NULL,
+    summarized_total INTEGER NOT NULL DEFAULT 0,
+    logged_total INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (main_category, subcategory)
+);
+"""
+
+
+def _has_summary(record: Dict[str, Any]) -> int:
+    return int(bool(record.get("corrected_summary") or record.get("original_summary")))
+
+
+def _nest(rows: Iterator[tuple]) -> Dict[str, Any]:
+    """Builds the nested date/category/subcategory view from ordered rows."""
+    data: Dict[str, Any] = {}
+    for date_str, main_category, subcategory, payload in rows:
+        data.setdefault(date_str, {}).setdefault(main_category, {}).setdefault(
+            subcategory, []
+        ).append(json.loads(payload))
+    return data
+
+
+def _flatten(data: Dict[str, Any]) -> Iterator[tuple]:
+    """Yields ``(date, main_category, subcategory, item)`` for every leaf of a nested view."""
+    for date_str, categories in data.items():
+        for main_category, subcats in categories.items():
+            for subcategory, items in subcats.items():
+                for item in items:
+                    yield date_str, main_category, subcategory, item
+
+
+class SQLiteStore:
+    """
+    SQLite database holding raw entries, correction summaries and tracker counts.
+
+    Each thread gets its own connection; writes run in ``BEGIN IMMEDIATE`` transactions.
+
+    Attributes:
+        db_path (Path): Path to the database file.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self.connection.executescript(_SCHEMA)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the calling thread is inside `transaction`."""
+        return getattr(self._local, "depth", 0) > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the block in one write transaction, rolled back on error.
+
+        Transactions nest per thread: an inner block joins the outermost one, so e.g. an
+        entry insert and the tracker upsert counting it commit together.
+        """
+        conn = self.connection
+        if self.in_transaction:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def close(self) -> None:
+        """Closes the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def is_empty(self) -> bool:
+        """Whether the database holds no entries, summaries or tracker rows."""
+        conn = self.connection
+        return not any(
+            conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+            for table in ("entries", "summaries", "tracker")
+        )
+
+    # ------------------------------------------------------------------
+    # Raw entries
+    # ------------------------------------------------------------------
+    def read_logs(self) -> Logs:
+        """Returns all entries as the nested date/category/subcategory view."""
+        rows = self.connection.execute(
+            "SELECT date, main_category, subcategory, data FROM entries ORDER BY id"
+        )
+        return _nest(rows)
+
+    def append_entry(
+        self, date_str: str, main_category: str, subcategory: str, entry: Dict[str, Any]
+    ) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO entries (date, main_category, subcategory, data) VALUES (?, ?, ?, ?)",
+                (date_str, main_category, subcategory, json.dumps(entry, ensure_ascii=False)),
+            )
+
+    def append_entries(self, records: List[Record]) -> None:
+        """Inserts several entries in one transaction."""
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO entries (date, main_category, subcategory, data) VALUES (?, ?, ?, ?)",
+                ((d, m, s, json.dumps(item, ensure_ascii=False)) for d, m, s, item in records),
+            )
+
+    def replace_logs(self, data: Logs) -> None:
+        """Replaces all entries with the nested view `data`."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            self._insert_entries(conn, data)
+
+    @staticmethod
+    def _insert_entries(conn: sqlite3.Connection, data: Logs) -> int:
+        cursor = conn.executemany(
+            "INSERT INTO entries (date, main_category, subcategory, data) VALUES (?, ?, ?, ?)",
+            ((d, m, s, json.dumps(item, ensure_ascii=False)) for d, m, s, item in _flatten(data)),
+        )
+        return cursor.rowcount
+
+    def unsummarized_batch(
+        self, main_category: str, subcategory: str, offset: int, batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the `batch_size` entries following the first `offset` of a subcategory,
+        ordered by date and insertion, or an empty list if fewer remain.
+        """
+        rows = self.connection.execute(
+            "SELECT data FROM entries WHERE main_category = ? AND subcategory = ? "
+            "ORDER BY date, id LIMIT ? OFFSET ?",
+            (main_category, subcategory, batch_size, offset),
+        ).fetchall()
+        if len(rows) < batch_size:
+            return []
+        return [json.loads(payload) for (payload,) in rows]
+
+    # ------------------------------------------------------------------
+    # Correction summaries
+    # ------------------------------------------------------------------
+    def read_summaries(self) -> Dict[str, Any]:
+        """Returns all summaries as the nested view of ``correction_summaries.json``."""
+        rows = self.connection.execute(
+            "SELECT date, main_category, subcategory, data FROM summaries ORDER BY id"
+        )
+        return _nest(rows)
+
+    def append_summary(
+        self,
+        main_category: str,
+        subcategory: str,
+        record: Dict[str, Any],
+        date_str: str = SUMMARY_DATE_KEY,
+    ) -> None:
+        with self.transaction() as conn:
+            self._insert_summaries(conn, [(date_str, main_category, subcategory, record)])
+
+    def append_summaries(self, rows: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """Appends ``(main_category, subcategory, record)`` summaries in one transaction."""
+        with self.transaction() as conn:
+            self._insert_summaries(conn, [(SUMMARY_DATE_KEY, m, s, r) for m, s, r in rows])
+
+    @staticmethod
+    def _insert_summaries(conn: sqlite3.Connection, rows) -> int:
+        cursor = conn.executemany(
+            "INSERT INTO summaries (date, main_category, subcategory, data, has_summary) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (d, m, s, json.dumps(record, ensure_ascii=False), _has_summary(record))
+                for d, m, s, record in rows
+            ),
+        )
+        return cursor.rowcount
+
+    def summarized_counts(self) -> Dict[str, Dict[str, int]]:
+        """Number of non-empty summaries per main category and subcategory."""
+        counts: Dict[str, Dict[str, int]] = {}
+        rows = self.connection.execute(
+            "SELECT main_category, subcategory, SUM(has_summary) FROM summaries "
+            "GROUP BY main_category, subcategory"
+        )
+        for main_category, subcategory, total in rows:
+            counts.setdefault(main_category, {})[subcategory] = int(total or 0)
+        return counts
+
+    # ------------------------------------------------------------------
+    # Tracker
+    # ------------------------------------------------------------------
+    def read_tracker(self) -> Tracker:
+        tracker: Tracker = {}
+        rows = self.connection.execute(
+            "SELECT main_category, subcategory, summarized_total, logged_total FROM tracker"
+        )
+        for main_category, subcategory, summarized, logged in rows:
+            tracker.setdefault(main_category, {})[subcategory] = {
+                "summarized_total": summarized,
+                "logged_total": logged,
+            }
+        return tracker
+
+    def update_tracker(
+        self, main_category: str, subcategory: str, summarized: int = 0, new_entries: int = 0
+    ) -> None:
+        """Atomically adds to the tracker counts of one subcategory."""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO tracker (main_category, subcategory, summarized_total, logged_total) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (main_category, subcategory) DO UPDATE SET "
+                "summarized_total = summarized_total + excluded.summarized_total, "
+                "logged_total = logged_total + excluded.logged_total",
+                (main_category, subcategory, summarized, new_entries),
+            )
+
+    def rebuild_tracker(self) -> Tracker:
+        """Recomputes every tracker row from the entries and summaries in one transaction."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM tracker")
+            conn.execute(
+                "INSERT INTO tracker (main_category, subcategory, logged_total) "
+                "SELECT main_category, subcategory, COUNT(*) FROM entries "
+                "GROUP BY main_category, subcategory"
+            )
+            conn.execute(
+                "INSERT INTO tracker (main_category, subcategory, summarized_total) "
+                "SELECT main_category, subcategory, SUM(has_summary) FROM summaries WHERE 1 "
+                "GROUP BY main_category, subcategory HAVING SUM(has_summary) > 0 "
+                "ON CONFLICT (main_category, subcategory) DO UPDATE SET "
+                "summarized_total = excluded.summarized_total"
+            )
+        return self.read_tracker()
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+    def migrate_from_json(
+        self,
+        json_log_file: Path,
+        correction_summaries_file: Path,
+        summary_tracker_file: Optional[Path] = None,
+        force: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Imports the JSON log, correction summaries and tracker files; see `migrate`.
+
+        Args:
+            json_log_file (Path): The raw log (``zephyrus_log.json``).
+            correction_summaries_file (Path): The correction summaries file.
+            summary_tracker_file (Optional[Path]): The tracker file; when missing, the tracker
+                is recomputed from the imported data.
+            force (bool): Replace existing database contents. Defaults to False.
+        """
+        return self.migrate(
+            read_json(json_log_file) if Path(json_log_file).exists() else {},
+            (
+                read_json(correction_summaries_file)
+                if Path(correction_summaries_file).exists()
+                else {}
+            ),
+            (
+                read_json(summary_tracker_file)
+                if summary_tracker_file and Path(summary_tracker_file).exists()
+                else None
+            ),
+            force=force,
+        )
+
+    def migrate(
+        self,
+        logs: Logs,
+        summaries: Dict[str, Any],
+        tracker: Optional[Tracker] = None,
+        force: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Imports a nested log, correction summaries and tracker in one transaction.
+
+        Pass the views of the current storage backend (e.g. `LogManager.read_logs`), so data
+        kept outside the JSON files, such as monthly shards, is migrated too.
+
+        Args:
+            logs (Logs): The nested raw log view.
+            summaries (Dict[str, Any]): The nested correction summaries view.
+            tracker (Optional[Tracker]): The tracker counts; when empty, the tracker is
+                recomputed from the imported data.
+            force (bool): Replace existing database contents. Defaults to False.
+
+        Returns:
+            Dict[str, int]: Number of imported ``entries``, ``summaries`` and ``tracker`` rows.
+
+        Raises:
+            ValueError: If the database already holds data and `force` is not set.
+        """
+        if not force and not self.is_empty():
+            raise ValueError(f"{self.db_path} already contains data; pass force=True to replace it")
+
+        tracker = tracker or {}
+        with self.transaction() as conn:
+            for table in ("entries", "summaries", "tracker"):
+                conn.execute(f"DELETE FROM {table}")
+            entries = self._insert_entries(conn, logs)
+            summary_rows = self._insert_summaries(conn, _flatten(summaries))
+            conn.executemany(
+                "INSERT INTO tracker (main_category, subcategory, summarized_total, logged_total) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (m, s, int(c.get("summarized_total", 0)), int(c.get("logged_total", 0)))
+                    for m, subcats in tracker.items()
+                    for s, c in subcats.items()
+                ),
+            )
+        if not tracker:
+            tracker = self.rebuild_tracker()
+        counts = {
+            "entries": entries,
+            "summaries": summary_rows,
+            "tracker": sum(len(subcats) for subcats in tracker.values()),
+        }
+        logger.info("Migrated data into %s: %s", self.db_path, counts)
+        return counts
+
+
+class SQLiteLogStorage(LogStorage):
+    """
+    LogStorage backend keeping the raw log, summaries and tracker counts in SQLite.
+
+    Attributes:
+        store (SQLiteStore): The underlying database.
+    """
+
+    stores_summaries = True
+
+    def __init__(self, store: SQLiteStore) -> None:
+        self.store = store
+
+    def read_logs(self) -> Logs:
+        return self.store.read_logs()
+
+    def append(self, date_str: str, main_category: str, subcategory: str, entry: dict) -> None:
+        self.store.append_entry(date_str, main_category, subcategory, entry)
+
+    def append_many(self, records: List[Record]) -> None:
+        self.store.append_entries(records)
+
+    def update(self, update_func: Callable[[Logs], None]) -> None:
+        data = self.store.read_logs()
+        update_func(data)
+        self.store.replace_logs(data)
+
+    def unsummarized_batch(
+        self, main_category: str, subcategory: str, offset: int, batch_size: int
+    ) -> List[Dict[str, Any]]:
+        return self.store.unsummarized_batch(main_category, subcategory, offset, batch_size)
+
+    def read_summaries(self) -> Dict[str, Any]:
+        return self.store.read_summaries()
+
+    def append_summary(self, main_category: str, subcategory: str, record: dict) -> None:
+        self.store.append_summary(main_category, subcategory, record)
+
+    def append_summaries(self, rows: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        self.store.append_summaries(rows)
+
+    def summarized_counts(self) -> Dict[str, Dict[str, int]]:
+        return self.store.summarized_counts()
+
+    def read_tracker(self) -> Tracker:
+        return self.store.read_tracker()
+
+    def update_tracker(
+        self, main_category: str, subcategory: str, summarized: int = 0, new_entries: int = 0
+    ) -> None:
+        self.store.update_tracker(main_category, subcategory, summarized, new_entries)
+
+    def rebuild_tracker(self) -> Tracker:
+        return self.store.rebuild_tracker()
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.store.in_transaction
+
+    def transaction(self) -> ContextManager[sqlite3.Connection]:
+        return self.store.transaction()
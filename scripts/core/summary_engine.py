@@ -8,15 +8,22 @@ the summarization process.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from scripts.ai.ai_summarizer import AISummarizer
+from scripts.ai.async_ai_summarizer import AsyncAISummarizer
 from scripts.core.log_manager import LogManager
 from scripts.core.summary_tracker import SummaryTracker
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 4
+
+#: ``(main_category, subcategory, entries)`` of one full batch awaiting a summary.
+PendingBatch = Tuple[str, str, List[Dict[str, Any]]]
+
 
 class SummaryEngine:
     """
@@ -34,6 +41,7 @@ class SummaryEngine:
         content_key (str): The key for content in log entries.
         timestamp_key (str): The key for timestamps in log entries.
         batch_size (int): The number of entries to process in a batch.
+        max_concurrency (int): Default number of LLM calls `summarize_all` runs at once.
     """
 
     def __init__(
@@ -45,6 +53,7 @@ class SummaryEngine:
         content_key: str,
         timestamp_key: str,
         batch_size: int,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """
         Initialize the SummaryEngine.
@@ -57,6 +66,8 @@ class SummaryEngine:
             content_key (str): The key for content in log entries.
             timestamp_key (str): The key for timestamps in log entries.
             batch_size (int): The number of entries to process in a batch.
+            max_concurrency (int, optional): Default number of LLM calls `summarize_all`
+                runs at once.
         """
         self.summarizer = summarizer
         self.log_manager = log_manager
@@ -65,6 +76,7 @@ class SummaryEngine:
         self.content_key = content_key
         self.timestamp_key = timestamp_key
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
 
     def _get_summary(self, batch_entries: List[Dict[str, Any]], subcategory: str) -> Optional[str]:
         """
@@ -89,6 +101,27 @@ class SummaryEngine:
                 return None
         return summary.strip() if summary and summary.strip() else None
 
+    def _get_summaries_async(self, pending: List[PendingBatch]) -> List[Optional[str]]:
+        """
+        Summarizes all pending batches on one event loop of the AsyncAISummarizer, whose own
+        ``llm_max_concurrency`` bounds the requests in flight.
+
+        Returns:
+            List[Optional[str]]: One summary per batch, None where summarization failed.
+        """
+        logger.info("Summarizing %d pending batches asynchronously.", len(pending))
+        try:
+            summaries = self.summarizer.summarize_entries_bulk_many(
+                [
+                    ([entry[self.content_key] for entry in batch], subcategory)
+                    for _, subcategory, batch in pending
+                ]
+            )
+        except Exception as e:
+            logger.error("AI summarization failed: %s", e, exc_info=True)
+            return [None] * len(pending)
+        return [summary.strip() if summary and summary.strip() else None for summary in summaries]
+
     def summarize(self, main_category: str, subcategory: str) -> bool:
         """
         Summarize log entries for a given main category and subcategory.
@@ -114,12 +147,24 @@ class SummaryEngine:
             logger.error("[ERROR] AI returned empty summary.")
             return False
 
+        record = self._summary_record(batch, summary)
+
+        try:
+            with self.log_manager.transaction():  # The summary and its count commit together
+                self.log_manager.update_correction_summaries(main_category, subcategory, record)
+                self.tracker.update(main_category, subcategory, summarized=self.batch_size)
+            logger.info("[SUCCESS] Summary written for %s → %s", main_category, subcategory)
+            return True
+        except Exception as e:
+            logger.error("[ERROR] Failed to save summary: %s", e, exc_info=True)
+            return False
+
+    def _summary_record(self, batch: List[Dict[str, Any]], summary: str) -> Dict[str, Any]:
+        """Builds the correction-summary record of a summarized batch."""
         start_ts = batch[0][self.timestamp_key]
         end_ts = batch[-1][self.timestamp_key]
-        label = f"{start_ts} → {end_ts}"
-
-        record = {
-            "batch": label,
+        return {
+            "batch": f"{start_ts} → {end_ts}",
             "original_summary": summary,
             "corrected_summary": "",
             "correction_timestamp": datetime.now().strftime(self.timestamp_format),
@@ -127,11 +172,78 @@ class SummaryEngine:
             "end": end_ts,
         }
 
+    def pending_batches(self) -> List[PendingBatch]:
+        """
+        Finds every full batch not summarized yet, for all subcategories in the tracker.
+
+        Returns:
+            List[PendingBatch]: The batches, in order within each subcategory.
+        """
+        if self.batch_size <= 0:
+            return []
+        pending: List[PendingBatch] = []
+        for main_category, subcategories in self.tracker.snapshot().items():
+            for subcategory in list(subcategories):
+                offset = self.tracker.get_summarized_count(main_category, subcategory)
+                while True:
+                    batch = self.log_manager.get_unsummarized_batch(
+                        main_category, subcategory, offset, self.batch_size
+                    )
+                    if len(batch) < self.batch_size:
+                        break
+                    pending.append((main_category, subcategory, batch))
+                    offset += self.batch_size
+        return pending
+
+    def summarize_all(self, max_concurrency: Optional[int] = None) -> Dict[str, int]:
+        """
+        Summarizes every pending batch, running up to `max_concurrency` LLM calls at once.
+
+        The summaries and tracker counts are committed together at the end, with one write of
+        the correction summaries and one of the tracker. Tracker counts are offsets into each
+        subcategory, so when a batch fails, the later batches of its subcategory are left for
+        the next run.
+
+        Parameters:
+            max_concurrency (Optional[int]): Concurrent LLM calls; defaults to
+                `self.max_concurrency`. An AsyncAISummarizer applies its own limit instead.
+
+        Returns:
+            Dict[str, int]: Number of batches ``summarized`` and of pending batches left
+            (``failed``).
+        """
+        pending = self.pending_batches()
+        if not pending:
+            logger.info("[SKIP] No pending batches to summarize.")
+            return {"summarized": 0, "failed": 0}
+
+        if isinstance(self.summarizer, AsyncAISummarizer):
+            summaries = self._get_summaries_async(pending)
+        else:
+            workers = max(1, min(max_concurrency or self.max_concurrency, len(pending)))
+            logger.info("Summarizing %d pending batches with %d workers.", len(pending), workers)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarize") as pool:
+                summaries = list(pool.map(lambda p: self._get_summary(p[2], p[1]), pending))
+
+        records: List[Tuple[str, str, Dict[str, Any]]] = []
+        done: Dict[Tuple[str, str], int] = {}
+        blocked = set()
+        for (main_category, subcategory, batch), summary in zip(pending, summaries):
+            key = (main_category, subcategory)
+            if key in blocked or not summary:
+                blocked.add(key)
+                continue
+            records.append((main_category, subcategory, self._summary_record(batch, summary)))
+            done[key] = done.get(key, 0) + 1
+
         try:
-            self.log_manager.update_correction_summaries(main_category, subcategory, record)
-            self.tracker.update(main_category, subcategory, summarized=self.batch_size)
-            logger.info("[SUCCESS] Summary written for %s → %s", main_category, subcategory)
-            return True
+            with self.log_manager.transaction(), self.tracker.deferred_writes():
+                self.log_manager.update_correction_summaries_many(records)
+                for (main_category, subcategory), n in done.items():
+                    self.tracker.update(main_category, subcategory, summarized=n * self.batch_size)
         except Exception as e:
-            logger.error("[ERROR] Failed to save summary: %s", e, exc_info=True)
-            return False
+            logger.error("[ERROR] Failed to save summaries: %s", e, exc_info=True)
+            return {"summarized": 0, "failed": len(pending)}
+
+        logger.info("[SUCCESS] Summarized %d of %d pending batches.", len(records), len(pending))
+        return {"summarized": len(records), "failed": len(pending) - len(records)}
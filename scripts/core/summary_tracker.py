@@ -7,6 +7,7 @@ the state of summaries. This module is essential for the Zephyrus Logger applica
 manage summaries effectively.
 
 Dependencies:
+- atexit
 - json
 - logging
 - pathlib
@@ -15,10 +16,16 @@ Dependencies:
 - scripts.indexers.raw_log_indexer
 - scripts.utils.file_utils
 - scripts.paths.ZephyrusPaths
+- scripts.core.log_manager (optional, for reading the raw log through its storage backend)
 """
 
+import atexit
 import logging
-from typing import Dict, Any, Optional, DefaultDict
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, DefaultDict, Tuple
 from collections import defaultdict
 
 from scripts.indexers.summary_indexer import SummaryIndexer
@@ -26,8 +33,13 @@ from scripts.indexers.raw_log_indexer import RawLogIndexer
 from scripts.utils.file_utils import read_json, write_json
 from scripts.paths import ZephyrusPaths
 
+if TYPE_CHECKING:
+    from scripts.core.log_manager import LogManager
+
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+
 
 class SummaryTracker:
     """
@@ -39,20 +51,79 @@ class SummaryTracker:
         tracker (Dict[str, Dict[str, Any]]): The loaded tracker data.
         summary_indexer (Optional[SummaryIndexer]): The indexer for summaries.
         raw_indexer (Optional[RawLogIndexer]): The indexer for raw logs.
+        log_manager (Optional[LogManager]): Source of the raw log and correction summaries;
+            when None the JSON files are read directly. When its storage backend keeps the
+            tracker too (SQLite), counts are read and updated there instead of in `tracker_path`.
+        write_back (bool): When True, updates only mark the tracker dirty and it is written
+            after `flush_every` updates, `flush_interval` seconds, or at interpreter exit.
     """
 
-    def __init__(self, paths: ZephyrusPaths) -> None:
+    def __init__(self, paths: ZephyrusPaths, log_manager: Optional["LogManager"] = None) -> None:
         """
         Initializes the SummaryTracker with the given paths.
 
         Args:
             paths (ZephyrusPaths): The paths configuration for the summary tracker.
+            log_manager (Optional[LogManager]): Reads the raw log through its storage
+                backend (e.g. the journal), for the tracker and the raw indexer.
         """
         self.paths = paths
+        self.log_manager = log_manager
+        storage = getattr(log_manager, "storage", None)
+        self._db = storage if getattr(storage, "stores_summaries", False) is True else None
         self.tracker_path = paths.summary_tracker_file
         self.tracker: Dict[str, Dict[str, Any]] = self._safe_load_tracker()
-        self.summary_indexer = self._safe_init_summary_indexer()
-        self.raw_indexer = self._safe_init_raw_indexer()
+        # Write-back state: unsaved updates are counted and flushed in one atomic write.
+        self.write_back, self.flush_every, self.flush_interval = self._write_back_settings()
+        self._save_lock = threading.RLock()
+        self._pending_updates = 0
+        self._deferring = 0
+        self._dirty_since: Optional[float] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        if self.write_back and self._db is None:
+            ref = weakref.ref(self)
+            atexit.register(lambda: ref() is not None and ref().flush())
+        # Indexers (and their embedding model) are created on first access.
+        self._indexer_lock = threading.Lock()
+        self._summary_indexer: Any = _UNSET
+        self._raw_indexer: Any = _UNSET
+
+    @property
+    def summary_indexer(self) -> Optional[SummaryIndexer]:
+        """The summary indexer, created on first access; its index opens on first search."""
+        if self._summary_indexer is _UNSET:
+            with self._indexer_lock:
+                if self._summary_indexer is _UNSET:
+                    self._summary_indexer = self._safe_init_summary_indexer()
+        return self._summary_indexer
+
+    @summary_indexer.setter
+    def summary_indexer(self, indexer: Optional[SummaryIndexer]) -> None:
+        self._summary_indexer = indexer
+
+    @property
+    def raw_indexer(self) -> Optional[RawLogIndexer]:
+        """The raw log indexer, created on first access; its index opens on first search."""
+        if self._raw_indexer is _UNSET:
+            with self._indexer_lock:
+                if self._raw_indexer is _UNSET:
+                    self._raw_indexer = self._safe_init_raw_indexer()
+        return self._raw_indexer
+
+    @raw_indexer.setter
+    def raw_indexer(self, indexer: Optional[RawLogIndexer]) -> None:
+        self._raw_indexer = indexer
+
+    @property
+    def open_raw_indexer(self) -> Optional[RawLogIndexer]:
+        """
+        The raw log indexer if it was created and its index is open, else None; unlike
+        `raw_indexer`, never creates the indexer or loads its index.
+        """
+        indexer = self._raw_indexer
+        if indexer is _UNSET or indexer is None or getattr(indexer, "index", None) is None:
+            return None
+        return indexer
 
     def _safe_load_tracker(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -62,6 +133,8 @@ class SummaryTracker:
             Dict[str, Dict[str, Any]]: The loaded tracker data, or an empty dictionary if loading fails.
         """
         try:
+            if self._db is not None:
+                return self._db.read_tracker()
             if self.tracker_path.exists() and self.tracker_path.stat().st_size > 0:
                 return read_json(self.tracker_path)
             else:
@@ -70,6 +143,18 @@ class SummaryTracker:
             logger.error("Failed to read tracker file: %s", e, exc_info=True)
         return {}
 
+    @staticmethod
+    def _write_back_settings() -> Tuple[bool, int, float]:
+        """Reads whether tracker writes are deferred and when deferred writes are flushed."""
+        from scripts.config.config_loader import get_effective_config, get_config_value
+
+        config = get_effective_config()
+        return (
+            bool(get_config_value(config, "tracker_write_back", False)),
+            max(1, int(get_config_value(config, "tracker_flush_every", 50))),
+            float(get_config_value(config, "tracker_flush_interval_seconds", 5.0)),
+        )
+
     def _safe_init_summary_indexer(self) -> Optional[SummaryIndexer]:
         """
         Safely initializes the SummaryIndexer.
@@ -78,7 +163,10 @@ class SummaryTracker:
             Optional[SummaryIndexer]: The initialized SummaryIndexer, or None if initialization fails.
         """
         try:
-            return SummaryIndexer(paths=self.paths)
+            indexer = SummaryIndexer(paths=self.paths)
+            if self.log_manager is not None:
+                indexer.source_reader = self.log_manager.read_correction_summaries
+            return indexer
         except Exception as e:
             logger.error("Failed to initialize SummaryIndexer: %s", e, exc_info=True)
             return None
@@ -91,7 +179,11 @@ class SummaryTracker:
             Optional[RawLogIndexer]: The initialized RawLogIndexer, or None if initialization fails.
         """
         try:
-            return RawLogIndexer(paths=self.paths)
+            indexer = RawLogIndexer(paths=self.paths)
+            if self.log_manager is not None:
+                indexer.source_reader = self.log_manager.read_logs
+                indexer.source_shards = self.log_manager.iter_log_shards
+            return indexer
         except Exception as e:
             logger.error("Failed to initialize RawLogIndexer: %s", e, exc_info=True)
             return None
@@ -107,7 +199,20 @@ class SummaryTracker:
         Returns:
             int: The summarized count.
         """
-        return self.tracker.get(main_category, {}).get(subcategory, {}).get("summarized_total", 0)
+        with self._save_lock:
+            counts = self.tracker.get(main_category, {}).get(subcategory, {})
+            return counts.get("summarized_total", 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        Returns a copy of the tracker counts, safe to iterate while other threads (e.g. the
+        background writer) keep updating the tracker.
+        """
+        with self._save_lock:
+            return {
+                main_cat: {subcat: dict(counts) for subcat, counts in subcats.items()}
+                for main_cat, subcats in self.tracker.items()
+            }
 
     def update(
         self, main_category: str, subcategory: str, summarized: int = 0, new_entries: int = 0
@@ -124,56 +229,175 @@ class SummaryTracker:
         logger.debug(
             f"Updating {main_category} → {subcategory} | Summarized: {summarized}, New: {new_entries}"
         )
-        self.tracker.setdefault(main_category, {}).setdefault(
+        with self._save_lock:
+            self._apply(main_category, subcategory, summarized, new_entries)
+            if self._db is not None:
+                try:
+                    self._db.update_tracker(main_category, subcategory, summarized, new_entries)
+                except Exception as e:
+                    logger.error("Failed to update tracker in database: %s", e, exc_info=True)
+                    if getattr(self._db, "in_transaction", False):
+                        raise  # Roll back the rows these counts belong to as well
+                return
+            self._mark_dirty()
+            if self._deferring:
+                return
+            if (
+                not self.write_back
+                or self._pending_updates >= self.flush_every
+                or time.monotonic() - self._dirty_since >= self.flush_interval
+            ):
+                self.flush()
+            elif self._flush_timer is None and self.flush_interval > 0:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    @contextmanager
+    def deferred_writes(self) -> Iterator[None]:
+        """
+        Holds back the tracker file writes of updates made inside the block and flushes them
+        in one write when the outermost block exits.
+        """
+        with self._save_lock:
+            self._deferring += 1
+            try:
+                yield
+            finally:
+                self._deferring -= 1
+                if not self._deferring:
+                    self.flush()
+
+    def _apply(
+        self, main_category: str, subcategory: str, summarized: int, new_entries: int
+    ) -> None:
+        """Adds the counts to the in-memory tracker without persisting them."""
+        counts = self.tracker.setdefault(main_category, {}).setdefault(
             subcategory, {"summarized_total": 0, "logged_total": 0}
         )
-        self.tracker[main_category][subcategory]["summarized_total"] += summarized
-        self.tracker[main_category][subcategory]["logged_total"] += new_entries
-        self._save()
+        counts["summarized_total"] += summarized
+        counts["logged_total"] += new_entries
+
+    def _mark_dirty(self) -> None:
+        self._pending_updates += 1
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the in-memory tracker has updates not yet written to `tracker_path`."""
+        return self._pending_updates > 0
+
+    def flush(self) -> None:
+        """
+        Writes pending tracker updates to the tracker file, if there are any.
+
+        The file is replaced atomically (temp file + rename), so readers never see a
+        partially written tracker. Counts kept in the database are never flushed here.
+        """
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._db is not None or not self.dirty:
+                return
+            try:
+                self._save()
+            except Exception as e:
+                logger.error("Failed to write tracker to disk: %s", e, exc_info=True)
+                return
+            self._pending_updates = 0
+            self._dirty_since = None
 
     def _save(self) -> None:
         """
-        Saves the tracker data to the tracker file.
+        Saves the tracker data to the tracker file (atomically, see `write_json`).
         """
-        try:
-            write_json(self.tracker_path, self.tracker)
-        except Exception as e:
-            logger.error("Failed to write tracker to disk: %s", e, exc_info=True)
+        write_json(self.tracker_path, self.tracker, indent=None)
 
-    def rebuild(self) -> None:
+    def rebuild(self, full_reindex: bool = False, refresh_indexes: bool = True) -> None:
         """
         Rebuilds the tracker by clearing the current data and re-counting the logged and summarized entries.
+
+        The FAISS indexes are brought up to date incrementally (only entries added since
+        their last build are embedded) unless `full_reindex` is set.
+
+        Args:
+            full_reindex (bool, optional): Rebuild both indexes from scratch. Defaults to False.
+            refresh_indexes (bool, optional): Bring the FAISS indexes up to date as well.
+                When False, each index catches up lazily on its first search. Defaults to True.
+        """
+        with self._save_lock:
+            self._recount()
+        if not refresh_indexes:
+            return
+        if self.summary_indexer:
+            if full_reindex:
+                self.summary_indexer.rebuild()
+            else:
+                self.summary_indexer.update_index()
+        if self.raw_indexer:
+            if full_reindex:
+                self.raw_indexer.rebuild()
+            else:
+                self.raw_indexer.update_index()
+
+    def _recount(self) -> None:
+        """
+        Replaces the tracker with fresh counts, written once at the end rather than per
+        subcategory.
         """
         self.tracker.clear()
 
-        raw_logs_data = read_json(self.paths.json_log_file)
-        summaries_data = read_json(self.paths.correction_summaries_file)
+        if self._db is not None:
+            # Counted by indexed GROUP BY queries and replaced in one transaction.
+            self.tracker.update(self._db.rebuild_tracker())
+        else:
+            raw_logs_data = (
+                self.log_manager.read_logs()
+                if self.log_manager is not None
+                else read_json(self.paths.json_log_file, use_cache=True)
+            )
+
+            # === Count Logged ===
+            for date, categories in raw_logs_data.items():
+                for main_cat, subcats in categories.items():
+                    for subcat, entries in subcats.items():
+                        self._apply(main_cat, subcat, 0, len(entries))
 
-        # === Count Logged ===
-        for date, categories in raw_logs_data.items():
-            for main_cat, subcats in categories.items():
-                for subcat, entries in subcats.items():
-                    self.update(main_cat, subcat, new_entries=len(entries))
+            # === Count Summarized ===
+            for main_cat, subcats in self._summarized_counts().items():
+                for subcat, summarized in subcats.items():
+                    if summarized:
+                        self._apply(main_cat, subcat, summarized, 0)
+
+            self._mark_dirty()
+            self.flush()
+
+    def _summarized_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Counts the non-empty correction summaries per main category and subcategory.
 
-        # === Count Summarized ===
-        summarized_counts: DefaultDict[str, DefaultDict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
+        Uses an indexed query when the summaries live in the database, otherwise scans the
+        correction summaries (read through the log manager when one is set).
+        """
+        if self._db is not None:
+            return self._db.summarized_counts()
+        data = (
+            self.log_manager.read_correction_summaries()
+            if self.log_manager is not None
+            else read_json(self.paths.correction_summaries_file, use_cache=True)
         )
-        for date, categories in summaries_data.items():
+        counts: DefaultDict[str, DefaultDict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for date, categories in data.items():
             for main_cat, subcats in categories.items():
                 for subcat, summaries in subcats.items():
-                    for summary in summaries:
-                        if summary.get("corrected_summary") or summary.get("original_summary"):
-                            summarized_counts[main_cat][subcat] += 1
-
-        for main_cat, subcats in summarized_counts.items():
-            for subcat, summarized in subcats.items():
-                self.update(main_cat, subcat, summarized=summarized)
-
-        if self.summary_indexer:
-            self.summary_indexer.rebuild()
-        if self.raw_indexer:
-            self.raw_indexer.rebuild()
+                    counts[main_cat][subcat] += sum(
+                        1
+                        for summary in summaries
+                        if summary.get("corrected_summary") or summary.get("original_summary")
+                    )
+        return counts
 
     def validate(self, verbose: bool = False) -> bool:
         """
@@ -190,32 +414,25 @@ class SummaryTracker:
             return False
 
         try:
-            data = read_json(self.paths.correction_summaries_file)
             valid = True
 
-            for date, categories in data.items():
-                for main_cat, subcats in categories.items():
-                    for subcat, batches in subcats.items():
-                        expected = sum(
-                            1
-                            for batch in batches
-                            if batch.get("corrected_summary") or batch.get("original_summary")
+            for main_cat, subcats in self._summarized_counts().items():
+                for subcat, expected in subcats.items():
+                    actual = self.get_summarized_count(main_cat, subcat)
+
+                    if expected != actual:
+                        logger.warning(
+                            "[VALIDATION] ❌ Mismatch in %s → %s | tracker=%d vs actual=%d",
+                            main_cat,
+                            subcat,
+                            actual,
+                            expected,
+                        )
+                        valid = False
+                    elif verbose:
+                        logger.info(
+                            "[VALIDATION] ✅ %s → %s | tracker=%d", main_cat, subcat, actual
                         )
-                        actual = self.get_summarized_count(main_cat, subcat)
-
-                        if expected != actual:
-                            logger.warning(
-                                "[VALIDATION] ❌ Mismatch in %s → %s | tracker=%d vs actual=%d",
-                                main_cat,
-                                subcat,
-                                actual,
-                                expected,
-                            )
-                            valid = False
-                        elif verbose:
-                            logger.info(
-                                "[VALIDATION] ✅ %s → %s | tracker=%d", main_cat, subcat, actual
-                            )
 
             if valid:
                 logger.info("[VALIDATION] ✅ All tracker counts match correction summaries.")
@@ -245,7 +462,7 @@ class SummaryTracker:
         batch_size = int(get_config_value(config, "batch_size", 5))
 
         data = []
-        for main_cat, subcats in self.tracker.items():
+        for main_cat, subcats in self.snapshot().items():
             for subcat, counts in subcats.items():
                 logged = counts.get("logged_total", 0)
                 summarized_batches = counts.get("summarized_total", 0)
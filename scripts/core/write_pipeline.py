@@ -0,0 +1,158 @@
+"""
+write_pipeline.py
+
+This module provides WritePipeline, the background writer behind
+``ZephyrusLoggerCore.save_entry_async``.
+
+Core features include:
+- Submitting returns a Future at once; the caller (e.g. the Tk main loop) never waits on disk.
+- A single worker thread drains the queue in submission order and hands every burst to one
+  commit call, so a burst costs one write per target file instead of one per entry.
+- A Future resolves only after its entry's commit returned, and commits run in submission
+  order, so an acknowledged entry is durable together with everything submitted before it.
+- `flush` waits for everything submitted so far; `close` (also run at interpreter exit)
+  flushes and stops the worker.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BATCH = 500
+DEFAULT_LINGER_SECONDS = 0.005
+
+_BARRIER = object()
+_STOP = object()
+
+
+class WritePipeline(Generic[T]):
+    """
+    Queue plus worker thread that commits submitted items in batches.
+
+    Attributes:
+        max_batch (int): Most items handed to one commit call.
+        linger_seconds (float): How long the worker waits for more items after the first one
+            of a batch arrives.
+        stats (Dict[str, int]): Number of ``items`` committed and commit ``batches`` made.
+    """
+
+    def __init__(
+        self,
+        commit: Callable[[List[T]], List[Any]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        linger_seconds: float = DEFAULT_LINGER_SECONDS,
+        name: str = "zephyrus-writer",
+    ) -> None:
+        """
+        Starts the worker thread.
+
+        Args:
+            commit (Callable[[List[T]], List[Any]]): Durably writes a batch of items and returns
+                one result per item. If it raises, every Future of the batch gets the exception.
+            max_batch (int, optional): Most items per commit call.
+            linger_seconds (float, optional): Time to wait for more items before committing.
+            name (str, optional): Name of the worker thread.
+        """
+        self._commit = commit
+        self.max_batch = max(1, int(max_batch))
+        self.linger_seconds = max(0.0, float(linger_seconds))
+        self.stats: Dict[str, int] = {"items": 0, "batches": 0}
+        self._queue: "queue.Queue[Tuple[Any, Optional[Future]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        ref = weakref.ref(self)
+        atexit.register(lambda: ref() is not None and ref().close())
+
+    def submit(self, item: T) -> "Future[Any]":
+        """
+        Queues `item` for the next commit.
+
+        Returns:
+            Future: Resolves to the commit's result for `item` once it is written.
+
+        Raises:
+            RuntimeError: If the pipeline was closed.
+        """
+        future: "Future[Any]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write pipeline is closed.")
+            self._queue.put((item, future))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every item submitted before the call has been committed.
+
+        Returns:
+            bool: False if `timeout` expired first (or the pipeline is closed), True otherwise.
+        """
+        try:
+            barrier = self.submit(_BARRIER)  # type: ignore[arg-type]
+        except RuntimeError:
+            return False
+        try:
+            barrier.result(timeout)
+        except FutureTimeoutError:
+            return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Commits everything still queued and stops the worker; later submits fail."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put((_STOP, None))
+        self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.linger_seconds
+            while len(batch) < self.max_batch and batch[-1][0] is not _STOP:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+            stop = batch[-1][0] is _STOP
+            self._process([(item, future) for item, future in batch if item is not _STOP])
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[Any, Future]]) -> None:
+        work = [(item, future) for item, future in batch if item is not _BARRIER]
+        if work:
+            try:
+                results = self._commit([item for item, _ in work])
+            except Exception as e:
+                logger.error("Write pipeline commit failed: %s", e, exc_info=True)
+                for _, future in work:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(work, results):
+                    future.set_result(result)
+            self.stats["items"] += len(work)
+            self.stats["batches"] += 1
+        for item, future in batch:
+            if item is _BARRIER:
+                future.set_result(True)
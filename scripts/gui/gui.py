@@ -9,6 +9,7 @@ user interactions, and integrates logging functionality.
 import tkinter as tk
 from tkinter import simpledialog, scrolledtext
 import logging
+from concurrent.futures import Future
 
 from scripts.config.config_loader import load_config, get_config_value
 from scripts.gui.gui_logging import GUILogHandler
@@ -219,15 +220,31 @@ class ZephyrusLoggerGUI:
         text = self.entry_box.get("1.0", tk.END).strip()
         if text:
             try:
-                result = self.controller.log_entry(main, sub, text)
-                gui_helpers.display_message("Logged", f"Entry logged successfully: {result}")
-                self.entry_box.delete("1.0", tk.END)
-                self._update_coverage_display()
+                future = self.controller.log_entry_async(main, sub, text)
             except Exception as e:
                 gui_helpers.display_error("Logging Error", str(e))
+                return
+            self.entry_box.delete("1.0", tk.END)
+            self._await_log_result(future)
         else:
             gui_helpers.display_error("Error", "No text entered.")
 
+    def _await_log_result(self, future: Future) -> None:
+        """
+        Reports a queued entry once the background writer has saved it.
+
+        Polls from the Tk main loop, so the window stays responsive while the entry is written.
+        """
+        if not future.done():
+            self.root.after(50, self._await_log_result, future)
+            return
+        try:
+            result = future.result()
+            gui_helpers.display_message("Logged", f"Entry logged successfully: {result}")
+            self._update_coverage_display()
+        except Exception as e:
+            gui_helpers.display_error("Logging Error", str(e))
+
     def _manual_summarize(self) -> None:
         """
         Manually summarize the logs.
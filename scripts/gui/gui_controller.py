@@ -13,6 +13,8 @@ Dependencies:
 
 import os
 import logging
+import threading
+from concurrent.futures import Future
 from typing import Optional, Any
 from scripts.core.core import ZephyrusLoggerCore
 
@@ -64,6 +66,20 @@ class GUIController:
         except Exception as e:
             raise e
 
+    def log_entry_async(self, main: str, sub: str, text: str) -> "Future[bool]":
+        """
+        Queues an entry with the core's background writer and returns immediately.
+
+        Args:
+            main (str): The main category of the log entry.
+            sub (str): The subcategory of the log entry.
+            text (str): The text content of the log entry.
+
+        Returns:
+            Future[bool]: Resolves to the logging result once the entry is written.
+        """
+        return self.core.save_entry_async(main, sub, text)
+
     def force_summarize_all(self) -> Any:
         """
         Forces the summarization of all logs.
@@ -76,6 +92,27 @@ class GUIController:
         except Exception as e:
             raise e
 
+    def force_summarize_all_async(self) -> "Future[Any]":
+        """
+        Runs `force_summarize_all` on a background thread and returns immediately, so the
+        Tk main loop stays responsive while the backlog is summarized.
+
+        Returns:
+            Future[Any]: Resolves to the summarization result, or to its exception.
+        """
+        future: "Future[Any]" = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.force_summarize_all())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="zephyrus-summarize-all", daemon=True).start()
+        return future
+
     def search_summaries(self, query: str) -> Any:
         """
         Searches for summaries matching the given query.
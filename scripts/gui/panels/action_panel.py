@@ -9,6 +9,7 @@ Core features include:
 """
 
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk
 from typing import Optional
 
@@ -67,10 +68,22 @@ class ActionPanel(BasePanel):
         """
         Trigger the controller's summarize function if available.
 
+        Runs in the background when the controller offers `force_summarize_all_async`; the
+        button stays disabled until the result arrives.
+
         Returns:
             None
         """
-        if self.controller and hasattr(self.controller, "force_summarize_all"):
+        if self.controller and hasattr(self.controller, "force_summarize_all_async"):
+            try:
+                future = self.controller.force_summarize_all_async()
+            except Exception as e:
+                print("Error during summarization:", e)
+                return
+            if self.summarize_button is not None:
+                self.summarize_button.config(state=tk.DISABLED)
+            self._await_summary(future)
+        elif self.controller and hasattr(self.controller, "force_summarize_all"):
             try:
                 result = self.controller.force_summarize_all()
                 print("Summary generated:", result)
@@ -79,6 +92,20 @@ class ActionPanel(BasePanel):
         else:
             print("Summarize action not available.")
 
+    def _await_summary(self, future: Future) -> None:
+        """
+        Reports the background summarization once it finished, polling from the Tk main loop.
+        """
+        if not future.done():
+            self.after(50, self._await_summary, future)
+            return
+        if self.summarize_button is not None:
+            self.summarize_button.config(state=tk.NORMAL)
+        try:
+            print("Summary generated:", future.result())
+        except Exception as e:
+            print("Error during summarization:", e)
+
     def on_rebuild(self) -> None:
         """
         Trigger the controller's rebuild_tracker function if available.
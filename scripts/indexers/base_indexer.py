@@ -6,25 +6,130 @@ This module defines the BaseIndexer class, which provides core functionality for
 Core features include:
 - Initializing index and metadata paths based on project configuration and index type (summary or raw).
 - Building a FAISS index from text data using SentenceTransformer embeddings.
-- Saving and loading both the FAISS index and associated metadata.
+- Streaming builds that encode the source in batches on a thread pool with bounded memory.
+- Choosing the FAISS index type (exact flat, IVF-Flat, IVF-PQ or HNSW) from configuration.
+- Reusing embeddings of unchanged texts through a persistent, content-addressed embedding cache.
+- Saving and loading both the FAISS index and associated metadata (a memory-mapped columnar store).
+- Opening persisted indexes lazily on first search, memory-mapped where FAISS supports it.
+- Incremental, append-only updates driven by a per-date/category/subcategory high-water mark.
+- Deferred persistence of appended entries: the index files are rewritten after
+  ``index_flush_every`` appends, ``index_flush_interval_seconds`` or at interpreter exit,
+  never once per saved entry.
 - Performing semantic search over indexed data, returning the most relevant results with similarity scores.
+- Batched multi-query search that embeds all queries in one model call and one FAISS search.
+- Metadata-filtered search (category, subcategory, date range) restricted to the matching vectors.
+- A per-indexer reentrant lock around search, load, add, update and save, so a background
+  writer (see `ZephyrusLoggerCore.save_entry_async`) never swaps the index under a search.
 - Supporting flexible configuration and robust error handling for index operations.
 
 Intended for use as a base class for specialized indexers in the Zephyrus project, enabling fast and flexible semantic search over structured logs and summaries.
 """
 
-from typing import List, Dict, Any
+import atexit
+import functools
+import json
+import math
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Sequence, Set, Tuple
 import pickle
 import faiss
-from scripts.config.config_loader import get_config_value
-from scripts.config.config_manager import ConfigManager
+import numpy as np
+from scripts.config.config_loader import get_config_value, get_effective_config
 import logging
+from scripts.indexers.embedding_cache import (
+    DEFAULT_MAX_ENTRIES,
+    EmbeddingCache,
+    get_embedding_cache,
+)
+from scripts.indexers.embedding_models import get_embedding_model, warm_up as warm_up_model
+from scripts.indexers.embedding_pipeline import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_MEMORY_MB,
+    chunked,
+    encode_batches,
+    max_rows_in_memory,
+    resolve_workers,
+)
+from scripts.indexers.index_factory import (
+    benchmark_index,
+    configure_search,
+    create_index,
+    resolve_params,
+)
+from scripts.indexers.metadata_store import (
+    ColumnarMetadata,
+    select_rows,
+    store_exists,
+    validate_filters,
+)
 from scripts.paths import ZephyrusPaths
+from scripts.utils.file_utils import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
+# Zero-copy mapping of the stored vectors/codes; older FAISS builds only know IO_FLAG_MMAP.
+_MMAP_FLAG = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+
+# Filter selections cached per indexer, and the largest subset searched exactly on
+# approximate indexes (beyond it, the index's own search is restricted instead).
+_SELECTION_CACHE_SIZE = 64
+_EXACT_SUBSET_MAX = 50_000
+
+
+#: Nested ``{date: {main_category: {subcategory: count}}}`` high-water mark.
+Watermark = Dict[str, Dict[str, Dict[str, int]]]
+
+#: Build progress callback, called as ``progress(indexed, total)``; total may be None.
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+def locked(method: Callable) -> Callable:
+    """Runs an indexer method while holding the indexer's `lock`."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class BaseIndexer:
+    watermark: Watermark
+    embedding_model_name: str = DEFAULT_EMBEDDING_MODEL
+    embedding_cache: Optional[EmbeddingCache] = None
+    _embedding_cache_resolved: bool = False
+    _embedding_model: Any = None
+    #: Recall/latency of the last approximate build versus an exact flat baseline.
+    index_report: Optional[Dict[str, float]] = None
+    #: Open the persisted index on first use (see `ensure_loaded`).
+    autoload: bool = True
+    #: Whether `index` is a read-only memory-mapped view of the index file.
+    index_mmapped: bool = False
+    _load_attempted: bool = False
+    _metadata: Sequence[Dict[str, Any]] = ()
+    #: Bumped whenever `metadata` is replaced or extended; stamps the filter selection cache.
+    _metadata_generation: int = 0
+    _selection_stamp: Optional[int] = None
+    #: Appends not yet written to the index files (see `flush`).
+    _pending_appends: int = 0
+    _flush_timer: Optional[threading.Timer] = None
+    _selection_cache: Dict[str, np.ndarray]
+    #: Reads the nested source through its storage backend (e.g. `LogManager.read_logs`);
+    #: None reads the source JSON file directly.
+    source_reader: Optional[Callable[[], Dict[str, Any]]] = None
+    #: Yields the source in consecutive ``(counts, reader)`` parts (e.g.
+    #: `LogManager.iter_log_shards`), so builds read one shard at a time and incremental
+    #: updates skip shards whose counts match the high-water mark; None reads it whole.
+    source_shards: Optional[
+        Callable[[], Iterable[Tuple[Optional[Watermark], Callable[[], Dict[str, Any]]]]]
+    ] = None
+
     def __init__(self, paths: ZephyrusPaths, index_name: str) -> None:
         """
         Initializes the BaseIndexer object.
@@ -35,8 +140,9 @@ class BaseIndexer:
         If `index_name` is "raw", the paths are set to the JSON log file, raw log index file,
         and raw log metadata file.  In all other cases, a ValueError is raised.
 
-        Also, loads the SentenceTransformer model specified by the "embedding_model"
-        configuration key, or defaults to "all-MiniLM-L6-v2" if the key is missing.
+        Also, resolves the SentenceTransformer model specified by the "embedding_model"
+        configuration key, or defaults to "all-MiniLM-L6-v2" if the key is missing. The model
+        itself is loaded on first use and shared with every other indexer using it.
 
         Args:
             paths (ZephyrusPaths): The paths configuration for the indexer.
@@ -56,53 +162,273 @@ class BaseIndexer:
         else:
             raise ValueError(f"Unsupported index_name: {index_name}")
 
-        model_name = get_config_value(
-            ConfigManager.load_config(), "embedding_model", "all-MiniLM-L6-v2"
+        self.embedding_model_name = get_config_value(
+            get_effective_config(), "embedding_model", DEFAULT_EMBEDDING_MODEL
         )
-        self.embedding_model = self._load_model()
         self.index = None
-        self.metadata: List[Dict[str, Any]] = []
+        self.metadata = []
+        self.watermark = {}
+        self._selection_cache = {}
+        ref = weakref.ref(self)
+        atexit.register(lambda: ref() is not None and ref().flush())
 
-    def _load_model(self):
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError:
-            raise ImportError("sentence-transformers is not installed.")
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        Reentrant lock guarding `index`, `metadata` and `watermark`; created on first use so
+        indexers built without ``__init__`` (e.g. test stubs) have one too.
+        """
+        lock = self.__dict__.get("_lock")
+        if lock is None:
+            lock = self.__dict__.setdefault("_lock", threading.RLock())
+        return lock
+
+    @property
+    def metadata(self) -> Sequence[Dict[str, Any]]:
+        """Metadata row per indexed vector; a list, or a `ColumnarMetadata` store."""
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, rows: Sequence[Dict[str, Any]]) -> None:
+        self._metadata = rows
+        self._metadata_generation += 1
+
+    @property
+    def embedding_model(self) -> Any:
+        """
+        The embedding model, shared process-wide through `embedding_models`.
+
+        Loaded on first use rather than in the constructor; assigning a model (e.g. a test
+        double) overrides the shared instance for this indexer only.
+        """
+        if self._embedding_model is None:
+            return get_embedding_model(self.embedding_model_name)
+        return self._embedding_model
+
+    @embedding_model.setter
+    def embedding_model(self, model: Any) -> None:
+        self._embedding_model = model
+
+    def _load_model(self) -> Any:
+        """Returns the shared model instance for the configured `embedding_model`."""
+        return get_embedding_model(self.embedding_model_name)
+
+    def warm_up(self) -> bool:
+        """Loads the embedding model ahead of the first encode."""
+        return warm_up_model(self.embedding_model_name)
+
+    def _get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """
+        Returns the embedding cache shared by all indexers of this vector store.
+
+        The cache lives next to the FAISS files and is keyed by embedding model, so a
+        change of ``embedding_model`` in config invalidates it. Returns None when
+        ``embedding_cache_enabled`` is false.
+        """
+        if not self._embedding_cache_resolved:
+            config = get_effective_config()
+            if get_config_value(config, "embedding_cache_enabled", True):
+                max_entries = int(
+                    get_config_value(config, "embedding_cache_max_entries", DEFAULT_MAX_ENTRIES)
+                )
+                self.embedding_cache = get_embedding_cache(
+                    Path(self.index_path).parent, self.embedding_model_name, max_entries
+                )
+            self._embedding_cache_resolved = True
+        return self.embedding_cache
+
+    def _encode(self, texts: List[str], store: bool = True) -> np.ndarray:
+        """
+        Embeds `texts`, consulting the embedding cache so only unseen texts hit the model.
+
+        Args:
+            texts (List[str]): Texts to embed.
+            store (bool, optional): Cache the newly encoded vectors; False for search queries.
+
+        Returns:
+            np.ndarray: A ``(len(texts), dim)`` float32 matrix.
+        """
+        cache = self._get_embedding_cache()
+        if cache is None:
+            return self.embedding_model.encode(texts, convert_to_numpy=True)
+        return cache.encode(texts, self.embedding_model, store=store)
+
+    @staticmethod
+    def _index_settings() -> Tuple[str, Dict[str, Any], bool]:
+        """
+        Reads the FAISS index configuration.
+
+        Returns:
+            Tuple[str, Dict[str, Any], bool]: The ``faiss_index_type``, the
+            ``faiss_index_params`` overrides and whether to benchmark approximate builds
+            against a flat baseline (``faiss_report_on_build``).
+        """
+        config = get_effective_config()
+        index_type = get_config_value(config, "faiss_index_type", "flat")
+        params = get_config_value(config, "faiss_index_params", {}) or {}
+        report = bool(get_config_value(config, "faiss_report_on_build", False))
+        return index_type, params, report
+
+    @staticmethod
+    def _flush_settings() -> Tuple[int, float]:
+        """
+        Reads when appended entries are persisted: after ``index_flush_every`` appends or
+        ``index_flush_interval_seconds`` after the first unsaved one (0 saves every append).
+        """
+        config = get_effective_config()
+        flush_every = max(1, int(get_config_value(config, "index_flush_every", 100)))
+        interval = float(get_config_value(config, "index_flush_interval_seconds", 30.0))
+        return flush_every, interval
 
-        model_name = get_config_value(
-            ConfigManager.load_config(), "embedding_model", "all-MiniLM-L6-v2"
+    @staticmethod
+    def _build_settings() -> Tuple[int, int, float]:
+        """
+        Reads the build pipeline configuration.
+
+        Returns:
+            Tuple[int, int, float]: ``embedding_batch_size``, the number of encoding threads
+            (``embedding_workers``; 0 means one per CPU core) and
+            ``index_build_max_memory_mb``.
+        """
+        config = get_effective_config()
+        batch_size = int(get_config_value(config, "embedding_batch_size", DEFAULT_BATCH_SIZE))
+        workers = resolve_workers(get_config_value(config, "embedding_workers", 0))
+        max_memory_mb = float(
+            get_config_value(config, "index_build_max_memory_mb", DEFAULT_MAX_MEMORY_MB)
         )
-        return SentenceTransformer(model_name)
+        return max(1, batch_size), workers, max_memory_mb
+
+    def _create_index(self, embeddings: np.ndarray) -> faiss.Index:
+        """Creates (and trains, if needed) an empty index of the configured type."""
+        index_type, params, _ = self._index_settings()
+        return create_index(embeddings, index_type, params)
+
+    def _report_index_quality(self, embeddings: np.ndarray) -> None:
+        """Logs recall@k and latency of an approximate index versus exact search."""
+        self.index_report = None
+        if isinstance(self.index, faiss.IndexFlat):
+            return
+        _, _, report = self._index_settings()
+        if not report:
+            return
+        try:
+            self.index_report = benchmark_index(self.index, embeddings)
+            logger.info(
+                "%s: recall@%d=%.3f, %.3f ms/query (flat: %.3f ms/query)",
+                self.index_path,
+                int(self.index_report["top_k"]),
+                self.index_report["recall_at_k"],
+                self.index_report["latency_ms"],
+                self.index_report["flat_latency_ms"],
+            )
+        except Exception as e:
+            logger.warning("Index benchmark failed: %s", e)
+
+    @property
+    def metadata_store_path(self) -> Path:
+        """Directory of the columnar metadata store (``<metadata stem>.cols``)."""
+        metadata_path = Path(self.metadata_path)
+        return metadata_path.with_name(f"{metadata_path.stem}.cols")
 
+    def _metadata_exists(self) -> bool:
+        return store_exists(self.metadata_store_path) or Path(self.metadata_path).exists()
+
+    def _load_metadata(self) -> Sequence[Dict[str, Any]]:
+        """Opens the columnar metadata store, falling back to a legacy pickle sidecar."""
+        if store_exists(self.metadata_store_path):
+            return ColumnarMetadata.load(self.metadata_store_path)
+        logger.info("Reading legacy pickled metadata from %s.", self.metadata_path)
+        with open(self.metadata_path, "rb") as f:
+            return pickle.load(f)
+
+    @locked
     def load_index(self) -> None:
         """
         Loads the FAISS index and associated metadata from their respective files.
 
-        This method reads the index from the file specified by `self.index_path` and loads
-        the metadata from the file specified by `self.metadata_path`. If either file does not
-        exist, a FileNotFoundError is raised.
+        This method memory-maps the index from the file specified by `self.index_path`
+        (falling back to a full read where the index type does not support it) and opens
+        the columnar metadata store next to `self.metadata_path` (memory-mapped, so this does
+        not scale with the number of entries). Indexes saved before the columnar store existed
+        are read from the legacy pickle at `self.metadata_path`. If either is missing, a
+        FileNotFoundError is raised.
 
         Raises:
             FileNotFoundError: If the index file or metadata file is not found.
         """
-        if not self.index_path.exists() or not self.metadata_path.exists():
-            raise FileNotFoundError("FAISS index or metadata file not found.")
-        self.index = faiss.read_index(str(self.index_path))
-        with open(self.metadata_path, "rb") as f:
-            self.metadata = pickle.load(f)
-        if not self.index_path.exists() or not self.metadata_path.exists():
+        if not self.index_path.exists() or not self._metadata_exists():
             raise FileNotFoundError("FAISS index or metadata file not found.")
-        self.index = faiss.read_index(str(self.index_path))
-        with open(self.metadata_path, "rb") as f:
-            self.metadata = pickle.load(f)
+        self.index, self.index_mmapped = self._read_index(mmap=True)
+        self.metadata = self._load_metadata()
+        self.watermark = self._load_watermark()
+        self._load_attempted = True
+
+    def _read_index(self, mmap: bool) -> Tuple[faiss.Index, bool]:
+        """
+        Reads the FAISS index file, memory-mapping it when requested and supported.
+
+        Returns:
+            Tuple[faiss.Index, bool]: The index and whether it is memory-mapped.
+        """
+        index, mmapped = None, False
+        if mmap:
+            try:
+                index = faiss.read_index(str(self.index_path), _MMAP_FLAG)
+                mmapped = True
+            except Exception as e:
+                logger.debug(
+                    "Memory-mapped read of %s failed (%s); reading it fully.", self.index_path, e
+                )
+        if index is None:
+            index = faiss.read_index(str(self.index_path))
+        configure_search(index, self._index_settings()[1])
+        return index, mmapped
+
+    def _ensure_writable(self) -> None:
+        """
+        Replaces a memory-mapped index with an in-memory copy before it is modified.
+
+        Memory-mapped indexes are read-only views of the file; adding vectors to them
+        is not supported by FAISS.
+        """
+        if self.index is not None and self.index_mmapped:
+            self.index, self.index_mmapped = self._read_index(mmap=False)
+
+    @locked
+    def ensure_loaded(self) -> bool:
+        """
+        Opens the index on first use when `autoload` is enabled.
+
+        Indexes are no longer read in the constructor, so creating an indexer is cheap and
+        sessions that never search never pay for index I/O. On first use the persisted index
+        is opened (memory-mapped) and caught up with entries added since it was saved, or
+        built if it does not exist yet. This is only attempted once per indexer.
+
+        Returns:
+            bool: True if an index is available.
+        """
+        if self.index is None and self.autoload and not self._load_attempted:
+            self._load_attempted = True
+            try:
+                if self.update_index():
+                    logger.info("Opened FAISS index %s on first use.", self.index_path)
+            except Exception as e:
+                logger.error("Failed to open FAISS index %s: %s", self.index_path, e, exc_info=True)
+        return self.index is not None
 
-    def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def search(
+        self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Searches the FAISS index for the given query and returns the top-k most relevant results.
 
         Args:
             query (str): The search query.
             top_k (int, optional): The number of top results to return. Defaults to 5.
+            filters (Optional[Dict[str, Any]], optional): Restricts results to entries matching
+                ``main_category``, ``subcategory`` (a value or a collection of values) and an
+                inclusive ``date_from``/``date_to`` window (``YYYY-MM-DD``). Filtering happens
+                inside the index search, so the top-k are the best *matching* entries.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries containing the search results. Each dictionary includes the
@@ -114,23 +440,148 @@ class BaseIndexer:
             - "timestamp"
             - "similarity" (the similarity score, computed as 1.0 / (1.0 + distance))
         """
-        if self.index is None:
-            logger.error("Search attempted before index was loaded!")
+        return self.search_many([query], top_k=top_k, filters=filters)[0]
+
+    @locked
+    def search_many(
+        self, queries: List[str], top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Searches the FAISS index for several queries at once.
+
+        All queries are embedded in one batched call and looked up with a single FAISS
+        search over the query matrix, which is far cheaper than calling `search` in a loop.
+
+        Args:
+            queries (List[str]): The search queries.
+            top_k (int, optional): The number of results per query. Defaults to 5.
+            filters (Optional[Dict[str, Any]], optional): Metadata filters applied to every
+                query; see `search`.
+
+        Returns:
+            List[List[Dict[str, Any]]]: One result list per query, in input order, each
+            shaped like the result of `search`. Every list is empty if the search fails.
+        """
+        queries = list(queries)
+        hits = self.search_ids(queries, top_k=top_k, filters=filters)
+        return [self.rows_for(query_hits) for query_hits in hits]
+
+    @locked
+    def search_ids(
+        self, queries: List[str], top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Vector search returning raw hits instead of metadata rows.
+
+        Args:
+            queries (List[str]): The search queries.
+            top_k (int, optional): The number of hits per query. Defaults to 5.
+            filters (Optional[Dict[str, Any]], optional): Metadata filters; see `search`.
+
+        Returns:
+            List[List[Tuple[int, float]]]: ``(row id, similarity)`` pairs per query, best
+            first. Row ids index into `metadata`. Every list is empty if the search fails.
+
+        Raises:
+            ValueError: If `filters` contains an unsupported key.
+        """
+        queries = list(queries)
+        if not queries:
             return []
+        if filters:
+            validate_filters(filters)
+        if not self.ensure_loaded():
+            logger.error("Search attempted before index was loaded!")
+            return [[] for _ in queries]
+
+        candidates = self.candidate_ids(filters) if filters else None
+        if candidates is not None and not len(candidates):
+            return [[] for _ in queries]
 
         try:
-            embedding = self.embedding_model.encode([query], convert_to_numpy=True)
-            D, I = self.index.search(embedding, top_k)
+            embeddings = self._encode(queries, store=False)
+            if candidates is None:
+                D, I = self.index.search(embeddings, top_k)
+            else:
+                D, I = self._search_subset(embeddings, candidates, top_k)
         except Exception as e:
             logger.error("Search failed: %s", e, exc_info=True)
-            return []
+            return [[] for _ in queries]
+
+        hits = []
+        for distances, ids in zip(D, I):
+            # FAISS pads with -1 when fewer than top_k vectors are available.
+            hits.append(
+                [
+                    (int(idx), float(1.0 / (1.0 + distance)))
+                    for distance, idx in zip(distances, ids)
+                    if 0 <= idx < len(self.metadata)
+                ]
+            )
+        return hits
+
+    @locked
+    def candidate_ids(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Row ids matching `filters`, cached per filter combination until metadata changes.
+
+        Args:
+            filters (Dict[str, Any]): Metadata filters; see `search`.
+
+        Returns:
+            np.ndarray: Sorted ``int64`` row ids.
+        """
+        if self._selection_stamp != self._metadata_generation:
+            self._selection_cache, self._selection_stamp = {}, self._metadata_generation
+        key = json.dumps(filters, sort_keys=True, default=str)
+        ids = self._selection_cache.get(key)
+        if ids is None:
+            if len(self._selection_cache) >= _SELECTION_CACHE_SIZE:
+                self._selection_cache.clear()
+            ids = self._selection_cache[key] = select_rows(self.metadata, filters)
+        return ids
+
+    def _search_subset(
+        self, embeddings: np.ndarray, ids: np.ndarray, top_k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Searches only the vectors in `ids`, with a cost proportional to the subset.
+
+        Vectors of indexes that can reconstruct them (flat, HNSW) are gathered and searched
+        exactly; other index types (IVF) restrict their own search with an ID selector.
+        """
+        if len(ids) >= self.index.ntotal:
+            return self.index.search(embeddings, top_k)
+
+        try:
+            subset = self.index.reconstruct_batch(ids)
+        except RuntimeError:
+            subset = None
+        if subset is not None and (
+            isinstance(self.index, faiss.IndexFlat) or len(ids) <= _EXACT_SUBSET_MAX
+        ):
+            D, local = faiss.knn(embeddings, subset, min(top_k, len(ids)))
+            return D, np.where(local >= 0, ids[np.maximum(local, 0)], -1)
 
+        selector = faiss.IDSelectorBatch(ids)
+        if hasattr(self.index, "nprobe"):
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=self.index.nprobe)
+        elif hasattr(self.index, "hnsw"):
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=self.index.hnsw.efSearch)
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        return self.index.search(embeddings, top_k, params=params)
+
+    @locked
+    def rows_for(
+        self, hits: List[Tuple[int, float]], score_key: str = "similarity"
+    ) -> List[Dict[str, Any]]:
+        """Materializes ``(row id, score)`` hits as metadata dicts with the score under `score_key`."""
         results = []
-        for i, idx in enumerate(I[0]):
-            if idx < len(self.metadata):
-                result = dict(self.metadata[int(idx)])
-                result["similarity"] = float(1.0 / (1.0 + D[0][i]))
-                results.append(result)
+        for idx, score in hits:
+            result = dict(self.metadata[idx])
+            result[score_key] = score
+            results.append(result)
         return results
 
     def build_index(
@@ -152,27 +603,467 @@ class BaseIndexer:
             if fail_on_empty:
                 raise ValueError("Cannot build index with empty data.")
             return False
+        return self.build_index_streaming(zip(texts, meta), total=len(texts))
 
+    @locked
+    def build_index_streaming(
+        self,
+        entries: Iterable[Tuple[str, Dict[str, Any]]],
+        progress: Optional[ProgressCallback] = None,
+        total: Optional[int] = None,
+    ) -> bool:
+        """
+        Builds a FAISS index from a stream of ``(text, metadata)`` pairs.
+
+        Texts are consumed in ``embedding_batch_size`` batches, encoded on
+        ``embedding_workers`` threads and added to the index batch by batch, so neither all
+        texts nor all embeddings are held at once. Approximate index types are trained on
+        the first ``train_sample_size`` vectors, which are buffered until then. Batches in
+        flight and that buffer are kept under ``index_build_max_memory_mb``; the index itself
+        is not counted. The current index stays in place until the build succeeds.
+
+        Args:
+            entries (Iterable[Tuple[str, Dict[str, Any]]]): Texts and their metadata rows.
+            progress (Optional[ProgressCallback], optional): Called after every batch with the
+                number of entries indexed so far and `total`.
+            total (Optional[int], optional): Number of entries, if known up front.
+
+        Returns:
+            bool: True if successful, False otherwise (including an empty stream).
+        """
+        batch_size, workers, max_memory_mb = self._build_settings()
+        index_type, params, _ = self._index_settings()
+        params = resolve_params(params)
+        if total and index_type in ("ivf_flat", "ivf_pq") and not params["nlist"]:
+            # Size the IVF cells for the whole corpus, not just the training sample.
+            params["nlist"] = int(4 * math.sqrt(total))
+
+        index = None
+        metadata: List[Dict[str, Any]] = []
+        sample: List[np.ndarray] = []
+        sample_rows = 0
+        sample_limit = 0 if index_type == "flat" else int(params["train_sample_size"])
+        corpus_sample: Optional[np.ndarray] = None
         try:
-            embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
-            self.index = faiss.IndexFlatL2(embeddings.shape[1])
-            self.index.add(embeddings)
-            self.metadata = meta
+            for embeddings, meta in encode_batches(
+                self._encode, chunked(entries, batch_size), workers, batch_size, max_memory_mb
+            ):
+                metadata.extend(meta)
+                if index is None:
+                    sample.append(embeddings)
+                    sample_rows += len(embeddings)
+                    limit = min(
+                        sample_limit, max_rows_in_memory(embeddings.shape[1], max_memory_mb)
+                    )
+                    if sample_rows >= limit:
+                        buffered = np.concatenate(sample)
+                        sample = []
+                        index = create_index(buffered, index_type, params)
+                        index.add(buffered)
+                else:
+                    index.add(embeddings)
+                if progress is not None:
+                    progress(len(metadata), total)
+
+            if index is None:
+                if not sample:
+                    logger.warning("No data to build index.")
+                    return False
+                # The whole corpus fit into the sample buffer.
+                corpus_sample = np.concatenate(sample)
+                index = create_index(corpus_sample, index_type, params)
+                index.add(corpus_sample)
+        except Exception as e:
+            logger.error("Failed to build index: %s", e, exc_info=True)
+            return False
+
+        try:
+            self.index, self.index_mmapped = index, False
+            self.metadata = metadata
+            if corpus_sample is not None:
+                self._report_index_quality(corpus_sample)
+            else:
+                self.index_report = None
             self.save_index()
+            if self.embedding_cache is not None:
+                self.embedding_cache.save()  # Incremental saves leave this to exit
+            logger.info("Built FAISS index %s with %d entries.", self.index_path, index.ntotal)
             return True
         except Exception as e:
             logger.error("Failed to build index: %s", e, exc_info=True)
             return False
 
+    @locked
+    def add_to_index(self, texts: List[str], meta: List[Dict[str, Any]], save: bool = True) -> bool:
+        """
+        Encodes and appends new entries to the existing FAISS index.
+
+        Unlike `build_index`, previously indexed vectors are kept as-is; only the
+        given texts are embedded. If no index exists yet, one of the configured type is
+        created from the new texts. Approximate indexes keep their trained structure, so
+        a full rebuild is worthwhile once the corpus has grown substantially.
+
+        Args:
+            texts (List[str]): New texts to encode and append.
+            meta (List[Dict[str, Any]]): Metadata per new text entry.
+            save (bool): Persist the index and metadata afterwards. Defaults to True.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if not texts:
+            return True
+
+        try:
+            embeddings = self._encode(texts)
+            if self.index is None:
+                self.index = self._create_index(embeddings)
+                self.metadata = []
+            self._ensure_writable()
+            self.index.add(embeddings)
+            self.metadata.extend(meta)
+            self._metadata_generation += 1
+            if save:
+                self.save_index()
+            return True
+        except Exception as e:
+            logger.error("Failed to append to index: %s", e, exc_info=True)
+            return False
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    @property
+    def watermark_path(self) -> Path:
+        """Path of the JSON high-water mark stored next to the metadata file."""
+        metadata_path = Path(self.metadata_path)
+        return metadata_path.with_name(f"{metadata_path.stem}_watermark.json")
+
+    def _load_watermark(self) -> Watermark:
+        """Reads the persisted high-water mark, or returns an empty one if missing."""
+        if not self.watermark_path.exists():
+            return {}
+        return read_json(self.watermark_path)
+
+    def _load_source(self) -> Dict[str, Any]:
+        """
+        Reads the nested ``date → main_category → subcategory → [items]`` source file.
+
+        Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def _iter_source(
+        self,
+    ) -> Iterator[Tuple[Optional[Watermark], Callable[[], Dict[str, Any]]]]:
+        """Yields the source as ``(counts, reader)`` parts, through `source_shards` when set."""
+        if self.source_shards is None:
+            yield None, self._load_source
+        else:
+            yield from self.source_shards()
+
+    def _read_source_reader(self) -> Dict[str, Any]:
+        """Reads the source through `source_reader`, returning an empty dict on failure."""
+        try:
+            return self.source_reader()
+        except Exception as e:
+            logger.error("Failed to read index source: %s", e, exc_info=True)
+            return {}
+
+    def _process_items(
+        self,
+        date: str,
+        main_cat: str,
+        subcat: str,
+        items: List[Any],
+        texts: List[str],
+        meta: List[Dict[str, Any]],
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Extracts texts and metadata from the leaf items of one subcategory.
+
+        Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def build_index_from_logs(self) -> bool:
+        """
+        Performs a full rebuild from the source file. Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_entries(
+        self, counts: Optional[Watermark] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streams ``(text, metadata)`` pairs for every entry of the source.
+
+        Args:
+            counts (Optional[Watermark], optional): Filled with the per-subcategory item
+                counts as the source is traversed; complete once the stream is exhausted.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: Entry text and metadata row, in source order.
+        """
+        for _, read in self._iter_source():
+            for date, categories in read().items():
+                for main_cat, subcats in categories.items():
+                    for subcat, items in subcats.items():
+                        texts, meta = self._process_items(date, main_cat, subcat, items, [], [])
+                        if counts is not None:
+                            counts.setdefault(date, {}).setdefault(main_cat, {})[subcat] = len(
+                                items
+                            )
+                        yield from zip(texts, meta)
+
+    def load_new_entries(
+        self, watermark: Watermark
+    ) -> Optional[Tuple[List[str], List[Dict[str, Any]], Watermark]]:
+        """
+        Extracts the source entries that lie beyond the given high-water mark.
+
+        Args:
+            watermark (Watermark): Per date/category/subcategory count of items already indexed.
+                Pass an empty dict to extract everything.
+
+        Returns:
+            Optional[Tuple[List[str], List[Dict[str, Any]], Watermark]]: New texts, their
+            metadata and the updated high-water mark, or None if the source shrank or
+            could not be processed (an incremental update is then impossible).
+        """
+        texts: List[str] = []
+        meta: List[Dict[str, Any]] = []
+        counts: Watermark = {}
+        try:
+            for shard_counts, read in self._iter_source():
+                if shard_counts is not None and self._covered_by(shard_counts, watermark):
+                    for date, categories in shard_counts.items():
+                        for main_cat, subcats in categories.items():
+                            counts.setdefault(date, {}).setdefault(main_cat, {}).update(subcats)
+                    continue
+                for date, categories in read().items():
+                    for main_cat, subcats in categories.items():
+                        for subcat, items in subcats.items():
+                            seen = watermark.get(date, {}).get(main_cat, {}).get(subcat, 0)
+                            if len(items) < seen:
+                                logger.warning(
+                                    "Source shrank for %s → %s → %s (%d < %d); incremental update impossible.",
+                                    date,
+                                    main_cat,
+                                    subcat,
+                                    len(items),
+                                    seen,
+                                )
+                                return None
+                            texts, meta = self._process_items(
+                                date, main_cat, subcat, items[seen:], texts, meta
+                            )
+                            counts.setdefault(date, {}).setdefault(main_cat, {})[subcat] = len(
+                                items
+                            )
+        except Exception as e:
+            logger.error("Failed to scan source for new entries: %s", e, exc_info=True)
+            return None
+        return texts, meta, counts
+
+    def _source_counts(self, keys: Set[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], int]:
+        """
+        Current number of source items under each ``(date, main_cat, subcat)`` key; taken
+        from the shard counts where known, so only unsharded sources are read.
+        """
+        counts: Dict[Tuple[str, str, str], int] = {}
+        dates = {date for date, _, _ in keys}
+        for shard_counts, read in self._iter_source():
+            if shard_counts is not None:
+                if dates.isdisjoint(shard_counts):
+                    continue
+                source = shard_counts
+            else:
+                source = {
+                    date: {
+                        m: {s: len(items) for s, items in subs.items()} for m, subs in cats.items()
+                    }
+                    for date, cats in read().items()
+                    if date in dates
+                }
+            for date, main_cat, subcat in keys:
+                n = source.get(date, {}).get(main_cat, {}).get(subcat)
+                if n is not None:
+                    counts[(date, main_cat, subcat)] = counts.get((date, main_cat, subcat), 0) + n
+        return counts
+
+    @staticmethod
+    def _covered_by(shard_counts: Watermark, watermark: Watermark) -> bool:
+        """Whether a shard holds exactly the items the high-water mark already covers."""
+        return all(
+            watermark.get(date, {}).get(main_cat, {}).get(subcat, 0) == n
+            for date, categories in shard_counts.items()
+            for main_cat, subcats in categories.items()
+            for subcat, n in subcats.items()
+        )
+
+    @locked
+    def update_index(self) -> bool:
+        """
+        Incrementally indexes entries added to the source since the last build.
+
+        Only entries beyond the stored high-water mark are embedded and appended. Falls
+        back to `build_index_from_logs` when no index exists yet, when the index predates
+        high-water marks, or when the source was edited in a way that cannot be appended.
+
+        Returns:
+            bool: True if the index is up to date afterwards, False otherwise.
+        """
+        if self.index is None:
+            try:
+                self.load_index()
+            except FileNotFoundError:
+                logger.info("No existing index at %s; performing full build.", self.index_path)
+                return self.build_index_from_logs()
+
+        if not self.watermark and self.index.ntotal:
+            logger.info(
+                "Index at %s has no high-water mark; performing full rebuild.", self.index_path
+            )
+            return self.build_index_from_logs()
+
+        result = self.load_new_entries(self.watermark)
+        if result is None:
+            return self.build_index_from_logs()
+
+        texts, meta, watermark = result
+        if not texts and watermark == self.watermark:
+            return True
+        if texts and not self.add_to_index(texts, meta, save=False):
+            return False
+        self.watermark = watermark
+        self.save_index()
+        logger.info("Incrementally indexed %d new entries into %s.", len(texts), self.index_path)
+        return True
+
+    def append_entries(self, date: str, main_cat: str, subcat: str, items: List[Any]) -> bool:
+        """
+        Indexes items that were just appended to one subcategory of the source.
+
+        This is the fast path used right after saving an entry: only the given items are
+        embedded, and the high-water mark is advanced after checking it against the source counts.
+
+        Args:
+            date (str): Date key the items were appended under.
+            main_cat (str): Main category of the items.
+            subcat (str): Subcategory of the items.
+            items (List[Any]): The raw items exactly as stored in the source file.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        return self.append_entries_many([(date, main_cat, subcat, items)])
+
+    @locked
+    def append_entries_many(self, groups: Iterable[Tuple[str, str, str, List[Any]]]) -> bool:
+        """
+        Indexes items just appended to several subcategories, saving the index once.
+
+        Falls back to `update_index` when the high-water mark plus the items does not match
+        the source's current count of a subcategory. The index files are written later, by
+        `flush` (see `_flush_settings`); the persisted high-water mark lags accordingly, so
+        appends lost to a crash are caught up by the next `update_index`.
+
+        Args:
+            groups (Iterable[Tuple[str, str, str, List[Any]]]): ``(date, main_cat, subcat,
+                items)`` tuples, as for `append_entries`.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        groups = list(groups)
+        if self.index is None:
+            return self.update_index()
+
+        # The items must directly follow what the index already covers; anything else (a
+        # missed append, an edit, a concurrent writer) is caught up from the source instead.
+        counts = self._source_counts(
+            {(date, main_cat, subcat) for date, main_cat, subcat, _ in groups}
+        )
+        added: Dict[Tuple[str, str, str], int] = {}
+        for date, main_cat, subcat, items in groups:
+            key = (date, main_cat, subcat)
+            added[key] = added.get(key, 0) + len(items)
+        for (date, main_cat, subcat), n in added.items():
+            seen = self.watermark.get(date, {}).get(main_cat, {}).get(subcat, 0)
+            if counts.get((date, main_cat, subcat)) != seen + n:
+                logger.info(
+                    "High-water mark of %s → %s → %s is out of step with the source; "
+                    "updating %s from the source.",
+                    date,
+                    main_cat,
+                    subcat,
+                    self.index_path,
+                )
+                return self.update_index()
+
+        texts: List[str] = []
+        meta: List[Dict[str, Any]] = []
+        watermark = {d: {m: dict(s) for m, s in cats.items()} for d, cats in self.watermark.items()}
+        for date, main_cat, subcat, items in groups:
+            texts, meta = self._process_items(date, main_cat, subcat, items, texts, meta)
+            subcats = watermark.setdefault(date, {}).setdefault(main_cat, {})
+            subcats[subcat] = subcats.get(subcat, 0) + len(items)
+        if texts and not self.add_to_index(texts, meta, save=False):
+            return False
+
+        self.watermark = watermark
+        self._note_append()
+        return True
+
+    def _note_append(self) -> None:
+        """Counts an unsaved append and saves, or schedules a save, per `_flush_settings`."""
+        self._pending_appends += 1
+        flush_every, interval = self._flush_settings()
+        if self._pending_appends >= flush_every or interval <= 0:
+            self.save_index()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether appended entries have not been written to the index files yet."""
+        return self._pending_appends > 0
+
+    @locked
+    def flush(self) -> None:
+        """Writes appended entries to the index files, if there are any."""
+        if self.dirty:
+            self.save_index()
+
+    @locked
     def save_index(self) -> None:
         """
         Saves the FAISS index to a file, and the associated metadata.
 
+        Metadata is written to the columnar store; a legacy pickle sidecar is removed
+        once its contents have been migrated.
+
         This method must be called after `build_index` or `load_index` has been called.
         """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
         # Ensure parent directory exists
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
 
-        faiss.write_index(self.index, str(self.index_path))
-        with open(self.metadata_path, "wb") as f:
-            pickle.dump(self.metadata, f)
+        # Write-then-rename so readers that memory-mapped the previous file are unaffected.
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        faiss.write_index(self.index, str(tmp_path))
+        os.replace(tmp_path, self.index_path)
+        metadata = self.metadata
+        if not isinstance(metadata, ColumnarMetadata):
+            metadata = ColumnarMetadata.from_rows(metadata)
+        self.metadata = metadata.save(self.metadata_store_path)
+        legacy_path = Path(self.metadata_path)
+        if legacy_path.exists():
+            legacy_path.unlink()
+        write_json(self.watermark_path, self.watermark)
+        self._pending_appends = 0
@@ -0,0 +1,244 @@
+"""
+embedding_cache.py
+
+This module defines the EmbeddingCache class, a persistent content-hash → embedding store
+shared by all FAISS indexers.
+
+Core features include:
+- Keying vectors by the SHA-256 of the text so unchanged entries are never re-encoded.
+- Persisting the cache as a single ``.npz`` file next to the FAISS files in ``vector_store_dir``,
+  after full builds and at interpreter exit.
+- Invalidating the whole cache when the configured ``embedding_model`` changes.
+- Least-recently-used eviction once the configured maximum number of entries is exceeded.
+- A process-wide registry so summary and raw indexers share one in-memory cache.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "embedding_cache.npz"
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class EmbeddingCache:
+    """
+    Persistent mapping of ``sha256(text)`` to a float32 embedding for one embedding model.
+
+    Attributes:
+        path (Path): Location of the ``.npz`` cache file.
+        model_name (str): Embedding model the cached vectors were produced by.
+        max_entries (int): Maximum number of vectors kept before LRU eviction.
+    """
+
+    def __init__(
+        self, directory: Path, model_name: str, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        """
+        Initializes the cache and loads any vectors previously persisted for `model_name`.
+
+        Args:
+            directory (Path): Directory holding the cache file (normally ``vector_store_dir``).
+            model_name (str): Name of the embedding model; a mismatch with the persisted
+                cache discards it.
+            max_entries (int, optional): Maximum number of cached vectors. Defaults to 100 000.
+        """
+        self.path = Path(directory) / CACHE_FILE_NAME
+        self.model_name = model_name
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._vectors: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """Returns the content hash used as cache key for `text`."""
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def _load(self) -> None:
+        """Loads the persisted cache, discarding it if it belongs to another model."""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                stored_model = str(data["model"])
+                if stored_model != self.model_name:
+                    logger.info(
+                        "Embedding model changed (%s → %s); invalidating embedding cache.",
+                        stored_model,
+                        self.model_name,
+                    )
+                    self._dirty = True
+                    return
+                keys = data["keys"]
+                vectors = data["vectors"]
+            for key, vector in zip(keys.tolist(), vectors):
+                self._vectors[key] = vector
+            self._evict()
+            logger.debug("Loaded %d cached embeddings from %s", len(self._vectors), self.path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable embedding cache %s: %s", self.path, e)
+            self._vectors.clear()
+
+    def _evict(self) -> None:
+        """Drops least-recently-used vectors until the cache fits `max_entries`."""
+        while len(self._vectors) > self.max_entries:
+            self._vectors.popitem(last=False)
+            self._dirty = True
+
+    def lookup(self, texts: List[str]) -> Tuple[List[bytes], Dict[int, np.ndarray]]:
+        """
+        Looks up cached vectors for `texts`.
+
+        Args:
+            texts (List[str]): Texts to look up.
+
+        Returns:
+            Tuple[List[bytes], Dict[int, np.ndarray]]: The key of every text, and the cached
+            vector for each position that was a hit.
+        """
+        keys = [self.key(text) for text in texts]
+        found: Dict[int, np.ndarray] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._vectors.get(key)
+                if vector is not None:
+                    self._vectors.move_to_end(key)
+                    found[i] = vector
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return keys, found
+
+    def store(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        """
+        Adds freshly encoded vectors to the cache.
+
+        Args:
+            keys (List[bytes]): Cache keys as returned by `lookup`.
+            vectors (np.ndarray): One float32 row per key.
+        """
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                self._vectors[key] = np.asarray(vector, dtype=np.float32)
+                self._vectors.move_to_end(key)
+            self._dirty = True
+            self._evict()
+
+    def encode(self, texts: List[str], model: Any, store: bool = True) -> np.ndarray:
+        """
+        Returns embeddings for `texts`, encoding only the ones not cached yet.
+
+        Misses are de-duplicated and passed to ``model.encode`` in a single call.
+
+        Args:
+            texts (List[str]): Texts to embed.
+            model (Any): Object exposing ``encode(texts, convert_to_numpy=True)``.
+            store (bool, optional): Add the misses to the cache. Pass False for one-off texts
+                such as search queries. Defaults to True.
+
+        Returns:
+            np.ndarray: A ``(len(texts), dim)`` float32 matrix.
+        """
+        keys, found = self.lookup(texts)
+        pending: Dict[bytes, List[int]] = {}
+        for i, key in enumerate(keys):
+            if i not in found:
+                pending.setdefault(key, []).append(i)
+
+        if pending:
+            first_positions = [positions[0] for positions in pending.values()]
+            encoded = np.asarray(
+                model.encode([texts[i] for i in first_positions], convert_to_numpy=True),
+                dtype=np.float32,
+            )
+            if store:
+                self.store(list(pending.keys()), encoded)
+            for row, positions in zip(encoded, pending.values()):
+                for i in positions:
+                    found[i] = row
+
+        return np.vstack([found[i] for i in range(len(texts))]).astype(np.float32, copy=False)
+
+    def save(self) -> None:
+        """Persists the cache atomically if it changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            keys = np.array(list(self._vectors.keys()), dtype="S32")
+            vectors = (
+                np.vstack(list(self._vectors.values()))
+                if self._vectors
+                else np.zeros((0, 0), dtype=np.float32)
+            )
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, model=np.array(self.model_name), keys=keys, vectors=vectors)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error("Failed to save embedding cache to %s: %s", self.path, e, exc_info=True)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drops every cached vector (the file is rewritten on the next `save`)."""
+        with self._lock:
+            self._vectors.clear()
+            self._dirty = True
+
+
+_registry: Dict[Tuple[str, str], EmbeddingCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_embedding_cache(
+    directory: Path, model_name: str, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> EmbeddingCache:
+    """
+    Returns the process-wide cache for `directory` and `model_name`, creating it on first use.
+
+    Shared caches are saved at interpreter exit, so vectors added by incremental updates
+    persist without rewriting the cache file on every save of an index.
+
+    Args:
+        directory (Path): Directory holding the cache file.
+        model_name (str): Embedding model name.
+        max_entries (int, optional): Maximum number of cached vectors.
+
+    Returns:
+        EmbeddingCache: The shared cache instance.
+    """
+    key = (str(Path(directory).resolve()), model_name)
+    with _registry_lock:
+        cache = _registry.get(key)
+        if cache is None:
+            cache = EmbeddingCache(directory, model_name, max_entries=max_entries)
+            _registry[key] = cache
+            ref = weakref.ref(cache)
+            atexit.register(lambda: ref() is not None and ref().save())
+        else:
+            cache.max_entries = max(1, int(max_entries))
+        return cache
+
+
+def clear_embedding_cache_registry() -> None:
+    """Forgets all shared cache instances (their files are left untouched)."""
+    with _registry_lock:
+        _registry.clear()
@@ -0,0 +1,89 @@
+"""
+embedding_models.py
+
+This module provides a process-wide registry of SentenceTransformer embedding models shared
+by all FAISS indexers.
+
+Core features include:
+- Loading each named model at most once per process, on first use.
+- Thread-safe access, so concurrent first searches do not load the same model twice.
+- Explicit warm-up (e.g. in a background thread at application start) and unload hooks
+  to control when the load cost is paid and when the memory is released.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_models: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _load(model_name: str) -> Any:
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError("sentence-transformers is not installed.")
+
+    logger.info("Loading embedding model '%s'.", model_name)
+    return SentenceTransformer(model_name)
+
+
+def get_embedding_model(model_name: str) -> Any:
+    """
+    Returns the shared instance of `model_name`, loading it on first use.
+
+    Args:
+        model_name (str): SentenceTransformer model name or path.
+
+    Returns:
+        Any: The loaded model.
+
+    Raises:
+        ImportError: If sentence-transformers is not installed.
+    """
+    model = _models.get(model_name)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(model_name)
+        if model is None:
+            model = _models[model_name] = _load(model_name)
+        return model
+
+
+def warm_up(model_name: str) -> bool:
+    """
+    Loads `model_name` ahead of its first use.
+
+    Returns:
+        bool: True if the model is loaded, False if loading failed (the error is logged).
+    """
+    try:
+        get_embedding_model(model_name)
+        return True
+    except Exception as e:
+        logger.error("Failed to warm up embedding model '%s': %s", model_name, e, exc_info=True)
+        return False
+
+
+def unload(model_name: Optional[str] = None) -> None:
+    """
+    Drops the shared instance of `model_name` (or of every model when None).
+
+    The memory is released once no caller holds a reference any more; the model is
+    loaded again on the next `get_embedding_model` call (e.g. the next indexer search).
+    """
+    with _lock:
+        if model_name is None:
+            _models.clear()
+        else:
+            _models.pop(model_name, None)
+
+
+def loaded_models() -> List[str]:
+    """Returns the names of the currently loaded models."""
+    with _lock:
+        return list(_models)
@@ -0,0 +1,107 @@
+"""
+embedding_pipeline.py
+
+This module provides the streaming embedding pipeline used to build FAISS indexes without
+holding the whole corpus (texts and embeddings) in memory at once.
+
+Core features include:
+- Chunking a stream of ``(text, metadata)`` pairs into fixed-size encode batches.
+- Encoding batches concurrently on a thread pool while yielding them in input order.
+- Bounding the number of batches in flight so the pipeline's memory stays under a cap.
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_MAX_MEMORY_MB = 512
+
+#: ``(texts, metadata)`` of one encode batch.
+Batch = Tuple[List[str], List[Dict[str, Any]]]
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Returns `workers`, or the number of CPU cores when it is None or below 1."""
+    if workers is None or int(workers) < 1:
+        return os.cpu_count() or 1
+    return int(workers)
+
+
+def chunked(entries: Iterable[Tuple[str, Dict[str, Any]]], batch_size: int) -> Iterator[Batch]:
+    """
+    Groups a stream of ``(text, metadata)`` pairs into batches of at most `batch_size`.
+
+    Only one batch is materialized at a time.
+    """
+    batch_size = max(1, int(batch_size))
+    entries = iter(entries)
+    while True:
+        pairs = list(islice(entries, batch_size))
+        if not pairs:
+            return
+        texts, meta = zip(*pairs)
+        yield list(texts), list(meta)
+
+
+def max_rows_in_memory(dim: int, max_memory_mb: float) -> int:
+    """Number of float32 vectors of dimension `dim` that fit into `max_memory_mb`."""
+    return max(1, int(max_memory_mb * 1024 * 1024) // (4 * max(1, dim)))
+
+
+def encode_batches(
+    encode: Callable[[List[str]], np.ndarray],
+    batches: Iterable[Batch],
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_memory_mb: float = DEFAULT_MAX_MEMORY_MB,
+) -> Iterator[Tuple[np.ndarray, List[Dict[str, Any]]]]:
+    """
+    Encodes `batches` on a thread pool and yields ``(embeddings, metadata)`` in input order.
+
+    The first batch is encoded inline to learn the embedding dimension; afterwards at most
+    as many batches are submitted ahead of the consumer as fit into `max_memory_mb` (and
+    never more than two per worker), so memory stays bounded however long the stream is.
+
+    Args:
+        encode (Callable[[List[str]], np.ndarray]): Embeds a list of texts.
+        batches (Iterable[Batch]): ``(texts, metadata)`` batches, e.g. from `chunked`.
+        workers (int, optional): Encoding threads. Defaults to 1 (encode inline).
+        batch_size (int, optional): Nominal batch size, used for the memory estimate.
+        max_memory_mb (float, optional): Memory budget for batches in flight.
+
+    Yields:
+        Tuple[np.ndarray, List[Dict[str, Any]]]: float32 embeddings and the batch metadata.
+    """
+    batches = iter(batches)
+    first = next(batches, None)
+    if first is None:
+        return
+    embeddings = np.asarray(encode(first[0]), dtype=np.float32)
+    yield embeddings, first[1]
+
+    if workers <= 1:
+        for texts, meta in batches:
+            yield np.asarray(encode(texts), dtype=np.float32), meta
+        return
+
+    rows = max_rows_in_memory(embeddings.shape[1], max_memory_mb)
+    window = max(1, min(2 * workers, rows // max(1, batch_size)))
+    logger.debug("Encoding with %d workers, up to %d batches in flight.", workers, window)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as pool:
+        pending: deque = deque()
+        for texts, meta in batches:
+            pending.append((pool.submit(encode, texts), meta))
+            if len(pending) >= window:
+                future, done_meta = pending.popleft()
+                yield np.asarray(future.result(), dtype=np.float32), done_meta
+        while pending:
+            future, done_meta = pending.popleft()
+            yield np.asarray(future.result(), dtype=np.float32), done_meta
@@ -0,0 +1,199 @@
+"""
+index_factory.py
+
+This module builds the FAISS index structure used by the indexers, selected via the
+``faiss_index_type`` configuration key.
+
+Core features include:
+- Supported index types: exact ``flat`` and approximate ``ivf_flat``, ``ivf_pq`` and ``hnsw``.
+- Automatic training of IVF indexes on a random sample of the corpus.
+- Falling back to a flat index when the corpus is too small for the approximate type to pay off
+  (or to be trained at all).
+- Applying search-time knobs (``nprobe``, ``ef_search``) after building or loading an index.
+- Measuring recall@k and query latency of an approximate index against the exact flat baseline.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Dict, Optional
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+#: Defaults for ``faiss_index_params``; any key may be overridden in config.
+DEFAULT_INDEX_PARAMS: Dict[str, Any] = {
+    "min_corpus_size": 1000,  # below this, approximate types fall back to flat
+    "nlist": None,  # IVF cells; None → 4·√n
+    "nprobe": 8,  # IVF cells visited per query
+    "train_sample_size": 50_000,  # vectors sampled for IVF training
+    "pq_m": 8,  # PQ sub-quantizers (rounded down to a divisor of the dimension)
+    "pq_nbits": 8,  # bits per PQ code
+    "hnsw_m": 32,  # HNSW graph degree
+    "ef_construction": 80,
+    "ef_search": 64,
+}
+
+# FAISS warns (and trains poorly) with fewer than ~39 training points per centroid.
+_MIN_POINTS_PER_CENTROID = 39
+
+
+def resolve_params(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merges user-supplied index params over `DEFAULT_INDEX_PARAMS`."""
+    merged = dict(DEFAULT_INDEX_PARAMS)
+    merged.update({k: v for k, v in (params or {}).items() if v is not None})
+    return merged
+
+
+def _training_sample(embeddings: np.ndarray, size: int) -> np.ndarray:
+    """Returns a reproducible random sample of at most `size` rows."""
+    if len(embeddings) <= size:
+        return embeddings
+    rng = np.random.default_rng(0)
+    rows = rng.choice(len(embeddings), size=size, replace=False)
+    return embeddings[np.sort(rows)]
+
+
+def _pq_subquantizers(dim: int, requested: int) -> int:
+    """Largest divisor of `dim` that does not exceed `requested`."""
+    for m in range(min(requested, dim), 0, -1):
+        if dim % m == 0:
+            return m
+    return 1
+
+
+def create_index(
+    embeddings: np.ndarray, index_type: str = "flat", params: Optional[Dict[str, Any]] = None
+) -> faiss.Index:
+    """
+    Creates (and trains, if required) an empty FAISS index suited to `embeddings`.
+
+    The vectors are not added; callers add them afterwards so the same path serves full
+    builds and incremental appends.
+
+    Args:
+        embeddings (np.ndarray): The corpus (or a representative sample), shape ``(n, dim)``.
+        index_type (str, optional): One of `INDEX_TYPES`. Defaults to ``"flat"``.
+        params (Optional[Dict[str, Any]], optional): Overrides for `DEFAULT_INDEX_PARAMS`.
+
+    Returns:
+        faiss.Index: The ready-to-fill index.
+
+    Raises:
+        ValueError: If `index_type` is unknown.
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unsupported faiss_index_type: {index_type}")
+
+    params = resolve_params(params)
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    n, dim = embeddings.shape
+
+    if index_type != "flat" and n < int(params["min_corpus_size"]):
+        logger.info(
+            "Corpus of %d vectors is below min_corpus_size=%d; using a flat index instead of %s.",
+            n,
+            params["min_corpus_size"],
+            index_type,
+        )
+        index_type = "flat"
+
+    if index_type == "flat":
+        return faiss.IndexFlatL2(dim)
+
+    if index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, int(params["hnsw_m"]))
+        index.hnsw.efConstruction = int(params["ef_construction"])
+        configure_search(index, params)
+        return index
+
+    nlist = params["nlist"] or int(4 * math.sqrt(n))
+    nlist = max(1, min(int(nlist), n // _MIN_POINTS_PER_CENTROID))
+    quantizer = faiss.IndexFlatL2(dim)
+
+    if index_type == "ivf_pq":
+        nbits = int(params["pq_nbits"])
+        if n < _MIN_POINTS_PER_CENTROID * (1 << nbits):
+            logger.info(
+                "Corpus of %d vectors is too small to train %d-bit PQ codes; using a flat index.",
+                n,
+                nbits,
+            )
+            return faiss.IndexFlatL2(dim)
+        m = _pq_subquantizers(dim, int(params["pq_m"]))
+        index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, nbits)
+    else:
+        index = faiss.IndexIVFFlat(quantizer, dim, nlist)
+
+    sample = _training_sample(embeddings, int(params["train_sample_size"]))
+    start = time.perf_counter()
+    index.train(sample)
+    logger.info(
+        "Trained %s index (nlist=%d) on %d vectors in %.2fs.",
+        index_type,
+        nlist,
+        len(sample),
+        time.perf_counter() - start,
+    )
+    configure_search(index, params)
+    return index
+
+
+def configure_search(index: faiss.Index, params: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Applies search-time parameters (``nprobe`` for IVF, ``ef_search`` for HNSW) to `index`.
+
+    Safe to call on any index type; unrelated parameters are ignored.
+    """
+    params = resolve_params(params)
+    if hasattr(index, "nprobe"):
+        index.nprobe = max(1, min(int(params["nprobe"]), getattr(index, "nlist", 1)))
+    if hasattr(index, "hnsw"):
+        index.hnsw.efSearch = int(params["ef_search"])
+
+
+def benchmark_index(
+    index: faiss.Index, embeddings: np.ndarray, top_k: int = 10, n_queries: int = 100
+) -> Dict[str, float]:
+    """
+    Compares `index` against an exact flat baseline built over the same vectors.
+
+    Queries are sampled from the corpus itself.
+
+    Args:
+        index (faiss.Index): The populated index to evaluate.
+        embeddings (np.ndarray): The vectors that were added to `index`, in order.
+        top_k (int, optional): Neighbours compared per query. Defaults to 10.
+        n_queries (int, optional): Number of sampled queries. Defaults to 100.
+
+    Returns:
+        Dict[str, float]: ``recall_at_k``, ``latency_ms`` and ``flat_latency_ms`` (mean per
+        query), plus ``top_k`` and ``n_queries`` actually used.
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    top_k = max(1, min(top_k, len(embeddings)))
+    queries = _training_sample(embeddings, n_queries)
+
+    flat = faiss.IndexFlatL2(embeddings.shape[1])
+    flat.add(embeddings)
+
+    start = time.perf_counter()
+    _, expected = flat.search(queries, top_k)
+    flat_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, actual = index.search(queries, top_k)
+    seconds = time.perf_counter() - start
+
+    overlap = sum(len(set(a) & set(e)) for a, e in zip(actual.tolist(), expected.tolist()))
+    return {
+        "recall_at_k": overlap / float(len(queries) * top_k),
+        "latency_ms": 1000.0 * seconds / len(queries),
+        "flat_latency_ms": 1000.0 * flat_seconds / len(queries),
+        "top_k": float(top_k),
+        "n_queries": float(len(queries)),
+    }
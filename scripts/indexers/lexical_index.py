@@ -0,0 +1,306 @@
+"""
+lexical_index.py
+
+This module defines BM25Index, an inverted index with Okapi BM25 ranking used for keyword
+search next to the FAISS vector indexes, and a reciprocal rank fusion helper.
+
+Core features include:
+- Lower-cased word tokenization, so identifiers, ticket numbers and rare terms match exactly.
+- Document ids aligned with FAISS vector ids, so results map onto the same metadata rows.
+- Incremental appends mirroring `BaseIndexer.add_to_index`, kept in an in-memory tail that is
+  merged into the stored postings on the next save.
+- Persistence as plain ``.npy`` arrays (CSR postings: offsets, doc ids, term frequencies) plus
+  a JSON vocabulary, memory-mapped on load like `ColumnarMetadata`; nothing is unpickled.
+- Reciprocal rank fusion (RRF) of several ranked id lists into one hybrid ranking.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+_FORMAT_VERSION = 2
+VOCAB_FILE = "vocab.json"
+_ARRAYS = ("offsets", "doc_ids", "tfs", "doc_lengths")
+
+#: Ranking constant of reciprocal rank fusion (Cormack et al. use 60).
+DEFAULT_RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits `text` into lower-cased word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    """
+    Inverted index scoring documents with Okapi BM25.
+
+    Postings of saved documents live in CSR arrays (``offsets[t]:offsets[t + 1]`` slices
+    ``doc_ids``/``tfs`` for the term with vocabulary position ``t``); documents added since
+    are held in growable per-term arrays until the next `save`.
+
+    Attributes:
+        k1 (float): Term-frequency saturation parameter.
+        b (float): Document-length normalization parameter.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        # Saved part: vocabulary position per term and the CSR postings.
+        self._vocab: Dict[str, int] = {}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._doc_ids = np.zeros(0, dtype=np.int32)
+        self._tfs = np.zeros(0, dtype=np.int32)
+        self._base_lengths = np.zeros(0, dtype=np.int32)
+        self._generation = 0
+        # Tail: term -> (doc ids, term frequencies) of documents added since, as int32 arrays.
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._doc_lengths = array("i")
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._base_lengths) + len(self._doc_lengths)
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], **kwargs) -> "BM25Index":
+        """Builds an index whose document ids are the positions of `texts`."""
+        index = cls(**kwargs)
+        index.add(texts)
+        return index
+
+    def add(self, texts: Iterable[str]) -> None:
+        """Appends documents; their ids continue from the current document count."""
+        doc_id = len(self)
+        for text in texts:
+            tokens = tokenize(text or "")
+            for term, tf in Counter(tokens).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("i"), array("i"))
+                postings[0].append(doc_id)
+                postings[1].append(tf)
+            self._doc_lengths.append(len(tokens))
+            self._total_length += len(tokens)
+            doc_id += 1
+
+    def _term_postings(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Doc ids and term frequencies of `term` over saved and appended documents."""
+        parts = []
+        position = self._vocab.get(term)
+        if position is not None:
+            start, stop = self._offsets[position], self._offsets[position + 1]
+            parts.append((self._doc_ids[start:stop], self._tfs[start:stop]))
+        tail = self._postings.get(term)
+        if tail is not None:
+            parts.append(
+                (np.frombuffer(tail[0], dtype=np.int32), np.frombuffer(tail[1], dtype=np.int32))
+            )
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+    def _lengths_of(self, ids: np.ndarray) -> np.ndarray:
+        """Token counts of the documents `ids`."""
+        n_base = len(self._base_lengths)
+        if not len(self._doc_lengths):
+            return self._base_lengths[ids]
+        tail = np.frombuffer(self._doc_lengths, dtype=np.int32)
+        in_base = ids < n_base
+        lengths = np.empty(len(ids), dtype=np.int32)
+        lengths[in_base] = self._base_lengths[ids[in_base]]
+        lengths[~in_base] = tail[ids[~in_base] - n_base]
+        return lengths
+
+    def search(
+        self, query: str, top_k: int = 5, allowed: Optional[np.ndarray] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Ranks documents containing at least one query term.
+
+        Args:
+            query (str): Free-text query; tokenized like the documents.
+            top_k (int, optional): Maximum number of hits. Defaults to 5.
+            allowed (Optional[np.ndarray], optional): Sorted ids of the only documents that
+                may be returned (e.g. rows matching metadata filters).
+
+        Returns:
+            List[Tuple[int, float]]: ``(doc_id, bm25_score)`` pairs, best first.
+        """
+        n_docs = len(self)
+        if not n_docs or top_k <= 0:
+            return []
+
+        avg_length = self._total_length / n_docs or 1.0
+        hit_ids, hit_scores = [], []
+        for term in set(tokenize(query)):
+            postings = self._term_postings(term)
+            if postings is None:
+                continue
+            ids = postings[0]
+            tfs = postings[1].astype(np.float64)
+            idf = math.log(1.0 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * self._lengths_of(ids) / avg_length)
+            hit_ids.append(ids)
+            hit_scores.append(idf * tfs * (self.k1 + 1.0) / (tfs + norm))
+        if not hit_ids:
+            return []
+
+        # Sum per-term scores of each document without a Python-level loop.
+        doc_ids, inverse = np.unique(np.concatenate(hit_ids), return_inverse=True)
+        totals = np.bincount(inverse, weights=np.concatenate(hit_scores))
+        if allowed is not None:
+            keep = np.isin(doc_ids, allowed, assume_unique=True)
+            doc_ids, totals = doc_ids[keep], totals[keep]
+            if not len(doc_ids):
+                return []
+        if len(totals) > top_k:
+            best = np.argpartition(-totals, top_k - 1)[:top_k]
+        else:
+            best = np.arange(len(totals))
+        best = best[np.lexsort((doc_ids[best], -totals[best]))]
+        return [(int(doc_ids[i]), float(totals[i])) for i in best]
+
+    def save(self, directory: Path) -> "BM25Index":
+        """
+        Merges appended documents into the postings and writes them to `directory`.
+
+        Arrays are written under a fresh generation number before the vocabulary file is
+        atomically replaced, then older generations are removed (best effort, as other
+        readers may still have them memory-mapped).
+
+        Returns:
+            BM25Index: A memory-mapped view of the saved index.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        terms = list(self._vocab)
+        terms.extend(term for term in self._postings if term not in self._vocab)
+        ids_parts, tfs_parts, counts = [], [], []
+        for term in terms:
+            ids, tfs = self._term_postings(term)
+            ids_parts.append(ids)
+            tfs_parts.append(tfs)
+            counts.append(len(ids))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        arrays = {
+            "offsets": offsets,
+            "doc_ids": np.concatenate(ids_parts).astype(np.int32) if terms else self._doc_ids,
+            "tfs": np.concatenate(tfs_parts).astype(np.int32) if terms else self._tfs,
+            "doc_lengths": np.concatenate(
+                [self._base_lengths, np.frombuffer(self._doc_lengths, dtype=np.int32)]
+            ),
+        }
+
+        generation = max(self._generation, _read_generation(directory)) + 1
+        keep = {VOCAB_FILE}
+        for name, values in arrays.items():
+            file_name = f"{name}.g{generation}.npy"
+            np.save(directory / file_name, values, allow_pickle=False)
+            keep.add(file_name)
+        vocab = {
+            "version": _FORMAT_VERSION,
+            "generation": generation,
+            "k1": self.k1,
+            "b": self.b,
+            "total_length": self._total_length,
+            "terms": terms,
+        }
+        tmp_path = directory / (VOCAB_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(vocab, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, directory / VOCAB_FILE)
+
+        for stale in directory.iterdir():
+            if stale.name not in keep:
+                try:
+                    stale.unlink()
+                except OSError:
+                    logger.debug("Could not remove stale lexical index file %s", stale)
+        return BM25Index.load(directory)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "BM25Index":
+        """
+        Opens an index saved with `save`.
+
+        Args:
+            directory (Path): Directory containing ``vocab.json`` and the postings arrays.
+            mmap (bool, optional): Memory-map the arrays. Defaults to True.
+
+        Raises:
+            FileNotFoundError: If `directory` has no saved index.
+            ValueError: If the index has an unsupported format version.
+        """
+        directory = Path(directory)
+        with open(directory / VOCAB_FILE, "r", encoding="utf-8") as f:
+            vocab = json.load(f)
+        if vocab.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported lexical index version: {vocab.get('version')}")
+        index = cls(k1=vocab["k1"], b=vocab["b"])
+        generation = int(vocab["generation"])
+        arrays = {
+            name: np.load(
+                directory / f"{name}.g{generation}.npy",
+                mmap_mode="r" if mmap else None,
+                allow_pickle=False,
+            )
+            for name in _ARRAYS
+        }
+        index._vocab = {term: position for position, term in enumerate(vocab["terms"])}
+        index._offsets = arrays["offsets"]
+        index._doc_ids = arrays["doc_ids"]
+        index._tfs = arrays["tfs"]
+        index._base_lengths = arrays["doc_lengths"]
+        index._total_length = int(vocab["total_length"])
+        index._generation = generation
+        return index
+
+
+def _read_generation(directory: Path) -> int:
+    try:
+        with open(Path(directory) / VOCAB_FILE, "r", encoding="utf-8") as f:
+            return int(json.load(f).get("generation", 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def lexical_index_exists(directory: Path) -> bool:
+    """Whether `directory` contains a saved BM25 index."""
+    return (Path(directory) / VOCAB_FILE).exists()
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[int]], k: int = DEFAULT_RRF_K
+) -> List[Tuple[int, float]]:
+    """
+    Fuses ranked id lists with reciprocal rank fusion: ``score(d) = Σ 1 / (k + rank(d))``.
+
+    Args:
+        rankings (Sequence[Sequence[int]]): Ranked ids, best first, one list per retriever.
+        k (int, optional): Damping constant. Defaults to 60.
+
+    Returns:
+        List[Tuple[int, float]]: ``(id, fused_score)`` pairs, best first.
+    """
+    fused: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,553 @@
+"""
+metadata_store.py
+
+This module defines ColumnarMetadata, the on-disk and in-memory store for the per-vector
+metadata of the FAISS indexers, replacing the former pickled list of dicts.
+
+Core features include:
+- One column per metadata key, persisted as ``.npy`` files in a ``<metadata stem>.cols``
+  directory and memory-mapped on load, so startup cost does not grow with the index size.
+- Interned low-cardinality values (dates, categories, subcategories) stored as ``int32`` codes
+  into a small value table, integers stored as ``int64`` and high-cardinality strings
+  (timestamps) stored as fixed-width UTF-8 byte arrays.
+- A lazy, read-only row accessor: rows are materialized as dicts only when indexed.
+- Cheap appends through an in-memory tail that is merged into the columns on the next save.
+- Atomic saves: column files are written under a new generation before the schema is swapped.
+- Vectorized row selection by category, subcategory and date range for filtered search.
+"""
+
+import json
+import logging
+import os
+import re
+from collections.abc import Sequence as SequenceABC
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_FILE = "schema.json"
+SCHEMA_VERSION = 1
+
+# Per-row state of a column value.
+FLAG_ABSENT = 0  # key not present in the row
+FLAG_NULL = 1  # key present with value None
+FLAG_VALUE = 2  # key present with a value stored in the column
+
+# Strings with more distinct values than this (and mostly unique) are stored verbatim.
+_MAX_CATEGORIES = 1024
+
+_ABSENT = object()
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+class Column:
+    """
+    One metadata key stored column-wise.
+
+    Attributes:
+        kind (str): ``"int"``, ``"str"`` or ``"category"``.
+        flags (np.ndarray): ``uint8`` per-row state (`FLAG_ABSENT`, `FLAG_NULL`, `FLAG_VALUE`).
+        values (np.ndarray): ``int64`` values, ``S<n>`` UTF-8 strings or ``int32`` category codes.
+        table (List[Any]): Distinct values referenced by category codes (empty otherwise).
+    """
+
+    __slots__ = ("kind", "flags", "values", "table", "_codes")
+
+    def __init__(
+        self, kind: str, flags: np.ndarray, values: np.ndarray, table: Optional[List[Any]] = None
+    ) -> None:
+        self.kind = kind
+        self.flags = flags
+        self.values = values
+        self.table = table if table is not None else []
+        self._codes: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def value(self, i: int) -> Any:
+        """Returns the value of row `i`, or the module's absent sentinel."""
+        flag = self.flags[i]
+        if flag == FLAG_ABSENT:
+            return _ABSENT
+        if flag == FLAG_NULL:
+            return None
+        if self.kind == "int":
+            return int(self.values[i])
+        if self.kind == "str":
+            return bytes(self.values[i]).decode("utf-8")
+        value = self.table[int(self.values[i])]
+        return deepcopy(value) if isinstance(value, (list, dict)) else value
+
+    def code_of(self, value: Any) -> Optional[int]:
+        """Returns the category code of `value`, or None if it never occurs."""
+        return self._code_map().get(_table_key(value))
+
+    def _code_map(self) -> Dict[str, int]:
+        if self._codes is None:
+            self._codes = {_table_key(v): i for i, v in enumerate(self.table)}
+        return self._codes
+
+    def decode_all(self) -> List[Any]:
+        """Materializes every row value (absent rows yield the absent sentinel)."""
+        return [self.value(i) for i in range(len(self))]
+
+
+def _table_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+def _infer_kind(values: List[Any]) -> str:
+    present = [v for v in values if v is not _ABSENT and v is not None]
+    if present and all(type(v) is int and abs(v) <= _INT64_MAX for v in present):
+        return "int"
+    if present and all(isinstance(v, str) for v in present):
+        distinct = len(set(present))
+        if distinct > _MAX_CATEGORIES and distinct * 2 > len(present):
+            return "str"
+    return "category"
+
+
+def _fits(kind: str, values: List[Any]) -> bool:
+    """Whether `values` can be appended to a column of `kind` without re-encoding it."""
+    present = (v for v in values if v is not _ABSENT and v is not None)
+    if kind == "int":
+        return all(type(v) is int and abs(v) <= _INT64_MAX for v in present)
+    if kind == "str":
+        return all(isinstance(v, str) for v in present)
+    return True
+
+
+def _flags_of(values: List[Any]) -> np.ndarray:
+    return np.fromiter(
+        (FLAG_ABSENT if v is _ABSENT else FLAG_NULL if v is None else FLAG_VALUE for v in values),
+        dtype=np.uint8,
+        count=len(values),
+    )
+
+
+def _encode(values: List[Any], kind: str, table: Optional[List[Any]] = None) -> Column:
+    """
+    Encodes row values into a column of `kind`.
+
+    For categories, new values are appended to a copy of `table` so existing codes stay valid.
+    """
+    flags = _flags_of(values)
+    has_value = [v is not _ABSENT and v is not None for v in values]
+    if kind == "int":
+        data = np.array([v if ok else 0 for v, ok in zip(values, has_value)], dtype=np.int64)
+        return Column(kind, flags, data)
+    if kind == "str":
+        raw = [v.encode("utf-8") if ok else b"" for v, ok in zip(values, has_value)]
+        width = max((len(b) for b in raw), default=0)
+        return Column(kind, flags, np.array(raw, dtype=f"S{max(width, 1)}"))
+
+    table = list(table or [])
+    codes_map = {_table_key(v): i for i, v in enumerate(table)}
+    codes = np.zeros(len(values), dtype=np.int32)
+    for i, (v, ok) in enumerate(zip(values, has_value)):
+        if not ok:
+            continue
+        key = _table_key(v)
+        code = codes_map.get(key)
+        if code is None:
+            code = codes_map[key] = len(table)
+            table.append(v)
+        codes[i] = code
+    return Column(kind, flags, codes, table)
+
+
+def _reencode(values: List[Any]) -> Column:
+    return _encode(values, _infer_kind(values))
+
+
+def _merge(base: Column, tail_values: List[Any]) -> Column:
+    """Appends `tail_values` to `base`, re-encoding the column only if its kind no longer fits."""
+    if not _fits(base.kind, tail_values):
+        return _reencode(base.decode_all() + tail_values)
+
+    tail = _encode(tail_values, base.kind, base.table)
+    values = np.concatenate([np.asarray(base.values), tail.values])
+    merged = Column(base.kind, np.concatenate([np.asarray(base.flags), tail.flags]), values)
+    merged.table = tail.table if base.kind == "category" else []
+
+    # Categories that turned out to be mostly-unique strings are stored verbatim instead.
+    if base.kind == "category" and len(merged.table) > _MAX_CATEGORIES:
+        if _infer_kind(merged.table) == "str" and len(merged.table) * 2 > len(merged):
+            return _reencode(merged.decode_all())
+    return merged
+
+
+class ColumnarMetadata(SequenceABC):
+    """
+    Read-mostly sequence of metadata dicts backed by (memory-mapped) NumPy columns.
+
+    Behaves like the list of dicts it replaces: supports ``len``, indexing, slicing,
+    iteration, ``append``/``extend`` and equality with plain lists.
+    """
+
+    def __init__(
+        self, columns: Optional[Dict[str, Column]] = None, length: int = 0, generation: int = 0
+    ) -> None:
+        self._columns: Dict[str, Column] = dict(columns or {})
+        self._length = length
+        self._generation = generation
+        self._tail: List[Dict[str, Any]] = []
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._length + len(self._tail)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("metadata index out of range")
+        if i >= self._length:
+            return self._tail[i - self._length]
+        row = {}
+        for name, column in self._columns.items():
+            value = column.value(i)
+            if value is not _ABSENT:
+                row[name] = value
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (ColumnarMetadata, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnarMetadata(rows={len(self)}, columns={list(self._columns)})"
+
+    # ------------------------------------------------------------------
+    # Mutation (appends only)
+    # ------------------------------------------------------------------
+    def append(self, row: Dict[str, Any]) -> None:
+        """Appends a row; it is merged into the columns on the next `save`."""
+        self._tail.append(row)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Appends several rows; they are merged into the columns on the next `save`."""
+        self._tail.extend(rows)
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> Optional[Column]:
+        """Returns the stored column for `name` (excluding un-saved appended rows)."""
+        return self._columns.get(name)
+
+    @property
+    def stored_length(self) -> int:
+        """Number of rows held in columns (the rest are un-saved appended rows)."""
+        return self._length
+
+    @property
+    def tail(self) -> List[Dict[str, Any]]:
+        """Rows appended since the store was loaded or built."""
+        return self._tail
+
+    # ------------------------------------------------------------------
+    # Construction and persistence
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "ColumnarMetadata":
+        """Builds an in-memory store from a list of metadata dicts."""
+        store = cls()
+        store.extend(rows)
+        store._compact()
+        return store
+
+    def _compact(self) -> None:
+        """Merges appended rows into the columns (in memory)."""
+        if not self._tail:
+            return
+        names = list(self._columns)
+        for row in self._tail:
+            for name in row:
+                if name not in self._columns and name not in names:
+                    names.append(name)
+
+        columns: Dict[str, Column] = {}
+        for name in names:
+            tail_values = [row.get(name, _ABSENT) for row in self._tail]
+            base = self._columns.get(name)
+            if base is None:
+                base = _encode([_ABSENT] * self._length, _infer_kind(tail_values))
+            columns[name] = _merge(base, tail_values)
+
+        self._columns = columns
+        self._length += len(self._tail)
+        self._tail = []
+
+    def save(self, directory: Path) -> "ColumnarMetadata":
+        """
+        Writes the store (including appended rows) to `directory`.
+
+        Column files are written under a fresh generation number, then the schema is
+        atomically replaced, then files of older generations are removed (best effort,
+        as they may still be memory-mapped by other readers).
+
+        Args:
+            directory (Path): Target directory, created if needed.
+
+        Returns:
+            ColumnarMetadata: A memory-mapped view of the saved store.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._compact()
+
+        generation = max(self._generation, _read_generation(directory)) + 1
+        schema_columns = []
+        keep = {SCHEMA_FILE}
+        for position, (name, column) in enumerate(self._columns.items()):
+            stem = f"c{position}.g{generation}"
+            for part, array in (("flags", column.flags), ("values", column.values)):
+                file_name = f"{stem}.{part}.npy"
+                np.save(directory / file_name, np.asarray(array), allow_pickle=False)
+                keep.add(file_name)
+            schema_columns.append(
+                {"name": name, "kind": column.kind, "file": stem, "table": column.table}
+            )
+
+        schema = {
+            "version": SCHEMA_VERSION,
+            "generation": generation,
+            "length": self._length,
+            "columns": schema_columns,
+        }
+        tmp_path = directory / (SCHEMA_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(schema, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, directory / SCHEMA_FILE)
+
+        for stale in directory.iterdir():
+            if stale.name not in keep:
+                try:
+                    stale.unlink()
+                except OSError:
+                    logger.debug("Could not remove stale metadata file %s", stale)
+
+        return ColumnarMetadata.load(directory)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "ColumnarMetadata":
+        """
+        Opens a store saved with `save`.
+
+        Args:
+            directory (Path): Directory containing ``schema.json`` and the column files.
+            mmap (bool, optional): Memory-map the column arrays. Defaults to True.
+
+        Raises:
+            FileNotFoundError: If the directory has no schema.
+            ValueError: If the schema version is unsupported.
+        """
+        directory = Path(directory)
+        with open(directory / SCHEMA_FILE, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        if schema.get("version") != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported metadata schema version: {schema.get('version')}")
+
+        length = int(schema["length"])
+        mmap_mode = "r" if mmap and length else None
+        columns = {}
+        for spec in schema["columns"]:
+            flags = np.load(directory / f"{spec['file']}.flags.npy", mmap_mode=mmap_mode)
+            values = np.load(directory / f"{spec['file']}.values.npy", mmap_mode=mmap_mode)
+            columns[spec["name"]] = Column(spec["kind"], flags, values, spec.get("table") or [])
+        return cls(columns, length=length, generation=int(schema.get("generation", 0)))
+
+
+def _read_generation(directory: Path) -> int:
+    try:
+        with open(Path(directory) / SCHEMA_FILE, "r", encoding="utf-8") as f:
+            return int(json.load(f).get("generation", 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def store_exists(directory: Path) -> bool:
+    """Whether `directory` contains a saved columnar store."""
+    return (Path(directory) / SCHEMA_FILE).exists()
+
+
+# ----------------------------------------------------------------------
+# Filtering
+# ----------------------------------------------------------------------
+#: Supported search filter keys.
+FILTER_KEYS = ("main_category", "subcategory", "date_from", "date_to")
+
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_NO_DATE = b""
+
+
+def validate_filters(filters: Dict[str, Any]) -> None:
+    """
+    Raises:
+        ValueError: If `filters` contains an unsupported key.
+    """
+    unknown = set(filters) - set(FILTER_KEYS)
+    if unknown:
+        raise ValueError(f"Unsupported search filter(s): {sorted(unknown)}; use {FILTER_KEYS}")
+
+
+def _allowed(value: Any) -> List[Any]:
+    """Normalizes a filter value (single value or collection) to a list of accepted values."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    return [value]
+
+
+def _date_bound(value: Any) -> str:
+    return str(value)[:10]
+
+
+def _row_date(row: Dict[str, Any]) -> Optional[str]:
+    """Entry date: the ``date`` key if it is an ISO date, else the timestamp's date part."""
+    for key in ("date", "timestamp"):
+        value = row.get(key)
+        if isinstance(value, str) and _ISO_DATE_RE.match(value):
+            return value[:10]
+    return None
+
+
+def _row_matches(row: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for key in ("main_category", "subcategory"):
+        if key in filters and row.get(key) not in _allowed(filters[key]):
+            return False
+    if filters.get("date_from") is not None or filters.get("date_to") is not None:
+        date = _row_date(row)
+        if date is None:
+            return False
+        if filters.get("date_from") is not None and date < _date_bound(filters["date_from"]):
+            return False
+        if filters.get("date_to") is not None and date > _date_bound(filters["date_to"]):
+            return False
+    return True
+
+
+def _iso_prefixes(values: np.ndarray) -> np.ndarray:
+    """Vectorized ``value[:10]`` for ``S`` arrays, blanking values that are not ISO dates."""
+    prefixes = np.ascontiguousarray(values.astype("S10"))
+    if not len(prefixes):
+        return prefixes
+    chars = prefixes.view("S1").reshape(-1, 10)
+    valid = (np.char.str_len(prefixes) == 10) & (chars[:, 4] == b"-") & (chars[:, 7] == b"-")
+    prefixes[~valid] = _NO_DATE
+    return prefixes
+
+
+def _column_dates(column: Optional[Column], length: int) -> np.ndarray:
+    """ISO date (``S10``) of every row of a date-like column, or blank where unavailable."""
+    if column is None or column.kind == "int":
+        return np.full(length, _NO_DATE, dtype="S10")
+    has_value = np.asarray(column.flags) == FLAG_VALUE
+    if column.kind == "str":
+        dates = _iso_prefixes(np.asarray(column.values))
+    else:
+        table = [
+            v[:10].encode("utf-8") if isinstance(v, str) and _ISO_DATE_RE.match(v) else _NO_DATE
+            for v in column.table
+        ]
+        lookup = np.array(table or [_NO_DATE], dtype="S10")
+        dates = lookup[np.asarray(column.values)]
+    dates[~has_value] = _NO_DATE
+    return dates
+
+
+def _category_mask(column: Optional[Column], allowed: List[Any], length: int) -> np.ndarray:
+    if column is None:
+        return np.zeros(length, dtype=bool)
+    if column.kind == "category":
+        codes = [code for code in (column.code_of(v) for v in allowed) if code is not None]
+        matches = np.isin(np.asarray(column.values), codes)
+    elif column.kind == "str":
+        targets = [v.encode("utf-8") for v in allowed if isinstance(v, str)]
+        matches = np.isin(np.asarray(column.values), np.array(targets or [b""], dtype="S"))
+        matches &= bool(targets)
+    else:
+        matches = np.isin(np.asarray(column.values), [v for v in allowed if type(v) is int])
+    return matches & (np.asarray(column.flags) == FLAG_VALUE)
+
+
+def _stored_mask(metadata: ColumnarMetadata, filters: Dict[str, Any]) -> np.ndarray:
+    length = metadata.stored_length
+    mask = np.ones(length, dtype=bool)
+    for key in ("main_category", "subcategory"):
+        if key in filters:
+            mask &= _category_mask(metadata.column(key), _allowed(filters[key]), length)
+
+    date_from, date_to = filters.get("date_from"), filters.get("date_to")
+    if date_from is not None or date_to is not None:
+        dates = _column_dates(metadata.column("date"), length)
+        missing = dates == _NO_DATE
+        if missing.any():
+            dates[missing] = _column_dates(metadata.column("timestamp"), length)[missing]
+        mask &= dates != _NO_DATE
+        if date_from is not None:
+            mask &= dates >= _date_bound(date_from).encode("utf-8")
+        if date_to is not None:
+            mask &= dates <= _date_bound(date_to).encode("utf-8")
+    return mask
+
+
+def select_rows(metadata: Sequence, filters: Dict[str, Any]) -> np.ndarray:
+    """
+    Returns the row ids of `metadata` matching every filter.
+
+    Filters:
+        main_category / subcategory: A value, or a collection of accepted values.
+        date_from / date_to: Inclusive ``YYYY-MM-DD`` bounds (strings or dates). The row's
+            ``date`` is used when it is an ISO date, else the date part of its ``timestamp``
+            (summaries are stored under a non-date key such as ``"global"``).
+
+    Columnar stores are filtered with vectorized operations on the stored codes; plain
+    lists and not-yet-saved rows are checked row by row.
+
+    Args:
+        metadata (Sequence): A `ColumnarMetadata` or list of metadata dicts.
+        filters (Dict[str, Any]): Filter values keyed by `FILTER_KEYS`.
+
+    Returns:
+        np.ndarray: Sorted ``int64`` row ids.
+
+    Raises:
+        ValueError: If `filters` contains an unsupported key.
+    """
+    validate_filters(filters)
+    if isinstance(metadata, ColumnarMetadata):
+        stored = _stored_mask(metadata, filters)
+        tail = np.fromiter(
+            (_row_matches(row, filters) for row in metadata.tail),
+            dtype=bool,
+            count=len(metadata.tail),
+        )
+        mask = np.concatenate([stored, tail])
+    else:
+        mask = np.fromiter(
+            (_row_matches(row, filters) for row in metadata), dtype=bool, count=len(metadata)
+        )
+    return np.flatnonzero(mask).astype(np.int64)
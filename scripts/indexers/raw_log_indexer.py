@@ -6,15 +6,20 @@ Core features:
 - Loading and parsing raw log entries by date, main category, and subcategory.
 - Extracting entry content and metadata for semantic indexing.
 - Building, saving, loading, and rebuilding a FAISS index for full-text vector search.
+- Incrementally indexing newly logged entries without re-embedding the whole log.
+- A BM25 inverted index over the same entries for keyword and hybrid (RRF) search.
 - Robust error handling and logging for file I/O and data processing.
 - Designed for use in the Zephyrus project to enable fast, flexible semantic search.
 """
 
-import json
 import logging
-from typing import List, Dict, Tuple, Any
+from pathlib import Path
+from typing import List, Dict, Tuple, Any, Iterable, Iterator, Optional
 from scripts.paths import ZephyrusPaths
-from scripts.indexers.base_indexer import BaseIndexer
+from scripts.indexers.base_indexer import BaseIndexer, ProgressCallback, locked
+from scripts.indexers.lexical_index import BM25Index, DEFAULT_RRF_K, reciprocal_rank_fusion
+from scripts.indexers.metadata_store import validate_filters
+from scripts.utils.file_utils import read_json
 
 logger = logging.getLogger(__name__)
 
@@ -27,28 +32,26 @@ class RawLogIndexer(BaseIndexer):
 
     Attributes:
         log_path (str): The path to the JSON log file.
+        lexical_index (Optional[BM25Index]): Keyword index whose document ids match the
+            FAISS vector ids; None until built or loaded.
+        source_reader (Optional[Callable[[], Dict[str, Any]]]): Reads the raw log through
+            its storage backend, so entries still in an append-only journal are indexed.
     """
 
+    lexical_index: Optional[BM25Index] = None
+
     def __init__(self, paths: ZephyrusPaths, autoload: bool = True) -> None:
         """
-        Initializes the RawLogIndexer with the specified paths and optionally loads the index.
+        Initializes the RawLogIndexer with the specified paths.
 
         Args:
             paths (ZephyrusPaths): The paths configuration for the indexer.
-            autoload (bool): Whether to automatically load the index on initialization.
-            Defaults to True.
-
-        Raises:
-            FileNotFoundError: If the index files are not found during autoload.
+            autoload (bool): Whether to open the persisted index automatically on first
+            search (see `ensure_loaded`). Defaults to True.
         """
         super().__init__(paths=paths, index_name="raw")
         self.log_path: str = paths.json_log_file  # Explicit log file path for clarity
-
-        if autoload:
-            try:
-                self.load_index()
-            except FileNotFoundError:
-                logger.warning("Raw log index files not found; skipping autoload.")
+        self.autoload: bool = autoload
 
     def load_entries(self) -> Tuple[List[str], List[Dict[str, Any]]]:
         """
@@ -62,19 +65,7 @@ class RawLogIndexer(BaseIndexer):
             FileNotFoundError: If the log file does not exist.
             json.JSONDecodeError: If the JSON file is malformed.
         """
-        try:
-            with open(self.log_path, "r", encoding="utf-8") as f:
-                data: Dict[str, Any] = json.load(f)
-        except FileNotFoundError:
-            logger.error("Raw log file not found at %s", self.log_path)
-            return [], []
-        except json.JSONDecodeError as e:
-            logger.error("Failed to decode JSON from raw log file: %s", e, exc_info=True)
-            return [], []
-        except Exception as e:
-            logger.error("Unexpected error while reading raw log file: %s", e, exc_info=True)
-            return [], []
-
+        data = self._load_source()
         texts: List[str] = []
         meta: List[Dict[str, Any]] = []
         try:
@@ -85,6 +76,21 @@ class RawLogIndexer(BaseIndexer):
 
         return texts, meta
 
+    def _load_source(self) -> Dict[str, Any]:
+        """
+        Reads the raw log, through `source_reader` when one is set.
+
+        Returns:
+            Dict[str, Any]: The parsed log, or an empty dict if it is missing or malformed.
+        """
+        if self.source_reader is not None:
+            return self._read_source_reader()
+        if not Path(self.log_path).exists():
+            logger.error("Raw log file not found at %s", self.log_path)
+            return {}
+        # Shared with other readers of the file until it changes; only iterated here.
+        return read_json(self.log_path, use_cache=True)
+
     def _process_categories(
         self, date: str, categories: Dict[str, Any], texts: List[str], meta: List[Dict[str, Any]]
     ) -> Tuple[List[str], List[Dict[str, Any]]]:
@@ -200,9 +206,28 @@ class RawLogIndexer(BaseIndexer):
                 )
         return texts, meta
 
-    def build_index_from_logs(self) -> bool:
+    def _process_items(
+        self,
+        date: str,
+        main_cat: str,
+        subcat: str,
+        items: List[Any],
+        texts: List[str],
+        meta: List[Dict[str, Any]],
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Leaf hook used by incremental updates; raw log items are plain entries."""
+        return self._process_entries(date, main_cat, subcat, items, texts, meta)
+
+    def build_index_from_logs(self, progress: Optional[ProgressCallback] = None) -> bool:
         """
-        Loads entries from file and rebuilds FAISS index.
+        Streams entries from file and rebuilds FAISS index from scratch.
+
+        The high-water mark is reset to the current source so that later calls to
+        `update_index` only pick up entries appended after this build.
+
+        Args:
+            progress (Optional[ProgressCallback], optional): Build progress callback; see
+                `build_index_streaming`.
 
         Returns:
             bool: Whether the index was successfully rebuilt.
@@ -211,11 +236,15 @@ class RawLogIndexer(BaseIndexer):
             Exception: If an error occurs while building the index.
         """
         try:
-            texts, meta = self.load_entries()
-            if not texts:
+            # Filled while the entries are streamed, i.e. before the index is saved.
+            previous, self.watermark = self.watermark, {}
+            built = self.build_index_streaming(
+                self.iter_entries(counts=self.watermark), progress=progress
+            )
+            if not built:
                 logger.warning("No entries found to build index from.")
-                return False
-            return self.build_index(texts, meta)
+                self.watermark = previous
+            return built
         except Exception as e:
             logger.error("Failed to build index from logs: %s", e, exc_info=True)
             return False
@@ -235,3 +264,229 @@ class RawLogIndexer(BaseIndexer):
             self.save_index()
         else:
             logger.warning("Raw index rebuild aborted: no entries to index.")
+
+    # ------------------------------------------------------------------
+    # Lexical (BM25) and hybrid search
+    # ------------------------------------------------------------------
+    @property
+    def lexical_index_path(self) -> Path:
+        """Directory of the persisted BM25 index (``<metadata stem>.bm25``)."""
+        metadata_path = Path(self.metadata_path)
+        return metadata_path.with_name(f"{metadata_path.stem}.bm25")
+
+    @property
+    def _legacy_lexical_index_path(self) -> Path:
+        """Pickled BM25 index written by earlier versions; never loaded, only removed."""
+        index_path = Path(self.index_path)
+        return index_path.with_name(f"{index_path.stem}_bm25.pkl")
+
+    @locked
+    def build_index_streaming(
+        self,
+        entries: Iterable[Tuple[str, Dict[str, Any]]],
+        progress: Optional[ProgressCallback] = None,
+        total: Optional[int] = None,
+    ) -> bool:
+        """
+        Builds the FAISS index and the BM25 index from the same stream of entries.
+
+        See `BaseIndexer.build_index_streaming` for the arguments and return value.
+        """
+        lexical = BM25Index()
+
+        def tee() -> Iterator[Tuple[str, Dict[str, Any]]]:
+            for text, row in entries:
+                lexical.add([text])
+                yield text, row
+
+        built = super().build_index_streaming(tee(), progress=progress, total=total)
+        if built:
+            self.lexical_index = lexical
+            self._save_lexical_index()
+        return built
+
+    @locked
+    def add_to_index(self, texts: List[str], meta: List[Dict[str, Any]], save: bool = True) -> bool:
+        """
+        Appends entries to the FAISS index and the BM25 index.
+
+        If the BM25 index is not in sync with the vector index beforehand, it is dropped
+        and rebuilt on the next lexical search.
+
+        See `BaseIndexer.add_to_index` for the arguments and return value.
+        """
+        if not texts:
+            return True
+        previous = len(self.metadata) if self.index is not None else 0
+        if not super().add_to_index(texts, meta, save=False):
+            return False
+
+        lexical = self.lexical_index if previous else BM25Index()
+        if lexical is None:
+            lexical = self._load_lexical_index(expected=previous)
+        if lexical is not None and len(lexical) == previous:
+            lexical.add(texts)
+            self.lexical_index = lexical
+        else:
+            self.lexical_index = None
+
+        if save:
+            self.save_index()
+        return True
+
+    @locked
+    def save_index(self) -> None:
+        """
+        Saves the FAISS index and metadata, plus the BM25 index when it is in sync.
+        """
+        super().save_index()
+        self._save_lexical_index()
+
+    def _save_lexical_index(self) -> None:
+        if self.lexical_index is not None and len(self.lexical_index) == len(self.metadata):
+            self.lexical_index = self.lexical_index.save(self.lexical_index_path)
+            self._legacy_lexical_index_path.unlink(missing_ok=True)
+
+    def _load_lexical_index(self, expected: int) -> Optional[BM25Index]:
+        """Loads the persisted BM25 index if it covers exactly `expected` documents."""
+        try:
+            lexical = BM25Index.load(self.lexical_index_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable lexical index %s: %s", self.lexical_index_path, e)
+            return None
+        if len(lexical) != expected:
+            logger.info(
+                "Lexical index covers %d entries but the vector index has %d; it will be rebuilt.",
+                len(lexical),
+                expected,
+            )
+            return None
+        return lexical
+
+    @locked
+    def _ensure_lexical_index(self) -> bool:
+        """
+        Makes the BM25 index and metadata available without loading the embedding model.
+
+        If the BM25 index is missing or out of sync with the vector index, only the BM25
+        index is rebuilt, from the texts of `load_entries`; nothing is encoded. Without any
+        persisted index the BM25 index and metadata are built in memory only, and replaced
+        when the vector index is first built.
+        """
+        if self.lexical_index is not None and len(self.lexical_index) == len(self.metadata):
+            return bool(self.metadata)
+        if not self.metadata and self._metadata_exists():
+            self.metadata = self._load_metadata()
+            self.watermark = self._load_watermark()
+        if not self.metadata:
+            texts, meta = self.load_entries()
+            if not texts:
+                return False
+            logger.info("Raw log index not built yet; indexing %d entries lexically.", len(texts))
+            self.lexical_index = BM25Index.from_texts(texts)
+            self.metadata = meta
+            return True
+        lexical = self._load_lexical_index(expected=len(self.metadata))
+        if lexical is None:
+            texts, _ = self.load_entries()
+            if len(texts) != len(self.metadata):
+                logger.warning(
+                    "Lexical search unavailable: the raw log has %d entries but the index has "
+                    "%d; run update_index first.",
+                    len(texts),
+                    len(self.metadata),
+                )
+                return False
+            logger.info("Rebuilding the lexical index from %d raw log entries.", len(texts))
+            self.lexical_index = BM25Index.from_texts(texts)
+            self._save_lexical_index()
+            return True
+        self.lexical_index = lexical
+        return True
+
+    @locked
+    def lexical_search_ids(
+        self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Keyword search returning ``(row id, bm25 score)`` hits, best first.
+
+        Never touches the embedding model.
+        `filters` are the metadata filters described in `BaseIndexer.search`.
+        """
+        if filters:
+            validate_filters(filters)
+        try:
+            if not self._ensure_lexical_index():
+                return []
+            allowed = self.candidate_ids(filters) if filters else None
+            return self.lexical_index.search(query, top_k, allowed=allowed)
+        except Exception as e:
+            logger.error("Lexical search failed: %s", e, exc_info=True)
+            return []
+
+    def lexical_search(
+        self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Keyword (BM25) search over raw log entries.
+
+        Args:
+            query (str): The search query; matched on lower-cased word tokens.
+            top_k (int, optional): The number of top results to return. Defaults to 5.
+            filters (Optional[Dict[str, Any]], optional): Metadata filters; see
+                `BaseIndexer.search`.
+
+        Returns:
+            List[Dict[str, Any]]: Metadata of the matching entries, each with a
+            "lexical_score" (BM25 score).
+        """
+        return self.rows_for(
+            self.lexical_search_ids(query, top_k, filters=filters), score_key="lexical_score"
+        )
+
+    @locked
+    def hybrid_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        rrf_k: int = DEFAULT_RRF_K,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuses vector and keyword rankings with reciprocal rank fusion.
+
+        Each retriever contributes a deeper candidate list than `top_k` so entries ranked
+        moderately by both can surface above entries found by only one.
+
+        Args:
+            query (str): The search query.
+            top_k (int, optional): The number of top results to return. Defaults to 5.
+            rrf_k (int, optional): RRF damping constant. Defaults to 60.
+            filters (Optional[Dict[str, Any]], optional): Metadata filters applied to both
+                retrievers; see `BaseIndexer.search`.
+
+        Returns:
+            List[Dict[str, Any]]: Metadata of the best entries, each with an "rrf_score",
+            plus "similarity" and/or "lexical_score" from the retrievers that found it.
+        """
+        depth = max(top_k * 4, 20)
+        vector_hits = self.search_ids([query], top_k=depth, filters=filters)[0]
+        lexical_hits = self.lexical_search_ids(query, top_k=depth, filters=filters)
+        fused = reciprocal_rank_fusion(
+            [[idx for idx, _ in vector_hits], [idx for idx, _ in lexical_hits]], k=rrf_k
+        )
+
+        similarity, lexical_score = dict(vector_hits), dict(lexical_hits)
+        results = []
+        for idx, score in fused[:top_k]:
+            result = dict(self.metadata[idx])
+            result["rrf_score"] = score
+            if idx in similarity:
+                result["similarity"] = similarity[idx]
+            if idx in lexical_score:
+                result["lexical_score"] = lexical_score[idx]
+            results.append(result)
+        return results
@@ -7,16 +7,18 @@ Core features include:
 - Loading and parsing summarized entries organized by date, main category, and subcategory.
 - Extracting summary texts and associated metadata for semantic indexing.
 - Building, saving, loading, and rebuilding a FAISS index for semantic search across all summarized corrections.
+- Incrementally indexing newly written summaries without re-embedding the whole file.
 - Robust error handling and logging for file I/O and data processing.
 - Designed for use in the Zephyrus project to enable fast, flexible semantic search over all summarized log data.
 """
 
-import json
 import logging
-from typing import List, Dict, Tuple, Any
+from pathlib import Path
+from typing import List, Dict, Tuple, Any, Optional
 
 from scripts.paths import ZephyrusPaths
-from scripts.indexers.base_indexer import BaseIndexer
+from scripts.indexers.base_indexer import BaseIndexer, ProgressCallback
+from scripts.utils.file_utils import read_json
 
 logger = logging.getLogger(__name__)
 
@@ -35,20 +37,14 @@ class SummaryIndexer(BaseIndexer):
 
         Args:
             paths (ZephyrusPaths): An instance containing the necessary file paths.
-            autoload (bool, optional): Flag indicating whether to load the index automatically. Defaults to True.
+            autoload (bool, optional): Flag indicating whether to open the persisted index
+                automatically on first search (see `ensure_loaded`). Defaults to True.
         """
         super().__init__(paths=paths, index_name="summary")
         self.summaries_path: str = paths.correction_summaries_file
         self.paths: ZephyrusPaths = paths
         self.autoload: bool = autoload
 
-        if autoload:
-            try:
-                self.load_index()
-                logger.info("Summary FAISS index loaded successfully.")
-            except FileNotFoundError:
-                logger.warning("Summary index files not found; skipping autoload.")
-
     def load_entries(self) -> Tuple[List[str], List[Dict[str, Any]]]:
         """
         Loads summarized entries from the correction_summaries.json file.
@@ -56,19 +52,7 @@ class SummaryIndexer(BaseIndexer):
         Returns:
             Tuple[List[str], List[Dict[str, Any]]]: Summarized entry texts and metadata.
         """
-        try:
-            with open(self.summaries_path, "r", encoding="utf-8") as f:
-                data: Dict[str, Any] = json.load(f)
-        except FileNotFoundError:
-            logger.error("Summaries file not found at %s", self.summaries_path)
-            return [], []
-        except json.JSONDecodeError as e:
-            logger.error("Failed to decode summaries JSON: %s", e, exc_info=True)
-            return [], []
-        except Exception as e:
-            logger.error("Unexpected error loading summaries: %s", e, exc_info=True)
-            return [], []
-
+        data = self._load_source()
         texts: List[str] = []
         meta: List[Dict[str, Any]] = []
         try:
@@ -79,6 +63,21 @@ class SummaryIndexer(BaseIndexer):
 
         return texts, meta
 
+    def _load_source(self) -> Dict[str, Any]:
+        """
+        Reads the correction summaries, through `source_reader` when one is set.
+
+        Returns:
+            Dict[str, Any]: The parsed summaries, or an empty dict if missing or malformed.
+        """
+        if self.source_reader is not None:
+            return self._read_source_reader()
+        if not Path(self.summaries_path).exists():
+            logger.error("Summaries file not found at %s", self.summaries_path)
+            return {}
+        # Shared with other readers of the file until it changes; only iterated here.
+        return read_json(self.summaries_path, use_cache=True)
+
     def _process_categories(
         self, date: str, categories: Dict[str, Any], texts: List[str], meta: List[Dict[str, Any]]
     ) -> Tuple[List[str], List[Dict[str, Any]]]:
@@ -149,6 +148,18 @@ class SummaryIndexer(BaseIndexer):
                 )
         return texts, meta
 
+    def _process_items(
+        self,
+        date: str,
+        main_cat: str,
+        subcat: str,
+        items: List[Any],
+        texts: List[str],
+        meta: List[Dict[str, Any]],
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Leaf hook used by incremental updates; summary items are batches."""
+        return self._process_batches(date, main_cat, subcat, items, texts, meta)
+
     def load_index(self) -> None:
         """
         Load the FAISS index and associated metadata from their respective files.
@@ -176,24 +187,31 @@ class SummaryIndexer(BaseIndexer):
         if not success:
             logger.warning("Summary index rebuild aborted: no entries to index.")
 
-    def build_index_from_logs(self) -> bool:
+    def build_index_from_logs(self, progress: Optional[ProgressCallback] = None) -> bool:
         """
-        Loads entries from file and rebuilds FAISS index.
+        Streams summaries from file and rebuilds FAISS index from scratch.
+
+        The high-water mark is reset to the current source so that later calls to
+        `update_index` only pick up summaries appended after this build.
+
+        Args:
+            progress (Optional[ProgressCallback], optional): Build progress callback; see
+                `build_index_streaming`.
 
         Returns:
             bool: Whether the index was successfully rebuilt.
         """
         try:
-            texts, meta = self.load_entries()
-            if not texts:
-                logger.warning("No summaries to index.")
-                return False
-
-            built = self.build_index(texts, meta)
+            # Filled while the summaries are streamed, i.e. before the index is saved.
+            previous, self.watermark = self.watermark, {}
+            built = self.build_index_streaming(
+                self.iter_entries(counts=self.watermark), progress=progress
+            )
             if built:
-                self.save_index()
                 logger.info("Summary FAISS index rebuilt and saved successfully.")
                 return True
+            logger.warning("No summaries to index.")
+            self.watermark = previous
             return False
         except Exception as e:
             logger.error("Failed to build index from logs: %s", e, exc_info=True)
@@ -203,9 +221,5 @@ class SummaryIndexer(BaseIndexer):
         """
         Rebuild the summary index from scratch.
         """
-        entries, metadata = self.load_entries()
-        if entries:
-            self.build_index(entries, metadata)
-            self.save_index()
-        else:
+        if not self.build_index_from_logs():
             logger.warning("No entries to index during rebuild.")
@@ -1,5 +1,6 @@
 from pathlib import Path
 from dataclasses import dataclass
+from typing import Optional
 from scripts.config.config_loader import get_config_value, get_absolute_path, get_effective_config
 
 
@@ -25,6 +26,7 @@ class ZephyrusPaths:
     raw_log_index_path: Path
     raw_log_metadata_path: Path
     raw_log_file: Path  # ✅ <-- ADD THIS
+    sqlite_db_file: Optional[Path] = None  # used by the "sqlite" log_storage_backend
 
     @staticmethod
     def _resolve_path(config, key, default) -> Path:
@@ -78,6 +80,9 @@ class ZephyrusPaths:
             config, "correction_summaries_path", log_dir / "correction_summaries.json"
         )
         txt_log_file = log_dir / "zephyrus_log.txt"
+        sqlite_db_file = ZephyrusPaths._resolve_path(
+            config, "sqlite_db_path", log_dir / "zephyrus.db"
+        )
         summary_tracker_file = log_dir / "summary_tracker.json"
         config_file = project_root / "scripts" / "config" / "config.json"
 
@@ -108,4 +113,5 @@ class ZephyrusPaths:
             raw_log_index_path=raw_log_index_path,
             raw_log_metadata_path=raw_log_metadata_path,
             raw_log_file=json_log_file,  # ✅ <-- ADD THIS LINE
+            sqlite_db_file=sqlite_db_file,
         )
@@ -4,13 +4,17 @@ from scripts.config.config_manager import ConfigManager
 from scripts.unified_code_assistant.assistant_utils import load_report, get_issue_locations
 from scripts.unified_code_assistant.analysis import analyze_report
 from scripts.unified_code_assistant.strategy import generate_strategy
-from scripts.unified_code_assistant.module_summarizer import summarize_modules
+from scripts.unified_code_assistant.module_summarizer import summarize_modules, module_summary_prompts
+from scripts.unified_code_assistant.context_precompute import ContextPrecompute
 from scripts.unified_code_assistant.prompt_builder import build_enhanced_contextual_prompt
-from scripts.ai.ai_summarizer import AISummarizer
+from scripts.ai.async_ai_summarizer import AsyncAISummarizer
 from scripts.ai.llm_refactor_advisor import build_refactor_prompt
+import logging
 import sys
 import io
 
+logger = logging.getLogger(__name__)
+
 
 def chat_mode(
     report_path: str,
@@ -27,27 +31,31 @@ def chat_mode(
     print("\nType 'exit' or 'quit' to end the conversation.\n")
 
     report_data = load_report(report_path)
-    summarizer = AISummarizer()
+    summarizer = AsyncAISummarizer()
     analysis = analyze_report(report_data, top_n=top_n, path_filter=path_filter)
 
     top_offenders = analysis["top_offenders"]
     summary_metrics = analysis["summary_metrics"]
 
-    module_summaries = summarize_modules(report_data, summarizer, config, path_filter=path_filter)
     file_issues = {fp: get_issue_locations(fp, report_data) for fp, *_ in top_offenders[:top_n]}
 
-    file_recommendations = {}
+    # Module summaries and recommendations are filled in the background, top offenders first,
+    # so the first question can be asked at once; each prompt uses whatever is ready.
+    module_summaries, module_prompts = module_summary_prompts(report_data, config, path_filter=path_filter)
+    jobs = []
     for offender in top_offenders[:top_n]:
         fp = offender[0]
-        refactor_prompt = build_refactor_prompt(
+        jobs.append(("recommendation", fp, build_refactor_prompt(
             [offender],
             config,
             subcategory="Refactor Advisor",
             verbose=False,
             limit=1
-        )
-        recommendation = summarizer.summarize_entry(refactor_prompt, subcategory="Tooling & Automation")
-        file_recommendations[fp] = recommendation
+        )))
+        if fp in module_prompts:
+            jobs.append(("module", fp, module_prompts.pop(fp)))
+    jobs.extend(("module", fp, prompt) for fp, prompt in module_prompts.items())
+    precompute = ContextPrecompute(summarizer, module_summaries, jobs).start()
 
     persona = config.persona
 
@@ -57,6 +65,10 @@ def chat_mode(
             break
 
         print("\n🧠 Processing your question...\n")
+        if not precompute.done():
+            finished, total = precompute.progress()
+            print(f"(Module context still loading: {finished}/{total} ready)")
+        module_summaries, file_recommendations = precompute.snapshot()
         prompt = build_enhanced_contextual_prompt(
             query,
             top_offenders,
@@ -66,8 +78,11 @@ def chat_mode(
             file_recommendations,
             persona
         )
-        response = summarizer.summarize_entry(prompt, subcategory="Refactor Advisor")
-        print(f"\n🤖 {response}\n")
+        print("\n🤖 ", end="", flush=True)
+        for chunk in summarizer.summarize_entry_stream(prompt, subcategory="Refactor Advisor"):
+            print(chunk, end="", flush=True)  # Show the answer as it is generated
+        print("\n")
+        logger.debug("Answer streamed: %s", summarizer.last_stream)
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -90,7 +105,7 @@ def main() -> None:
     config.persona = args.persona
 
     report_data = load_report(args.report_json)
-    summarizer = AISummarizer()
+    summarizer = AsyncAISummarizer()
 
     if args.mode == "chat":
         return chat_mode(args.report_json, config, args.top, args.path_filter)
@@ -0,0 +1,145 @@
+"""
+context_precompute.py
+
+This module provides ContextPrecompute, which prepares the per-file LLM context of the
+unified code assistant's chat mode (module summaries and refactor recommendations) in a
+background thread.
+
+Core features include:
+- A daemon thread running the LLM jobs, so the REPL starts before any call has finished.
+- Overlapping requests through AsyncAISummarizer, bounded by ``llm_max_concurrency``.
+- Failed requests fall back to a placeholder summary; a failing async job is logged without
+  cancelling the others.
+- A blocking `wait` with a timeout for callers that need a result before answering.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from scripts.ai.async_ai_summarizer import SUMMARY_UNAVAILABLE, AsyncAISummarizer
+
+logger = logging.getLogger(__name__)
+
+MODULE_SUBCATEGORY = "Module Functionality"
+RECOMMENDATION_SUBCATEGORY = "Tooling & Automation"
+
+#: ``(kind, file_path, prompt)`` of one background LLM call; kind is "module" or "recommendation".
+Job = Tuple[str, str, str]
+
+
+class ContextPrecompute:
+    """
+    Fills the module summaries and refactor recommendations of chat mode in a background
+    thread, so the REPL can start before any LLM call has finished.
+
+    Jobs run in the given order (put the top offenders first); with an AsyncAISummarizer they
+    overlap up to its ``llm_max_concurrency``, otherwise they run one after another. Results
+    come from the summarizer's response cache when the report was summarized before.
+
+    Attributes:
+        module_summaries (Dict[str, Optional[str]]): Summary per file; None until ready.
+        file_recommendations (Dict[str, str]): Recommendation per file, once ready.
+    """
+
+    def __init__(
+        self,
+        summarizer: Any,
+        module_summaries: Dict[str, Optional[str]],
+        jobs: List[Job],
+    ) -> None:
+        """
+        Args:
+            summarizer: AISummarizer (or AsyncAISummarizer) used for the jobs.
+            module_summaries (Dict[str, Optional[str]]): Summaries known up front, with None
+                for the files that a "module" job fills in.
+            jobs (List[Job]): The LLM calls to run, in priority order.
+        """
+        self.summarizer = summarizer
+        self.module_summaries = dict(module_summaries)
+        self.file_recommendations: Dict[str, str] = {}
+        self._jobs = list(jobs)
+        self._finished = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="chat-precompute", daemon=True)
+
+    def start(self) -> "ContextPrecompute":
+        self._thread.start()
+        return self
+
+    def snapshot(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Returns copies of the module summaries and recommendations that are ready now.
+        """
+        with self._lock:
+            summaries = {fp: s for fp, s in self.module_summaries.items() if s is not None}
+            return summaries, dict(self.file_recommendations)
+
+    def progress(self) -> Tuple[int, int]:
+        """Returns the number of finished and of all jobs."""
+        with self._lock:
+            return self._finished, len(self._jobs)
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for all jobs; returns False if `timeout` expired first."""
+        return self._done.wait(timeout)
+
+    def _store(self, kind: str, file_path: str, result: Optional[str]) -> None:
+        # A failed async request yields None: the module gets a placeholder, the file no
+        # recommendation.
+        with self._lock:
+            if kind == "module":
+                self.module_summaries[file_path] = result or SUMMARY_UNAVAILABLE
+            elif result:
+                self.file_recommendations[file_path] = result
+            self._finished += 1
+
+    def _run(self) -> None:
+        try:
+            if isinstance(self.summarizer, AsyncAISummarizer):
+                asyncio.run(self._run_async())
+            else:
+                for kind, file_path, prompt in self._jobs:
+                    self._store(
+                        kind,
+                        file_path,
+                        self.summarizer.summarize_entry(
+                            prompt, subcategory=self._subcategory(kind)
+                        ),
+                    )
+        except Exception as e:
+            logger.error("Chat context precompute failed: %s", e, exc_info=True)
+        finally:
+            self._done.set()
+
+    async def _run_async(self) -> None:
+        async def one(kind: str, file_path: str, prompt: str) -> None:
+            result = await self.summarizer.summarize_entry_async(prompt, self._subcategory(kind))
+            self._store(kind, file_path, result)
+
+        try:
+            # The summarizer's semaphore admits the jobs in creation order; one failed job
+            # does not cancel the others.
+            results = await asyncio.gather(
+                *(one(*job) for job in self._jobs), return_exceptions=True
+            )
+            for (kind, file_path, _), result in zip(self._jobs, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Chat context %s job for %s failed: %s",
+                        kind,
+                        file_path,
+                        result,
+                        exc_info=result,
+                    )
+        finally:
+            await self.summarizer.aclose()
+
+    @staticmethod
+    def _subcategory(kind: str) -> str:
+        return MODULE_SUBCATEGORY if kind == "module" else RECOMMENDATION_SUBCATEGORY
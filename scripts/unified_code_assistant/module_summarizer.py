@@ -1,23 +1,26 @@
 # summarizer.py
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from scripts.ai.ai_summarizer import AISummarizer
 from scripts.ai import module_docstring_summarizer as docsum
+from scripts.ai.async_ai_summarizer import SUMMARY_UNAVAILABLE, summarize_entry_many
 
-def summarize_modules(report_data: Dict, summarizer: AISummarizer, config, path_filter: Optional[str] = None) -> Dict[str, str]:
+def module_summary_prompts(report_data: Dict, config, path_filter: Optional[str] = None) -> Tuple[Dict[str, Optional[str]], Dict[str, str]]:
     """
-    Generate summaries of module functionality based on docstrings.
+    Collect the module summary prompts of a report without calling the LLM.
 
     Args:
         report_data (Dict): Parsed code analysis report.
-        summarizer (AISummarizer): Summarization engine.
         config: Configuration object.
         path_filter (Optional[str]): Optional substring to filter files.
 
     Returns:
-        Dict[str, str]: Mapping of file paths to summaries.
+        Tuple[Dict[str, Optional[str]], Dict[str, str]]: Every summarized file path in report
+        order, mapped to its summary or to None where it still needs the LLM; and the
+        LLM prompt of each of those files.
     """
-    summaries = {}
+    summaries: Dict[str, Optional[str]] = {}
+    prompts: Dict[str, str] = {}
     for file_path, data in report_data.items():
         if path_filter and path_filter not in file_path:
             continue
@@ -26,8 +29,33 @@ def summarize_modules(report_data: Dict, summarizer: AISummarizer, config, path_
         funcs = docstrings_info.get("functions", [])
 
         if funcs:
-            summaries[file_path] = docsum.summarize_module(file_path, funcs, summarizer, config)
+            summaries[file_path] = None
+            prompts[file_path] = docsum.build_module_prompt(funcs, config)
         elif docstrings_info:
             summaries[file_path] = "Docstrings exist but no functions parsed."
 
+    return summaries, prompts
+
+
+def summarize_modules(report_data: Dict, summarizer: AISummarizer, config, path_filter: Optional[str] = None) -> Dict[str, str]:
+    """
+    Generate summaries of module functionality based on docstrings.
+
+    Args:
+        report_data (Dict): Parsed code analysis report.
+        summarizer (AISummarizer): Summarization engine; an AsyncAISummarizer summarizes
+            the modules concurrently.
+        config: Configuration object.
+        path_filter (Optional[str]): Optional substring to filter files.
+
+    Returns:
+        Dict[str, str]: Mapping of file paths to summaries.
+    """
+    summaries, prompts = module_summary_prompts(report_data, config, path_filter)
+
+    # An AsyncAISummarizer overlaps the LLM calls of all modules.
+    results = summarize_entry_many(
+        summarizer, [(prompt, "Module Functionality") for prompt in prompts.values()]
+    )
+    summaries.update((fp, result or SUMMARY_UNAVAILABLE) for fp, result in zip(prompts, results))
     return summaries
@@ -1,12 +1,13 @@
+import csv
 import json
 import gzip
 import bz2
 import lzma
 import os
 from pathlib import Path
-from typing import Any, Dict, IO
+from typing import Any, Callable, Dict, IO, Iterator, Optional
 
-_COMPRESSED_READERS: dict[str, callable[[str | os.PathLike], IO[bytes]]] = {
+_COMPRESSED_READERS: dict[str, Callable[[str | os.PathLike], IO[bytes]]] = {
     ".gz": gzip.open,
     ".bz2": bz2.open,
     ".xz": lzma.open,
@@ -26,3 +27,38 @@ def load_json_any(path: str | os.PathLike) -> Dict[str, Any]:
     mode = "rt" if reader is open else "rt"  # text mode either way
     with reader(p, mode, encoding="utf-8") as f:
         return json.load(f)
+
+
+RECORD_FORMATS = ("jsonl", "csv")
+
+
+def iter_records(path: str | os.PathLike, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the rows of a JSON Lines or CSV file (optionally .gz/.bz2/.xz compressed) as dicts.
+
+    The format is taken from the file name (``.jsonl``/``.ndjson`` or ``.csv`` before any
+    compression suffix) unless `fmt` is given. Blank JSONL lines are skipped.
+
+    Raises:
+        ValueError: On an unknown format or a JSONL line that is not a JSON object.
+    """
+    p = Path(path)
+    suffixes = [s.lower() for s in p.suffixes if s.lower() not in _COMPRESSED_READERS]
+    fmt = fmt or {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}.get(
+        suffixes[-1] if suffixes else ""
+    )
+    if fmt not in RECORD_FORMATS:
+        raise ValueError(f"Cannot tell the record format of {p}; use one of {RECORD_FORMATS}.")
+
+    reader = _COMPRESSED_READERS.get(p.suffix.lower(), open)
+    with reader(p, "rt", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+            return
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"{p}:{line_no}: expected a JSON object per line.")
+            yield row
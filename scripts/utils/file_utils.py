@@ -12,24 +12,50 @@ Key helpers
 - **sanitize_filename** – remove illegal chars, truncate to 100‑char max
 - **get_timestamp**     – ``YYYY‑MM‑DD_HH‑MM‑SS`` string
 - **safe_path**         – ensure parent dir exists, return ``Path``
-- **write_json / read_json / safe_read_json** – typed, UTF‑8 safe
+- **write_json / read_json / safe_read_json** – typed, UTF‑8 safe; writes are atomic
+- **get_write_stats**   – counters and timings of ``write_json`` calls
+- **json_cache_info / clear_json_cache** – the parsed-JSON cache behind ``read_json(use_cache=True)``
 - **make_backup**       – timestamped ``_backup_YYYY‑MM‑DD_HH‑MM‑SS`` copy
 - **zip_python_files**  – zip only ``*.py`` files, skipping ``.venv``, ``__pycache__``…
 """
 
 from pathlib import Path
-from typing import Union, Iterable, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Union, Iterable, Optional
 import datetime as _dt
 import json
 import logging
 import os
 import re
+import stat
+import tempfile
+import threading
+import time
 import zipfile
 
+try:  # Optional fast encoder; the stdlib encoder is used when it is missing.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 logger = logging.getLogger(__name__)
 DEFAULT_JSON_INDENT = 2
 BACKUP_JSON_INDENT = 4
 
+# Process umask, read once (os.umask can only be queried by setting it).
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+_write_stats_lock = threading.Lock()
+_write_stats: Dict[str, Any] = {}
+
+# Parsed-JSON cache: resolved path → ((mtime_ns, size), data), least recently used first.
+JSON_CACHE_MAX_ENTRIES = 32
+JSON_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_json_cache_lock = threading.Lock()
+_json_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_json_cache_stats = {"hits": 0, "misses": 0}
+
 # ---------------------------------------------------------------------------
 # 🌐  Generic helpers
 # ---------------------------------------------------------------------------
@@ -62,26 +88,161 @@ def safe_path(path: Union[str, Path]) -> Path:
     return path
 
 
-def write_json(path: Union[str, Path], data: dict) -> None:
+def _dumps(data: Any, indent: Optional[int]) -> bytes:
+    """Internal: serialize *data* to UTF‑8 JSON, with orjson when it supports *indent*."""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    separators = None if indent else (",", ":")
+    return json.dumps(data, indent=indent, ensure_ascii=False, separators=separators).encode(
+        "utf-8"
+    )
+
+
+def _file_mode(path: Path) -> int:
+    """Internal: permission bits for rewriting *path*: its current ones, else the umask default."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def write_json(
+    path: Union[str, Path], data: dict, indent: Optional[int] = DEFAULT_JSON_INDENT
+) -> None:
+    """
+    Atomically write *data* as UTF‑8 JSON to *path*.
+
+    The JSON goes to a temp file in the same directory, which is fsynced and renamed over
+    *path*, so a crash leaves either the old or the new file, never a truncated one. The
+    file keeps its permissions; new files get the usual umask-based mode.
+    Pass ``indent=None`` for compact output, which is much faster for large files.
+    """
     path = safe_path(path)
+    start = time.perf_counter()
+    tmp_name = None
     try:
-        with path.open("w", encoding="utf-8") as fp:
-            json.dump(data, fp, indent=DEFAULT_JSON_INDENT, ensure_ascii=False)
+        payload = _dumps(data, indent)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(payload)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.chmod(tmp_name, _file_mode(path))  # mkstemp creates 0600 files
+        os.replace(tmp_name, path)
+        _invalidate_cached(path)
     except Exception:
         logger.exception("Failed to write JSON → %s", path)
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
         raise
+    _record_write(len(payload), time.perf_counter() - start)
+
+
+def _record_write(size: int, seconds: float) -> None:
+    with _write_stats_lock:
+        _write_stats["writes"] = _write_stats.get("writes", 0) + 1
+        _write_stats["bytes"] = _write_stats.get("bytes", 0) + size
+        _write_stats["seconds"] = _write_stats.get("seconds", 0.0) + seconds
+        _write_stats["max_seconds"] = max(_write_stats.get("max_seconds", 0.0), seconds)
+        _write_stats["last_seconds"] = seconds
+
+
+def get_write_stats() -> Dict[str, Any]:
+    """
+    Totals for ``write_json`` calls in this process: ``writes``, ``bytes``, ``seconds``,
+    ``max_seconds`` and ``last_seconds``, plus the ``encoder`` in use.
+    """
+    with _write_stats_lock:
+        stats = {"writes": 0, "bytes": 0, "seconds": 0.0, "max_seconds": 0.0, "last_seconds": 0.0}
+        stats.update(_write_stats)
+    stats["encoder"] = "orjson" if orjson is not None else "json"
+    return stats
+
+
+def reset_write_stats() -> None:
+    """Clear the ``write_json`` counters."""
+    with _write_stats_lock:
+        _write_stats.clear()
+
+
+def _loads(raw: bytes) -> Any:
+    """Internal: parse UTF‑8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _cache_key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+def _invalidate_cached(path: Path) -> None:
+    with _json_cache_lock:
+        _json_cache.pop(_cache_key(path), None)
 
 
-def read_json(path: Union[str, Path]) -> dict:
+def read_json(path: Union[str, Path], use_cache: bool = False) -> dict:
+    """
+    Read and parse the JSON file at *path*; ``{}`` if it is missing or malformed.
+
+    With ``use_cache=True`` the parsed object is kept in a process‑wide LRU cache and
+    returned again while the file's ``(mtime_ns, size)`` is unchanged (``write_json``
+    drops the entry). The cached object is shared between callers: treat it as
+    read‑only and use an uncached read for data you are going to modify.
+    """
     path = _to_path(path)
     try:
-        with path.open("r", encoding="utf-8") as fp:
-            return json.load(fp)
+        if not use_cache:
+            return _loads(path.read_bytes())
+        key = _cache_key(path)
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        with _json_cache_lock:
+            cached = _json_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                _json_cache.move_to_end(key)
+                _json_cache_stats["hits"] += 1
+                return cached[1]
+            _json_cache_stats["misses"] += 1
+        data = _loads(path.read_bytes())
+        _store_cached(key, signature, data)
+        return data
     except Exception as e:
         logger.error("Failed to read JSON from %s: %s", path, e)
         return {}
 
 
+def _store_cached(key: str, signature: Tuple[int, int], data: Any) -> None:
+    with _json_cache_lock:
+        _json_cache[key] = (signature, data)
+        _json_cache.move_to_end(key)
+        total = sum(sig[1] for sig, _ in _json_cache.values())
+        while len(_json_cache) > JSON_CACHE_MAX_ENTRIES or total > JSON_CACHE_MAX_BYTES:
+            _, ((_, size), _) = _json_cache.popitem(last=False)
+            total -= size
+
+
+def json_cache_info() -> Dict[str, int]:
+    """Hits, misses, entries and cached file bytes of the ``read_json`` cache."""
+    with _json_cache_lock:
+        return {
+            **_json_cache_stats,
+            "entries": len(_json_cache),
+            "bytes": sum(sig[1] for sig, _ in _json_cache.values()),
+        }
+
+
+def clear_json_cache() -> None:
+    """Empty the ``read_json`` cache and reset its counters."""
+    with _json_cache_lock:
+        _json_cache.clear()
+        _json_cache_stats.update(hits=0, misses=0)
+
+
 def safe_read_json(filepath: Union[str, Path]) -> dict:
     path = _to_path(filepath)
     if not path.exists():
@@ -9,7 +9,9 @@ Functions:
 """
 
 import json
+from pathlib import Path
 from scripts.config.config_loader import load_config, get_config_value, get_absolute_path
+from scripts.core.log_storage import create_log_storage
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,8 +49,15 @@ def inject_entries_into_summaries() -> None:
     Loads configuration to determine file paths, reads raw logs and correction summaries, and for each batch in the summaries,
     injects the relevant raw entries by extracting their content fields. Updates the summaries file in place.
 
+    The raw log is read through the configured ``log_storage_backend``, so entries kept in
+    a journal or in monthly shards are included.
+
     Returns:
         None
+
+    Raises:
+        RuntimeError: If the backend is ``sqlite``, which keeps the correction summaries in
+            its database rather than in the file this function rewrites.
     """
     config = load_config()
 
@@ -58,9 +67,15 @@ def inject_entries_into_summaries() -> None:
         get_config_value(config, "correction_summaries_path", "logs/correction_summaries.json")
     )
 
-    # Load raw logs and summaries.
-    with open(log_path, "r", encoding="utf-8") as f:
-        raw_logs = json.load(f)
+    backend = get_config_value(config, "log_storage_backend", "json")
+    if backend == "sqlite":
+        raise RuntimeError(
+            "inject_entries_into_summaries rewrites the correction summaries JSON file and "
+            "cannot run against the 'sqlite' log storage backend."
+        )
+
+    # Load raw logs (through the storage backend) and summaries.
+    raw_logs = create_log_storage(backend, Path(log_path)).read_logs()
 
     with open(summary_path, "r", encoding="utf-8") as f:
         correction_summaries = json.load(f)
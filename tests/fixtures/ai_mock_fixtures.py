@@ -4,9 +4,11 @@ AI and External Service Mocking Fixtures
 This module provides fixtures for mocking AI components and external services
 used in the application during testing.
 """
+import asyncio
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
+from pathlib import Path
 from typing import Any
 import types
 import sys
@@ -27,6 +29,64 @@ def mock_ollama() -> None:
         yield mock_generate, mock_chat
 
 
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(monkeypatch: Any, tmp_path: Path) -> None:
+    """
+    Gives every test its own empty LLM response cache under tmp_path, so cached responses
+    never leak into the project tree or between tests.
+    """
+    from scripts.ai import llm_cache
+
+    monkeypatch.setattr(
+        llm_cache,
+        "cache_from_config",
+        lambda config: llm_cache.LLMResponseCache(tmp_path / "llm_cache" / "llm_cache.sqlite3"),
+    )
+    yield
+    llm_cache.clear_llm_cache_registry()
+
+
+class FakeAsyncClient:
+    """Async stand-in for ``ollama.AsyncClient`` that records concurrency and failures."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.01) -> None:
+        self.failures = failures
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.generate_calls = 0
+        self.chat_calls = 0
+
+    async def generate(self, model, prompt):
+        self.generate_calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("connection reset")
+            return {"response": f" summary of {prompt.splitlines()[-1]} "}
+        finally:
+            self.in_flight -= 1
+
+    async def chat(self, model, messages):
+        self.chat_calls += 1
+        return {"message": {"content": "chat answer"}}
+
+
+@pytest.fixture
+def fake_async_client() -> Any:
+    """
+    Provides the FakeAsyncClient class; call it (optionally with ``failures``/``delay``) or
+    subclass it to get a client for ``AsyncAISummarizer(client_factory=...)``.
+
+    Returns:
+        Any: The FakeAsyncClient class.
+    """
+    return FakeAsyncClient
+
+
 # ===========================
 # 🧬 MOCK TRANSFORMERS
 # ===========================
@@ -54,8 +114,14 @@ def mock_sentence_transformer():
     base_indexer = importlib.import_module("scripts.indexers.base_indexer")
     base_indexer.SentenceTransformer = fake_pkg.SentenceTransformer
 
+    # Shared models must come from this test's fake package, not a previous one
+    embedding_models = importlib.import_module("scripts.indexers.embedding_models")
+    embedding_models.unload()
+
     yield
 
+    embedding_models.unload()
+
     # ---- optional cleanup (rarely necessary in autouse fixture) ----
     # sys.modules.pop("sentence_transformers", None)
 
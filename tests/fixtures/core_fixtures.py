@@ -86,6 +86,7 @@ def stub_indexers(
         self.summaries_path = mock_correction_summaries_file
         self.index_path = temp_dir / "vector_store" / "summary_index.faiss"
         self.metadata_path = temp_dir / "vector_store" / "summary_metadata.pkl"
+        self.watermark = {}
 
     def mock_init_raw(self, *args, **kwargs):
         self.paths = kwargs.get("paths") if "paths" in kwargs else kwargs.get("index_root")
@@ -95,6 +96,7 @@ def stub_indexers(
         self.log_path = mock_raw_log_file
         self.index_path = temp_dir / "vector_store" / "raw_index.faiss"
         self.metadata_path = temp_dir / "vector_store" / "raw_metadata.pkl"
+        self.watermark = {}
 
     monkeypatch.setattr(
         "scripts.indexers.summary_indexer.SummaryIndexer.__init__", mock_init_summary
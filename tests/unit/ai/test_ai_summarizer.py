@@ -165,3 +165,24 @@ class TestAISummarizer:
 
             mock_fallback.assert_called_once()
             assert result == "[TIMEOUT FALLBACK]"
+
+    # ======================= Streaming =========================
+
+    def test_summarize_entry_stream_yields_chunks_and_records_ttft(self):
+        summarizer = AISummarizer()
+        chunks = [{"response": "  "}, {"response": " Refactor"}, {"response": " core.py"}]
+
+        with patch("scripts.ai.ai_summarizer.ollama.generate") as mock_generate:
+            mock_generate.return_value = iter(chunks)
+            assert list(summarizer.summarize_entry_stream("Idea")) == ["Refactor", " core.py"]
+            assert mock_generate.call_args.kwargs["stream"] is True
+            assert summarizer.last_stream["chunks"] == 2 and not summarizer.last_stream["cached"]
+            stats = summarizer.last_stream
+            assert 0 <= stats["ttft_seconds"] <= stats["total_seconds"]
+
+            assert list(summarizer.summarize_entry_stream("Idea")) == ["Refactor core.py"]
+            assert summarizer.last_stream["cached"] and mock_generate.call_count == 1
+
+            mock_generate.side_effect = TimeoutError("LLM API timed out")
+            with patch.object(summarizer, "_fallback_summary", return_value="[FALLBACK]"):
+                assert list(summarizer.summarize_entry_stream("Other")) == ["[FALLBACK]"]
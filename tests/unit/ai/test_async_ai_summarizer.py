@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from scripts.ai.async_ai_summarizer import AsyncAISummarizer, summarize_entry_many
+
+pytestmark = [pytest.mark.unit, pytest.mark.ai_mocked]
+
+
+def make_summarizer(client, **limits):
+    summarizer = AsyncAISummarizer(client_factory=lambda: client)
+    summarizer.backoff_seconds = 0
+    for name, value in limits.items():
+        setattr(summarizer, name, value)
+    return summarizer
+
+
+def test_fan_out_is_bounded_ordered_and_cached(fake_async_client):
+    """
+    Test that summarize_entry_many overlaps requests up to the concurrency limit, keeps the
+    request order, and answers repeated prompts from the response cache.
+    """
+    client = fake_async_client()
+    summarizer = make_summarizer(client, max_concurrency=2)
+    requests = [(f"idea {i}", "Ideas") for i in range(6)]
+
+    results = summarizer.summarize_entry_many(requests)
+
+    assert [r.split()[-1] for r in results] == [str(i) for i in range(6)]
+    assert client.peak == 2
+    assert summarize_entry_many(summarizer, requests) == results
+    assert client.generate_calls == 6
+
+
+def test_retries_with_backoff_before_falling_back_to_chat(fake_async_client):
+    """
+    Test that failed or timed-out requests are retried, and that only exhausted retries fall
+    back to the chat API.
+    """
+    client = fake_async_client(failures=2)
+    summarizer = make_summarizer(client, max_retries=2)
+    assert asyncio.run(summarizer.summarize_entry_async("idea", bypass_cache=True)).startswith(
+        "summary"
+    )
+    assert client.generate_calls == 3 and client.chat_calls == 0
+
+    slow = fake_async_client(delay=1)
+    summarizer = make_summarizer(slow, max_retries=1, timeout_seconds=0.01)
+    assert summarizer.summarize_entries_bulk_many([(["a", "b"], "Ideas")]) == ["chat answer"]
+    assert slow.generate_calls == 2 and slow.chat_calls == 1
+
+
+def test_failed_requests_return_none_and_are_not_cached(fake_async_client):
+    """
+    Test that a request whose retries and chat fallback all fail yields None instead of an
+    error text, and that nothing is cached for it.
+    """
+
+    class UnreachableClient(fake_async_client):
+        async def chat(self, model, messages):
+            self.chat_calls += 1
+            raise ConnectionError("connection refused")
+
+    client = UnreachableClient(failures=2)
+    summarizer = make_summarizer(client, max_retries=1)
+    assert summarizer.summarize_entry_many([("idea", "Ideas")]) == [None]
+    assert client.generate_calls == 2 and client.chat_calls == 2
+    assert summarizer.summarize_entry_many([("idea", "Ideas")])[0].startswith("summary")
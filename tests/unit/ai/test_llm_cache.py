@@ -0,0 +1,94 @@
+import pytest
+
+from scripts.ai.ai_summarizer import AISummarizer
+from scripts.ai.llm_cache import LLMResponseCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.ai_mocked]
+
+
+def test_cache_expires_and_evicts_least_recently_used(tmp_path, monkeypatch):
+    """
+    Test that responses are keyed by model, prompt and options, expire after the TTL, and
+    are evicted least recently used first once the entry or size limit is exceeded.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("scripts.ai.llm_cache.time.time", lambda: now[0])
+    cache = LLMResponseCache(
+        tmp_path / "llm.sqlite3", ttl_seconds=60, max_entries=2, touch_seconds=0
+    )
+    key = cache.key("mistral", "Summarize")
+    assert key == LLMResponseCache.key("mistral", "Summarize", {})
+    assert key != cache.key("llama3", "Summarize")
+    assert key != cache.key("mistral", "Summarize", {"temperature": 0})
+
+    cache.put(key, "mistral", "First")
+    cache.put("b", "mistral", "Second")
+    now[0] += 1
+    assert cache.get(key) == "First"
+    cache.put("c", "mistral", "Third")
+    assert cache.get("b") is None and cache.get(key) == "First"
+
+    now[0] += 61
+    assert cache.get(key) is None
+    assert LLMResponseCache(cache.path).get("c") == "Third"
+
+    small = LLMResponseCache(tmp_path / "small.sqlite3", max_bytes=10)
+    small.put("x", "mistral", "12345")
+    small.put("y", "mistral", "678901")
+    assert small.get("x") is None and small.get("y") == "678901"
+    assert small.info()["evictions"] == 1
+
+
+def test_hits_rewrite_last_used_at_most_once_per_touch_interval(tmp_path, monkeypatch):
+    """
+    Test that a hot entry's recency is written once per touch interval rather than on every
+    hit, while the LRU order still reflects entries used longer ago than that.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("scripts.ai.llm_cache.time.time", lambda: now[0])
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_entries=2, touch_seconds=60)
+    cache.put("a", "mistral", "First")
+    cache.put("b", "mistral", "Second")
+
+    statements = []
+    cache._conn.set_trace_callback(statements.append)
+    now[0] += 30
+    for _ in range(5):
+        assert cache.get("a") == "First"
+    assert not [s for s in statements if s.startswith("UPDATE")]
+
+    now[0] += 31
+    assert cache.get("a") == "First"
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+    cache.put("c", "mistral", "Third")
+    assert cache.get("b") is None and cache.get("a") == "First"
+
+
+def test_summarizer_answers_repeated_prompts_from_cache(mock_ollama):
+    """
+    Test that repeating a prompt makes no further LLM call, that bypass_cache asks the model
+    again, and that failed calls are not cached.
+    """
+    mock_generate, mock_chat = mock_ollama
+    summarizer = AISummarizer()
+
+    assert summarizer.summarize_entry("Idea", subcategory="Flow") == "Mock summary"
+    assert summarizer.summarize_entries_bulk(["a", "b"]) == "Mock summary"
+    assert summarizer.summarize_entry("Idea", subcategory="Flow") == "Mock summary"
+    assert summarizer.summarize_entries_bulk(["a", "b"]) == "Mock summary"
+    assert mock_generate.call_count == 2
+    assert AISummarizer().summarize_entry("Idea", subcategory="Flow") == "Mock summary"
+    assert mock_generate.call_count == 2
+
+    mock_generate.return_value = {"response": "Fresh summary"}
+    assert summarizer.summarize_entry("Idea", "Flow", bypass_cache=True) == "Fresh summary"
+    assert summarizer.summarize_entry("Idea", subcategory="Flow") == "Fresh summary"
+    assert mock_generate.call_count == 3
+
+    mock_generate.side_effect = RuntimeError("LLM down")
+    mock_chat.side_effect = TypeError("no chat")
+    assert summarizer.summarize_entry("Other").startswith("Fallback failed")
+    mock_generate.side_effect = mock_chat.side_effect = None
+    assert summarizer.summarize_entry("Other") == "Fresh summary"
+    info = summarizer.cache.info()
+    assert info["hits"] == 3 and info["entries"] == 3
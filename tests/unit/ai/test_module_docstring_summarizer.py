@@ -152,7 +152,7 @@ class TestModuleDocstringSummarizer:
     def test_main_function(self, mock_print, temp_report_file, sample_report):
         """Test the main function processing a report file."""
         with patch('scripts.ai.module_docstring_summarizer.ConfigManager.load_config') as mock_load_config:
-            with patch('scripts.ai.module_docstring_summarizer.AISummarizer') as mock_summarizer_class:
+            with patch('scripts.ai.module_docstring_summarizer.AsyncAISummarizer') as mock_summarizer_class:
                 # Setup mocks
                 mock_config = MagicMock()
                 mock_summarizer = MagicMock()
@@ -1,3 +1,8 @@
+import json
+import threading
+import time
+
+from scripts.utils.file_io import iter_records
 from scripts.utils.file_utils import read_json
 from scripts.core.core import ZephyrusLoggerCore
 import pytest
@@ -55,3 +60,251 @@ def test_generate_global_summary(core_instance):
     assert "global" in corrections
     assert "TestCat" in corrections["global"]
     assert "TestSub" in corrections["global"]["TestCat"]
+
+
+def test_save_entry_extends_raw_index(core_instance):
+    """
+    Test that saving entries keeps the raw log index current without a manual rebuild.
+    """
+    raw_indexer = core_instance.summary_tracker.raw_indexer
+    assert raw_indexer.ensure_loaded()
+    before = raw_indexer.index.ntotal
+    core_instance.save_entry("TestCat", "TestSub", "First indexed idea")
+    core_instance.save_entry("TestCat", "TestSub", "Second indexed idea")
+    assert raw_indexer.index.ntotal == before + 2
+    assert [m["subcategory"] for m in raw_indexer.metadata[-2:]] == ["TestSub", "TestSub"]
+
+
+def test_save_entry_leaves_a_closed_raw_index_alone(core_instance, monkeypatch):
+    """
+    Test that saving never creates, builds or rewrites the raw log index when no search has
+    opened it, and that the first search catches the index up with the saved entries.
+    """
+    from scripts.indexers.raw_log_indexer import RawLogIndexer
+
+    calls = []
+    for name in ("update_index", "build_index_from_logs", "save_index"):
+        original = getattr(RawLogIndexer, name)
+        monkeypatch.setattr(
+            RawLogIndexer,
+            name,
+            lambda self, *a, _n=name, _f=original, **k: calls.append(_n) or _f(self, *a, **k),
+        )
+    for i in range(3):
+        core_instance.save_entry("TestCat", "TestSub", f"Unindexed idea {i}")
+    assert calls == []
+    assert core_instance.summary_tracker.open_raw_indexer is None
+
+    raw_indexer = core_instance.summary_tracker.raw_indexer
+    assert raw_indexer.ensure_loaded()
+    assert [m["subcategory"] for m in raw_indexer.metadata[-3:]] == ["TestSub"] * 3
+
+
+def test_search_raw_logs_many_returns_one_list_per_query(core_instance):
+    """
+    Test that batched raw log search returns results per query, and empty lists without an index.
+    """
+    results = core_instance.search_raw_logs_many(["first", "second"], top_k=1)
+    assert len(results) == 2
+    assert all(len(r) == 1 for r in results)
+
+    core_instance.summary_tracker.summary_indexer = None
+    assert core_instance.search_summaries_many(["a", "b"]) == [[], []]
+
+
+def test_core_hybrid_search_modes(core_instance):
+    """
+    Test that the core exposes lexical, vector and fused raw log search.
+    """
+    core_instance.save_entry("Projects", "Tracker", "Investigate ticket QA-777 regression")
+
+    lexical = core_instance.search_raw_logs_hybrid("qa-777", top_k=3, mode="lexical")
+    assert lexical[0]["subcategory"] == "Tracker"
+
+    hybrid = core_instance.search_raw_logs_hybrid("qa-777", top_k=3)
+    assert hybrid[0]["subcategory"] == "Tracker"
+    assert {"rrf_score", "lexical_score", "similarity"} <= set(hybrid[0])
+
+    assert core_instance.search_raw_logs_hybrid("qa-777", mode="fuzzy") == []
+
+
+def test_core_search_applies_metadata_filters(core_instance):
+    """
+    Test that core search methods forward metadata filters to the indexers.
+    """
+    core_instance.save_entry("Projects", "Tracker", "Filtered search entry")
+    filters = {"main_category": "Projects"}
+
+    results = core_instance.search_raw_logs("entry", top_k=5, filters=filters)
+    assert results and {r["main_category"] for r in results} == {"Projects"}
+    assert core_instance.search_raw_logs_hybrid("entry", filters={"main_category": "None"}) == []
+    assert core_instance.search_raw_logs_many(["entry"], filters=filters)[0] == results
+
+
+def test_export_markdown_regenerates_from_log(core_instance):
+    """
+    Test that export_markdown rewrites the category documents from the raw log.
+    """
+    core_instance.save_entry("Projects", "Tracker", "Exported idea")
+    md_file = core_instance.paths.export_dir / "Projects.md"
+    md_file.write_text("corrupted", encoding="utf-8")
+
+    counts = core_instance.export_markdown()
+    assert counts["documents"] >= 1 and counts["entries"] >= 1
+    assert "- **Tracker**: Exported idea" in md_file.read_text(encoding="utf-8")
+
+
+def test_save_entry_async_group_commits_a_burst(core_instance, monkeypatch):
+    """
+    Test that a burst of async saves is acknowledged once written, lands in the log in
+    submission order and shares log writes, and that save_entry waits behind it.
+    """
+    storage = core_instance.log_manager.storage
+    appends = []
+    append_many = storage.append_many
+    monkeypatch.setattr(
+        storage, "append_many", lambda records: appends.append(len(records)) or append_many(records)
+    )
+
+    futures = [
+        core_instance.save_entry_async("Burst", "Sub", f"Queued idea {i}") for i in range(20)
+    ]
+    assert core_instance.save_entry("Burst", "Sub", "Direct idea") is True
+    assert all(f.result(5) is True for f in futures)
+    assert core_instance.flush_writes(5) is True
+
+    entries = [
+        e["content"]
+        for day in core_instance.log_manager.read_logs().values()
+        for e in day.get("Burst", {}).get("Sub", [])
+    ]
+    assert entries == [f"Queued idea {i}" for i in range(20)] + ["Direct idea"]
+    assert sum(appends) == 21 and len(appends) < 21
+    md_file = core_instance.paths.export_dir / "Burst.md"
+    assert md_file.read_text(encoding="utf-8").count("- **Sub**:") == 21
+
+
+def test_save_entries_bulk_imports_streamed_rows_in_one_commit(
+    core_instance, tmp_path, monkeypatch
+):
+    """
+    Test that a bulk import writes the log once, files historical entries under their own
+    dates, updates the tracker and raw index, and rejects invalid input without writing.
+    """
+    rows = tmp_path / "import" / "ideas.jsonl"
+    rows.parent.mkdir()
+    rows.write_text(
+        "\n".join(
+            json.dumps(
+                {
+                    "main_category": "Imported",
+                    "subcategory": "Old",
+                    "content": f"Historic idea {i}",
+                    "timestamp": f"2024-0{1 + i % 2}-1{i % 3} 09:00:0{i}",
+                }
+            )
+            for i in range(6)
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    raw_indexer = core_instance.summary_tracker.raw_indexer
+    assert raw_indexer.ensure_loaded()
+    indexed = raw_indexer.index.ntotal
+    storage = core_instance.log_manager.storage
+    appends = []
+    append_many = storage.append_many
+    monkeypatch.setattr(
+        storage, "append_many", lambda records: appends.append(len(records)) or append_many(records)
+    )
+
+    assert core_instance.save_entries_bulk(iter_records(rows)) == {"entries": 6, "markdown": True}
+    assert appends == [6]
+    logs = core_instance.log_manager.read_logs()
+    assert [e["content"] for e in logs["2024-01-10"]["Imported"]["Old"]] == ["Historic idea 0"]
+    assert logs["2024-02-11"]["Imported"]["Old"][0]["timestamp"] == "2024-02-11 09:00:01"
+    assert core_instance.summary_tracker.tracker["Imported"]["Old"]["logged_total"] == 6
+    assert raw_indexer.index.ntotal == indexed + 6
+    md = (core_instance.paths.export_dir / "Imported.md").read_text(encoding="utf-8")
+    assert md.index("## 2024-01-10") < md.index("## 2024-02-11")
+
+    with pytest.raises(ValueError):
+        core_instance.save_entries_bulk([{"main_category": "Imported", "content": "No sub"}])
+    with pytest.raises(ValueError, match="unreadable date"):
+        core_instance.save_entries_bulk(
+            [{"main_category": "Imported", "subcategory": "Old", "content": "x", "date": "3/1"}]
+        )
+    assert appends == [6]
+
+
+def test_force_summary_all_runs_batches_concurrently(core_instance, monkeypatch):
+    """
+    Test that every pending batch is summarized with concurrent LLM calls, that the results
+    are committed together, and that batches after a failed one wait for the next run.
+    """
+    size = core_instance.BATCH_SIZE
+    for sub, batches in (("Alpha", 3), ("Beta", 2)):
+        core_instance.save_entries_bulk(
+            {"main_category": "Backlog", "subcategory": sub, "content": f"{sub} {i}"}
+            for i in range(batches * size)
+        )
+
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def summarize(entries, subcategory=None):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        if entries[0] == f"Alpha {size}":
+            raise RuntimeError("LLM unavailable")
+        return f"Summary of {entries[0]}"
+
+    summarizer = core_instance.ai_summarizer
+    monkeypatch.setattr(summarizer, "summarize_entries_bulk", summarize)
+    monkeypatch.setattr(summarizer, "_fallback_summary", lambda prompt: "")
+
+    assert core_instance.force_summary_all(max_concurrency=4) == {"summarized": 3, "failed": 2}
+    assert active[1] > 1
+    summaries = read_json(core_instance.paths.correction_summaries_file)["global"]["Backlog"]
+    assert [r["original_summary"] for r in summaries["Alpha"]] == ["Summary of Alpha 0"]
+    assert [r["original_summary"] for r in summaries["Beta"]] == [
+        "Summary of Beta 0",
+        f"Summary of Beta {size}",
+    ]
+    tracker = core_instance.summary_tracker
+    assert tracker.get_summarized_count("Backlog", "Alpha") == size
+    assert tracker.get_summarized_count("Backlog", "Beta") == 2 * size
+    assert core_instance.summary_engine.pending_batches()[0][2][0]["content"] == f"Alpha {size}"
+
+
+def test_force_summary_all_counts_an_unreachable_async_llm_as_failed(core_instance, monkeypatch):
+    """
+    Test that when both the generate and the chat call of an AsyncAISummarizer fail, the
+    batch is reported as failed and no error text is stored as its summary.
+    """
+    from scripts.ai.async_ai_summarizer import AsyncAISummarizer
+
+    class UnreachableClient:
+        async def generate(self, model, prompt):
+            raise ConnectionError("connection refused")
+
+        async def chat(self, model, messages):
+            raise ConnectionError("connection refused")
+
+    core_instance.save_entries_bulk(
+        {"main_category": "Backlog", "subcategory": "Alpha", "content": f"Alpha {i}"}
+        for i in range(core_instance.BATCH_SIZE)
+    )
+    summarizer = AsyncAISummarizer(client_factory=UnreachableClient)
+    summarizer.max_retries = 0
+    monkeypatch.setattr(core_instance.summary_engine, "summarizer", summarizer)
+
+    assert core_instance.force_summary_all() == {"summarized": 0, "failed": 1}
+    assert core_instance.summary_tracker.get_summarized_count("Backlog", "Alpha") == 0
+    assert "Backlog" not in read_json(core_instance.paths.correction_summaries_file).get(
+        "global", {}
+    )
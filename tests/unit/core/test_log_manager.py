@@ -89,3 +89,18 @@ def test_get_unsummarized_batch(temp_log_files):
     assert len(batch) == 2
     assert batch[0]["content"] == "Entry 2"
     assert batch[1]["content"] == "Entry 3"
+
+
+def test_append_entry_returns_stored_record(temp_log_files):
+    """
+    Test that append_entry returns the exact record written to the JSON log so callers
+    can index it without re-reading the file.
+    """
+    json_log_file, txt_log_file, correction_file = temp_log_files
+    lm = LogManager(
+        json_log_file, txt_log_file, correction_file, "%Y-%m-%d %H:%M:%S", "content", "timestamp"
+    )
+    record = lm.append_entry("2025-03-29", "Cat", "Sub", "Returned")
+    logs = read_json(json_log_file)
+    assert logs["2025-03-29"]["Cat"]["Sub"][0] == record
+    assert record["content"] == "Returned"
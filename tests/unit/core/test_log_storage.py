@@ -0,0 +1,125 @@
+import os
+
+import pytest
+
+from scripts.core.log_manager import LogManager
+from scripts.core.log_storage import JournalLogStorage, create_log_storage
+from scripts.utils.file_utils import read_json, write_json
+
+pytestmark = [pytest.mark.unit, pytest.mark.file_ops]
+
+
+def _entry(i):
+    return {"timestamp": f"2025-03-29 12:{i:02d}:00", "content": f"Entry {i}"}
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "zephyrus_log.json"
+    write_json(path, {"2025-03-28": {"Cat": {"Sub": [_entry(0)]}}})
+    return path
+
+
+def test_journal_appends_without_rewriting_snapshot(snapshot):
+    """
+    Test that journal appends are visible through read_logs but leave the JSON file untouched
+    until the compaction threshold is reached.
+    """
+    storage = JournalLogStorage(snapshot, compact_every=3)
+    before = snapshot.read_bytes()
+    storage.append("2025-03-29", "Cat", "Sub", _entry(1))
+    storage.append("2025-03-29", "Cat", "Other", _entry(2))
+
+    assert snapshot.read_bytes() == before
+    assert storage.read_logs() == {
+        "2025-03-28": {"Cat": {"Sub": [_entry(0)]}},
+        "2025-03-29": {"Cat": {"Sub": [_entry(1)], "Other": [_entry(2)]}},
+    }
+
+    storage.append("2025-03-29", "Cat", "Sub", _entry(3))
+    assert not storage.journal_path.exists()
+    assert read_json(snapshot)["2025-03-29"]["Cat"]["Sub"] == [_entry(1), _entry(3)]
+
+
+def test_journal_survives_torn_line_and_interrupted_compaction(snapshot):
+    """
+    Test that a partially written journal line is skipped and that a compaction interrupted
+    after the snapshot was replaced is not applied twice.
+    """
+    storage = JournalLogStorage(snapshot, compact_every=0)
+    storage.append("2025-03-29", "Cat", "Sub", _entry(1))
+    with open(storage.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"date": "2025-03-29", "main_cat')
+    assert storage.read_logs()["2025-03-29"]["Cat"]["Sub"] == [_entry(1)]
+
+    storage.compact()
+    # Simulate a crash right after the snapshot was replaced.
+    storage.compacting_path.write_text(
+        '{"date": "2025-03-29", "main_category": "Cat", "subcategory": "Sub", '
+        '"entry": {"timestamp": "2025-03-29 12:01:00", "content": "Entry 1"}}\n',
+        encoding="utf-8",
+    )
+    reopened = JournalLogStorage(snapshot)
+    assert reopened.read_logs()["2025-03-29"]["Cat"]["Sub"] == [_entry(1)]
+    assert not reopened.compacting_path.exists()
+
+
+def test_log_manager_uses_configured_backend(snapshot, tmp_path):
+    """
+    Test that LogManager appends, updates and compacts through the journal backend.
+    """
+    lm = LogManager(
+        snapshot,
+        tmp_path / "log.txt",
+        tmp_path / "correction.json",
+        "%Y-%m-%d %H:%M:%S",
+        "content",
+        "timestamp",
+        storage=create_log_storage("journal", snapshot),
+    )
+    record = lm.append_entry("2025-03-29", "Cat", "Sub", "Journaled")
+    assert os.path.getsize(lm.storage.journal_path) > 0
+    assert lm.read_logs()["2025-03-29"]["Cat"]["Sub"] == [record]
+
+    lm.update_logs(lambda data: data.pop("2025-03-28"))
+    assert read_json(snapshot) == {"2025-03-29": {"Cat": {"Sub": [record]}}}
+    assert not lm.storage.journal_path.exists()
+
+    with pytest.raises(ValueError):
+        create_log_storage("csv", snapshot)
+
+
+def _scan(logs, main, sub, offset, size):
+    entries = [e for d in sorted(logs) for e in logs[d].get(main, {}).get(sub, [])]
+    batch = entries[offset : offset + size]
+    return batch if len(batch) == size else []
+
+
+@pytest.mark.parametrize("backend", ["json", "journal"])
+def test_unsummarized_batch_uses_positions_without_rereading(snapshot, backend, monkeypatch):
+    """
+    Test that batches served from the position index match a full scan, stay current across
+    appends (including earlier dates) without re-reading the log, and notice external edits.
+    """
+    storage = create_log_storage(backend, snapshot, compact_every=4)
+    for i, day in enumerate(["2025-03-29", "2025-03-27", "2025-03-29", "2025-03-28"] * 2):
+        storage.append(day, "Cat", "Sub", _entry(i + 1))
+    logs = storage.read_logs()
+    assert storage.unsummarized_batch("Cat", "Sub", 0, 2) == [_entry(2), _entry(6)]
+    storage.append("2025-03-26", "Cat", "Sub", _entry(20))
+    _add_entry(logs, "2025-03-26", _entry(20))
+    monkeypatch.setattr(storage, "read_logs", lambda: pytest.fail("log was re-read"))
+    for offset in range(11):
+        for size in (1, 3, 5):
+            expected = _scan(logs, "Cat", "Sub", offset, size)
+            assert storage.unsummarized_batch("Cat", "Sub", offset, size) == expected
+    assert storage.unsummarized_batch("Cat", "Missing", 0, 1) == []
+    monkeypatch.undo()
+
+    storage.compact()
+    write_json(snapshot, {"2025-04-01": {"Cat": {"Sub": [_entry(30)]}}})
+    assert storage.unsummarized_batch("Cat", "Sub", 0, 1) == [_entry(30)]
+
+
+def _add_entry(logs, day, entry):
+    logs.setdefault(day, {}).setdefault("Cat", {}).setdefault("Sub", []).append(entry)
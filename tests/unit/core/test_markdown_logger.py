@@ -0,0 +1,84 @@
+import pytest
+
+from scripts.core.log_storage import JsonLogStorage
+from scripts.core.markdown_logger import MarkdownLogger
+from scripts.utils.file_utils import write_json
+
+pytestmark = [pytest.mark.unit, pytest.mark.file_ops]
+
+
+def test_sections_mode_appends_and_assembles_lazily(tmp_path):
+    """
+    Test that sections mode appends entries to per-day section files without touching the
+    category document, and assembles the document on demand only when sections changed.
+    """
+    md = MarkdownLogger(tmp_path, mode="sections", assemble_interval=60)
+    assert md.log("2025-03-29", "Ideas/Work", "Sub", "first")
+    assert md.log("2025-03-28", "Ideas/Work", "Other", "earlier")
+    assert md.log("2025-03-29", "Ideas/Work", "Sub", "second")
+    doc = tmp_path / "IdeasWork.md"
+    assert not doc.exists()
+
+    assert md.assemble() == 1
+    assert doc.read_text(encoding="utf-8") == (
+        "# Ideas/Work\n\n## 2025-03-28\n\n- **Other**: earlier\n"
+        "\n## 2025-03-29\n\n- **Sub**: second\n- **Sub**: first\n"
+    )
+    assert md.assemble() == 0
+
+    with pytest.raises(ValueError):
+        MarkdownLogger(tmp_path, mode="html")
+
+
+def test_modes_agree_and_sections_assemble_after_each_burst(tmp_path):
+    """
+    Test that sections mode assembles its documents after a write burst without an explicit
+    call, and produces the same document as rewrite mode, newest entry first per date.
+    """
+    rewrite = MarkdownLogger(tmp_path / "rewrite", mode="rewrite")
+    sections = MarkdownLogger(tmp_path / "sections", mode="sections", assemble_interval=0)
+    for md in (rewrite, sections):
+        (tmp_path / md.mode).mkdir()
+        md.log_many([("2025-03-28", "A", "x", "one"), ("2025-03-29", "A", "x", "two")])
+        md.log("2025-03-29", "A", "y", "multi\nline")
+
+    expected = "# A\n\n## 2025-03-28\n\n- **x**: one\n\n## 2025-03-29\n\n- **y**: multi\nline\n- **x**: two\n"
+    assert (tmp_path / "rewrite" / "A.md").read_text(encoding="utf-8") == expected
+    assert (tmp_path / "sections" / "A.md").read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.parametrize("mode", ["rewrite", "sections"])
+def test_export_all_regenerates_documents_in_one_pass(tmp_path, mode):
+    """
+    Test that the bulk export rebuilds every category document from the log, replacing
+    stale exports, and that later section appends continue from the regenerated sections.
+    """
+    log_file = tmp_path / "log.json"
+    write_json(
+        log_file,
+        {
+            "2025-03-29": {"A": {"x": [{"content": "a2"}]}, "B": {"y": [{"content": "b1"}]}},
+            "2025-03-28": {"A": {"x": [{"content": "a1"}], "z": [{"content": "a0"}]}},
+        },
+    )
+    export_dir = tmp_path / "md_exports"
+    export_dir.mkdir()
+    (export_dir / "A.md").write_text("stale", encoding="utf-8")
+    md = MarkdownLogger(export_dir, mode=mode)
+
+    assert md.export_all(JsonLogStorage(log_file).iter_shards()) == {"documents": 2, "entries": 4}
+    expected_a = (
+        "# A\n\n## 2025-03-28\n\n- **z**: a0\n- **x**: a1\n\n## 2025-03-29\n\n- **x**: a2\n"
+    )
+    assert (export_dir / "A.md").read_text(encoding="utf-8") == expected_a
+    assert (export_dir / "B.md").read_text(
+        encoding="utf-8"
+    ) == "# B\n\n## 2025-03-29\n\n- **y**: b1\n"
+    assert not list(export_dir.glob("*.tmp"))
+
+    if mode == "sections":
+        md.log("2025-03-30", "A", "x", "a3")
+        md.assemble("A")
+        assert (export_dir / "A.md").read_text(encoding="utf-8") == (
+            expected_a + "\n## 2025-03-30\n\n- **x**: a3\n"
+        )
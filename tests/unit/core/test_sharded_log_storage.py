@@ -0,0 +1,133 @@
+import pytest
+
+from scripts.core.environment_bootstrapper import EnvironmentBootstrapper
+from scripts.core.log_storage import create_log_storage
+from scripts.core.sharded_log_storage import ShardedLogStorage
+from scripts.indexers.base_indexer import BaseIndexer
+from scripts.utils.file_utils import read_json, write_json
+from tests.mocks.test_helpers import make_fake_paths
+
+pytestmark = [pytest.mark.unit, pytest.mark.file_ops]
+
+
+def _entry(day, i):
+    return {"timestamp": f"{day} 12:{i:02d}:00", "content": f"Entry {day}/{i}"}
+
+
+DAYS = ["2025-01-15", "2025-02-03", "2025-02-20", "2025-03-01"]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = create_log_storage("sharded", tmp_path / "zephyrus_log.json")
+    for i in range(3):
+        for day in DAYS:
+            storage.append(day, "Cat", "Sub", _entry(day, i))
+    return storage
+
+
+def test_appends_touch_only_their_month_and_batches_skip_shards(storage, monkeypatch):
+    """
+    Test that an append rewrites only the shard of its month, and that unsummarized batches
+    read only the shards holding the requested entries.
+    """
+    january = storage.shard_path("2025-01").read_bytes()
+    storage.append("2025-03-02", "Cat", "Other", _entry("2025-03-02", 0))
+    assert storage.shard_path("2025-01").read_bytes() == january
+    assert sorted(p.name for p in storage.shard_dir.iterdir()) == [
+        "2025-01.json",
+        "2025-02.json",
+        "2025-03.json",
+        "manifest.json",
+    ]
+    logs = storage.read_logs()
+    assert list(logs) == DAYS + ["2025-03-02"]
+
+    loaded = []
+    load_shard = storage._load_shard
+    monkeypatch.setattr(
+        storage, "_load_shard", lambda key, **kw: loaded.append(key) or load_shard(key, **kw)
+    )
+    assert storage.unsummarized_batch("Cat", "Sub", 7, 4) == [
+        _entry("2025-02-20", 1),
+        _entry("2025-02-20", 2),
+        _entry("2025-03-01", 0),
+        _entry("2025-03-01", 1),
+    ]
+    assert loaded == ["2025-02", "2025-03"]
+    assert storage.unsummarized_batch("Cat", "Sub", 10, 3) == []
+    assert storage.unsummarized_batch("Cat", "Sub", 0, 2) == [
+        _entry("2025-01-15", 0),
+        _entry("2025-01-15", 1),
+    ]
+
+
+def test_manifest_recounts_changed_shards_and_splits_single_file(storage, tmp_path):
+    """
+    Test that a shard changed behind the manifest is recounted on open, that updates regroup
+    the shards, and that an existing single-file log is split on first use.
+    """
+    write_json(storage.shard_path("2025-01"), {"2025-01-15": {"Cat": {"Sub": []}}})
+    reopened = ShardedLogStorage(storage.json_log_file)
+    assert reopened.unsummarized_batch("Cat", "Sub", 6, 3) == [
+        _entry("2025-03-01", i) for i in range(3)
+    ]
+
+    reopened.update(lambda data: data.pop("2025-03-01"))
+    assert not reopened.shard_path("2025-03").exists()
+    assert set(read_json(reopened.manifest_path)["shards"]) == {"2025-01", "2025-02"}
+
+    single = tmp_path / "legacy" / "zephyrus_log.json"
+    legacy = {"2024-12-31": {"Cat": {"Sub": [_entry("2024-12-31", 0)]}}}
+    write_json(single, legacy)
+    split = ShardedLogStorage(single)
+    assert read_json(split.shard_path("2024-12")) == legacy
+    assert split.read_logs() == legacy
+    # The original is moved aside, so it is neither read stale nor split again.
+    assert not single.exists()
+    assert read_json(single.with_name("zephyrus_log.json.migrated")) == legacy
+    split.update(lambda data: data.clear())
+    assert ShardedLogStorage(single).read_logs() == {}
+
+
+def test_incremental_index_update_skips_indexed_shards(storage):
+    """
+    Test that catching up an index reads only the shards whose counts exceed the
+    high-water mark.
+    """
+    read = []
+
+    def shards():
+        for counts, reader in storage.iter_shards():
+            yield counts, lambda reader=reader, c=counts: read.append(sorted(c)) or reader()
+
+    indexer = BaseIndexer.__new__(BaseIndexer)
+    indexer.source_shards = shards
+    indexer._process_items = lambda date, main, sub, items, texts, meta: (
+        texts + [e["content"] for e in items],
+        meta + [{"date": date} for _ in items],
+    )
+    texts, _, watermark = indexer.load_new_entries({})
+    assert len(texts) == 12 and len(read) == 3
+
+    storage.append("2025-03-01", "Cat", "Sub", _entry("2025-03-01", 9))
+    read.clear()
+    texts, _, updated = indexer.load_new_entries(watermark)
+    assert texts == ["Entry 2025-03-01/9"]
+    assert read == [["2025-03-01"]]
+    assert updated["2025-01-15"]["Cat"]["Sub"] == 3
+    assert updated["2025-03-01"]["Cat"]["Sub"] == 4
+
+
+def test_bootstrap_leaves_no_single_file_log_next_to_the_shards(tmp_path):
+    """
+    Test that bootstrapping for the sharded backend does not recreate the empty single-file
+    log that was moved aside by the split.
+    """
+    paths = make_fake_paths(tmp_path)
+    EnvironmentBootstrapper(paths).bootstrap()
+    assert paths.json_log_file.exists()
+
+    ShardedLogStorage(paths.json_log_file)
+    EnvironmentBootstrapper(paths, create_json_log=False).bootstrap()
+    assert not paths.json_log_file.exists()
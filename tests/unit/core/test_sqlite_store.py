@@ -0,0 +1,156 @@
+import pytest
+
+from scripts.core.log_manager import LogManager
+from scripts.core.log_storage import JsonLogStorage
+from scripts.core.sharded_log_storage import ShardedLogStorage
+from scripts.core.sqlite_store import SQLiteLogStorage, SQLiteStore
+from scripts.core.summary_tracker import SummaryTracker
+from scripts.paths import ZephyrusPaths
+from scripts.utils.file_utils import write_json
+
+pytestmark = [pytest.mark.unit, pytest.mark.file_ops]
+
+
+def _entry(day, minute):
+    return {"timestamp": f"2025-03-{day} 12:{minute:02d}:00", "content": f"Entry {day}/{minute}"}
+
+
+LOGS = {
+    "2025-03-30": {"Cat": {"Sub": [_entry(30, 0)]}},
+    "2025-03-29": {"Cat": {"Sub": [_entry(29, 0), _entry(29, 1)], "Other": [_entry(29, 2)]}},
+}
+SUMMARIES = {
+    "global": {
+        "Cat": {
+            "Sub": [
+                {"batch": "a", "original_summary": "done", "corrected_summary": ""},
+                {"batch": "b", "original_summary": "", "corrected_summary": ""},
+            ]
+        }
+    }
+}
+
+
+@pytest.fixture
+def json_files(tmp_path):
+    log_file, summaries_file = tmp_path / "log.json", tmp_path / "summaries.json"
+    write_json(log_file, LOGS)
+    write_json(summaries_file, SUMMARIES)
+    return log_file, summaries_file
+
+
+def test_migration_round_trips_and_queries_match_json(json_files, tmp_path):
+    """
+    Test that migrated data reads back identically and that indexed batch and count
+    queries agree with the JSON implementations.
+    """
+    log_file, summaries_file = json_files
+    store = SQLiteStore(tmp_path / "zephyrus.db")
+    counts = store.migrate_from_json(log_file, summaries_file)
+
+    assert counts == {"entries": 4, "summaries": 2, "tracker": 2}
+    assert store.read_logs() == LOGS
+    assert store.read_summaries() == SUMMARIES
+    assert store.read_tracker() == {
+        "Cat": {
+            "Sub": {"summarized_total": 1, "logged_total": 3},
+            "Other": {"summarized_total": 0, "logged_total": 1},
+        }
+    }
+
+    sqlite_storage, json_storage = SQLiteLogStorage(store), JsonLogStorage(log_file)
+    for offset, size in [(0, 2), (1, 2), (2, 1), (2, 2)]:
+        expected = json_storage.unsummarized_batch("Cat", "Sub", offset, size)
+        assert sqlite_storage.unsummarized_batch("Cat", "Sub", offset, size) == expected
+    assert store.unsummarized_batch("Cat", "Sub", 0, 2) == [_entry(29, 0), _entry(29, 1)]
+
+    with pytest.raises(ValueError):
+        store.migrate_from_json(log_file, summaries_file)
+
+
+def test_tracker_and_log_manager_run_on_sqlite(tmp_path):
+    """
+    Test that entries, summaries and tracker counts go to the database when the log
+    manager uses the SQLite backend, and that validation and rebuild query it.
+    """
+    paths = ZephyrusPaths.from_config(tmp_path)
+    paths.summary_tracker_file = tmp_path / "tracker.json"
+    storage = SQLiteLogStorage(SQLiteStore(tmp_path / "zephyrus.db"))
+    lm = LogManager(
+        tmp_path / "unused.json",
+        tmp_path / "log.txt",
+        tmp_path / "unused_summaries.json",
+        "%Y-%m-%d %H:%M:%S",
+        "content",
+        "timestamp",
+        storage=storage,
+    )
+    tracker = SummaryTracker(paths, log_manager=lm)
+
+    for i in range(3):
+        lm.append_entry("2025-03-29", "Cat", "Sub", f"Entry {i}")
+        tracker.update("Cat", "Sub", new_entries=1)
+    lm.update_correction_summaries("Cat", "Sub", {"batch": "x", "original_summary": "s"})
+    tracker.update("Cat", "Sub", summarized=1)
+
+    assert not (tmp_path / "unused.json").exists()
+    assert not paths.summary_tracker_file.exists()
+    assert storage.read_tracker() == {"Cat": {"Sub": {"summarized_total": 1, "logged_total": 3}}}
+    assert lm.get_unsummarized_batch("Cat", "Sub", 1, 2)[0]["content"] == "Entry 1"
+    assert tracker.validate()
+
+    storage.update_tracker("Cat", "Sub", summarized=5)
+    assert not SummaryTracker(paths, log_manager=lm).validate()
+    tracker.rebuild(refresh_indexes=False)
+    assert tracker.tracker == {"Cat": {"Sub": {"summarized_total": 1, "logged_total": 3}}}
+    assert SummaryTracker(paths, log_manager=lm).validate()
+
+
+def test_rows_and_tracker_counts_commit_in_one_transaction(tmp_path):
+    """
+    Test that entries and the tracker counts of them written inside a log manager
+    transaction are rolled back together, and committed together otherwise.
+    """
+    paths = ZephyrusPaths.from_config(tmp_path)
+    storage = SQLiteLogStorage(SQLiteStore(tmp_path / "zephyrus.db"))
+    lm = LogManager(
+        tmp_path / "unused.json",
+        tmp_path / "log.txt",
+        tmp_path / "unused_summaries.json",
+        "%Y-%m-%d %H:%M:%S",
+        "content",
+        "timestamp",
+        storage=storage,
+    )
+    tracker = SummaryTracker(paths, log_manager=lm)
+
+    with pytest.raises(RuntimeError):
+        with lm.transaction():
+            lm.append_entries([("2025-03-29", "Cat", "Sub", "Lost")])
+            tracker.update("Cat", "Sub", new_entries=1)
+            raise RuntimeError("crash before commit")
+    assert storage.read_logs() == {} and storage.read_tracker() == {}
+
+    with lm.transaction():
+        lm.append_entries([("2025-03-29", "Cat", "Sub", "Kept")])
+        tracker.update("Cat", "Sub", new_entries=1)
+    assert not storage.in_transaction
+    assert storage.read_tracker() == {"Cat": {"Sub": {"summarized_total": 0, "logged_total": 1}}}
+
+
+def test_migration_reads_the_sharded_backend_view(json_files, tmp_path):
+    """
+    Test that migrating from a storage backend's view imports entries kept only in monthly
+    shards, which the stale single-file log no longer holds.
+    """
+    log_file, summaries_file = json_files
+    sharded = ShardedLogStorage(log_file)
+    sharded.append("2025-04-01", "Cat", "Sub", _entry(1, 0))
+    write_json(log_file, {})
+
+    store = SQLiteStore(tmp_path / "zephyrus.db")
+    counts = store.migrate(sharded.read_logs(), SUMMARIES)
+
+    assert counts["entries"] == 5
+    assert store.read_logs()["2025-04-01"] == {"Cat": {"Sub": [_entry(1, 0)]}}
+    assert store.read_tracker()["Cat"]["Sub"] == {"summarized_total": 1, "logged_total": 4}
@@ -1,4 +1,7 @@
-from scripts.utils.file_utils import write_json
+import os
+
+from scripts.core.log_manager import LogManager
+from scripts.utils.file_utils import clear_json_cache, json_cache_info, read_json, write_json
 from scripts.core.summary_tracker import SummaryTracker
 from scripts.paths import ZephyrusPaths
 import pytest
@@ -79,3 +82,107 @@ def test_update_summary_tracker(tracker_file, tmp_path):
     tracker.update("Cat", "Sub", new_entries=2, summarized=1)
     assert tracker.tracker["Cat"]["Sub"]["logged_total"] == 5
     assert tracker.tracker["Cat"]["Sub"]["summarized_total"] == 2
+
+    snapshot = tracker.snapshot()
+    tracker.update("Cat", "New", new_entries=1)
+    assert snapshot == {"Cat": {"Sub": {"logged_total": 5, "summarized_total": 2}}}
+
+
+def test_indexers_created_on_first_access(tracker_file, tmp_path, mocker):
+    """
+    Test that constructing the tracker does not create the indexers, and that
+    rebuilding counts without refreshing indexes leaves them untouched.
+    """
+    paths = ZephyrusPaths.from_config(tmp_path)
+    paths.summary_tracker_file = tracker_file
+    paths.json_log_file = tmp_path / "dummy.json"
+    write_json(paths.json_log_file, {})
+    init_raw = mocker.spy(SummaryTracker, "_safe_init_raw_indexer")
+
+    tracker = SummaryTracker(paths)
+    tracker.rebuild(refresh_indexes=False)
+    assert init_raw.call_count == 0
+
+    assert tracker.raw_indexer is tracker.raw_indexer
+    assert init_raw.call_count == 1
+
+
+def test_rebuild_writes_tracker_once(tmp_path, mocker):
+    """
+    Test that a rebuild counts every subcategory in memory and replaces the tracker
+    file with a single atomic write.
+    """
+    paths = ZephyrusPaths.from_config(tmp_path)
+    paths.summary_tracker_file = tmp_path / "tracker.json"
+    paths.json_log_file = tmp_path / "logs.json"
+    entry = {"timestamp": "2025-03-29 12:00:00", "content": "Entry"}
+    write_json(
+        paths.json_log_file,
+        {"2025-03-29": {f"Cat{i}": {f"Sub{j}": [entry] for j in range(5)} for i in range(4)}},
+    )
+    tracker = SummaryTracker(paths)
+    replace = mocker.spy(os, "replace")
+
+    tracker.rebuild(refresh_indexes=False)
+
+    assert replace.call_count == 1
+    assert not tracker.dirty
+    assert read_json(paths.summary_tracker_file)["Cat3"]["Sub4"]["logged_total"] == 1
+
+
+def test_write_back_batches_updates_until_flush(tracker_file, tmp_path, monkeypatch):
+    """
+    Test that in write-back mode updates only mark the tracker dirty until the update
+    threshold is reached or it is flushed explicitly.
+    """
+    monkeypatch.setattr(
+        SummaryTracker, "_write_back_settings", staticmethod(lambda: (True, 3, 3600.0))
+    )
+    paths = ZephyrusPaths.from_config(tmp_path)
+    paths.summary_tracker_file = tracker_file
+    tracker = SummaryTracker(paths)
+
+    tracker.update("Cat", "Sub", new_entries=1)
+    tracker.update("Cat", "Sub", new_entries=1)
+    assert tracker.dirty and read_json(tracker_file) == {}
+    tracker.update("Cat", "Sub", new_entries=1)
+    assert not tracker.dirty
+    assert read_json(tracker_file)["Cat"]["Sub"]["logged_total"] == 3
+
+    tracker.update("Cat", "Sub", summarized=1)
+    assert read_json(tracker_file)["Cat"]["Sub"]["summarized_total"] == 0
+    tracker.flush()
+    assert read_json(tracker_file)["Cat"]["Sub"]["summarized_total"] == 1
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_validate_and_rebuild_parse_each_file_once(sample_logs, tmp_path):
+    """
+    Test that validating, rebuilding and reading the index sources through the log
+    manager parse the raw log and the correction summaries once between them.
+    """
+    log_file, _ = sample_logs
+    paths = ZephyrusPaths.from_config(tmp_path)
+    paths.summary_tracker_file = tmp_path / "tracker.json"
+    paths.json_log_file = log_file
+    paths.correction_summaries_file = tmp_path / "summaries.json"
+    write_json(paths.correction_summaries_file, {"global": {}})
+    lm = LogManager(
+        log_file,
+        tmp_path / "log.txt",
+        paths.correction_summaries_file,
+        "%Y-%m-%d %H:%M:%S",
+        "content",
+        "timestamp",
+    )
+    clear_json_cache()
+    tracker = SummaryTracker(paths, log_manager=lm)
+
+    tracker.validate()
+    tracker.rebuild(refresh_indexes=False)
+    tracker.validate()
+    lm.read_logs()
+    lm.read_correction_summaries()
+
+    assert json_cache_info()["misses"] == 2
+    clear_json_cache()
@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from scripts.core.write_pipeline import WritePipeline
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_bursts_commit_in_order_as_one_batch():
+    """
+    Test that items submitted while a commit is running are coalesced into the next commit,
+    in submission order, and that every Future receives its own result.
+    """
+    release = threading.Event()
+    batches = []
+
+    def commit(items):
+        batches.append(list(items))
+        if len(batches) == 1:
+            release.wait(5)
+        return [item * 10 for item in items]
+
+    pipeline = WritePipeline(commit, linger_seconds=0)
+    first = pipeline.submit(0)
+    while not batches:
+        pass
+    burst = [pipeline.submit(i) for i in range(1, 6)]
+    release.set()
+
+    assert [f.result(5) for f in [first] + burst] == [0, 10, 20, 30, 40, 50]
+    assert batches == [[0], [1, 2, 3, 4, 5]]
+    assert pipeline.stats == {"items": 6, "batches": 2}
+    pipeline.close()
+
+
+def test_flush_close_and_commit_errors():
+    """
+    Test that flush waits for queued items, that a failed commit fails the Futures of its
+    batch, and that a closed pipeline rejects new items.
+    """
+    committed = []
+
+    def commit(items):
+        if "bad" in items:
+            raise OSError("disk full")
+        committed.extend(items)
+        return [True] * len(items)
+
+    pipeline = WritePipeline(commit, max_batch=2)
+    futures = [pipeline.submit(i) for i in range(5)]
+    assert pipeline.flush(5) is True
+    assert all(f.done() for f in futures) and committed == list(range(5))
+
+    failed = pipeline.submit("bad")
+    with pytest.raises(OSError):
+        failed.result(5)
+
+    pipeline.submit("last")
+    pipeline.close(5)
+    assert committed[-1] == "last"
+    with pytest.raises(RuntimeError):
+        pipeline.submit("late")
+    assert pipeline.flush() is False
@@ -28,6 +28,21 @@ def test_force_summarize_all_delegation(dummy_core):
     assert result == "Summarized!"
 
 
+def test_force_summarize_all_async_runs_off_the_calling_thread(dummy_core):
+    import threading
+
+    threads = []
+    dummy_core.force_summary_all.side_effect = lambda: threads.append(threading.current_thread())
+    controller = GUIController(logger_core=dummy_core)
+    future = controller.force_summarize_all_async()
+    assert future.result(timeout=5) is None
+    assert threads and threads[0] is not threading.current_thread()
+
+    dummy_core.force_summary_all.side_effect = RuntimeError("LLM unavailable")
+    with pytest.raises(RuntimeError):
+        controller.force_summarize_all_async().result(timeout=5)
+
+
 def test_search_summaries_delegation(dummy_core):
     controller = GUIController(logger_core=dummy_core)
     result = controller.search_summaries("query")
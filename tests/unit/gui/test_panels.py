@@ -15,6 +15,7 @@ Intended for use in automated testing to ensure GUI components function as expec
 
 import unittest
 import tkinter as tk
+from concurrent.futures import Future
 from unittest.mock import MagicMock
 import pytest
 
@@ -107,6 +108,21 @@ class TestActionPanel(unittest.TestCase):
         self.panel.on_summarize()
         self.controller.force_summarize_all.assert_called_once()
 
+    def test_on_summarize_polls_async_result(self):
+        """
+        Test that a controller offering force_summarize_all_async is used without blocking,
+        and that the button is re-enabled once the result arrives.
+        """
+        future = Future()
+        self.controller.force_summarize_all_async = MagicMock(return_value=future)
+        self.panel.on_summarize()
+        self.controller.force_summarize_all.assert_not_called()
+        assert str(self.panel.summarize_button["state"]) == tk.DISABLED
+
+        future.set_result({"summarized": 1, "failed": 0})
+        self.panel._await_summary(future)
+        assert str(self.panel.summarize_button["state"]) == tk.NORMAL
+
     def test_on_rebuild_calls_controller(self):
         """
         Test that the rebuild action calls the appropriate method on the controller.
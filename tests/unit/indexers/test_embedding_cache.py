@@ -0,0 +1,106 @@
+import json
+
+import numpy as np
+import pytest
+
+from scripts.indexers.embedding_cache import EmbeddingCache, get_embedding_cache
+from tests.mocks.test_helpers import make_raw_indexer, make_fake_paths
+
+pytestmark = [pytest.mark.unit, pytest.mark.indexing]
+
+
+class CountingModel:
+    """Embedding model double returning a distinct vector per text length."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        return np.array([[float(len(t))] * 4 for t in texts], dtype="float32")
+
+
+def test_encode_only_embeds_misses_once(tmp_path):
+    """
+    Test that the cache de-duplicates misses, serves hits from memory and keeps row order.
+    """
+    cache = EmbeddingCache(tmp_path, "model-a")
+    model = CountingModel()
+    first = cache.encode(["a", "bb", "a"], model)
+    second = cache.encode(["bb", "ccc"], model)
+
+    assert model.calls == [["a", "bb"], ["ccc"]]
+    assert first.dtype == np.float32
+    assert first[:, 0].tolist() == [1.0, 2.0, 1.0]
+    assert second[:, 0].tolist() == [2.0, 3.0]
+    assert cache.hits == 1
+
+
+def test_cache_persists_and_invalidates_on_model_change(tmp_path):
+    """
+    Test that vectors survive a reload for the same model and are discarded for another.
+    """
+    cache = EmbeddingCache(tmp_path, "model-a")
+    cache.encode(["persisted"], CountingModel())
+    cache.save()
+
+    same_model = EmbeddingCache(tmp_path, "model-a")
+    assert len(same_model) == 1
+
+    other_model = EmbeddingCache(tmp_path, "model-b")
+    assert len(other_model) == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """
+    Test that the cache never holds more than max_entries vectors and drops the LRU ones.
+    """
+    cache = EmbeddingCache(tmp_path, "model-a", max_entries=2)
+    model = CountingModel()
+    cache.encode(["one", "two"], model)
+    cache.encode(["one"], model)  # refresh "one"
+    cache.encode(["three"], model)
+
+    assert len(cache) == 2
+    cache.encode(["one"], model)
+    assert model.calls[-1] == ["three"]  # "one" was still cached
+
+
+def test_rebuild_reuses_cached_embeddings(mock_raw_log_file, temp_dir):
+    """
+    Test that a full rebuild with an unchanged log reads every vector from the shared cache.
+    """
+    paths = make_fake_paths(temp_dir)
+    indexer = make_raw_indexer(paths)
+    assert indexer.build_index_from_logs() is True
+
+    rebuilt = make_raw_indexer(paths)
+    rebuilt.embedding_model = CountingModel()
+    assert rebuilt.build_index_from_logs() is True
+    assert rebuilt.embedding_model.calls == []
+    assert rebuilt.embedding_cache is get_embedding_cache(
+        paths.vector_store_dir, rebuilt.embedding_model_name
+    )
+
+
+def test_searches_and_appends_leave_the_cache_file_alone(mock_raw_log_file, temp_dir):
+    """
+    Test that query vectors are not cached and that only full builds rewrite the cache file.
+    """
+    paths = make_fake_paths(temp_dir)
+    indexer = make_raw_indexer(paths)
+    assert indexer.build_index_from_logs() is True
+    cache = indexer.embedding_cache
+    stamp = cache.path.stat().st_mtime_ns
+    size = len(cache)
+
+    indexer.search("a query nobody logged")
+    assert len(cache) == size
+
+    entry = {"content": "fresh idea"}
+    logs = json.loads(mock_raw_log_file.read_text(encoding="utf-8"))
+    logs["2030-01-01"] = {"Ideas": {"New": [entry]}}
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    assert indexer.append_entries("2030-01-01", "Ideas", "New", [entry])
+    assert len(cache) == size + 1
+    assert cache.path.stat().st_mtime_ns == stamp
@@ -0,0 +1,51 @@
+import sys
+import types
+
+import pytest
+
+from scripts.indexers import embedding_models
+from tests.mocks.test_helpers import make_fake_paths, make_raw_indexer, make_summary_indexer
+
+pytestmark = [pytest.mark.unit, pytest.mark.indexing]
+
+
+@pytest.fixture
+def counting_transformer(monkeypatch):
+    """Fake sentence_transformers package counting model constructions."""
+    loads = []
+    fake_pkg = types.ModuleType("sentence_transformers")
+    fake_pkg.SentenceTransformer = lambda name: loads.append(name) or object()
+    monkeypatch.setitem(sys.modules, "sentence_transformers", fake_pkg)
+    embedding_models.unload()
+    yield loads
+    embedding_models.unload()
+
+
+def test_model_loaded_once_and_shared(counting_transformer, tmp_path):
+    """
+    Test that every indexer shares one lazily loaded model instance.
+    """
+    paths = make_fake_paths(tmp_path)
+    summary = make_summary_indexer(paths)
+    raw = make_raw_indexer(paths)
+    # Drop the per-test model doubles so both indexers fall back to the registry.
+    summary.embedding_model = None
+    raw.embedding_model = None
+    assert counting_transformer == []
+
+    assert summary.embedding_model is raw.embedding_model
+    assert counting_transformer == [summary.embedding_model_name]
+
+
+def test_warm_up_and_unload(counting_transformer):
+    """
+    Test that warm_up loads ahead of use and unload forces a reload on next access.
+    """
+    assert embedding_models.warm_up("model-a") is True
+    assert embedding_models.loaded_models() == ["model-a"]
+    first = embedding_models.get_embedding_model("model-a")
+
+    embedding_models.unload("model-a")
+    assert embedding_models.loaded_models() == []
+    assert embedding_models.get_embedding_model("model-a") is not first
+    assert counting_transformer == ["model-a", "model-a"]
@@ -0,0 +1,85 @@
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from scripts.indexers.base_indexer import BaseIndexer
+from scripts.indexers.embedding_pipeline import chunked, encode_batches
+from tests.mocks.test_helpers import make_raw_indexer, make_fake_paths
+
+pytestmark = [pytest.mark.unit, pytest.mark.indexing]
+
+
+def test_encode_batches_keeps_order_and_bounds_work_in_flight():
+    """
+    Test that batches encoded concurrently come back in input order, and that no more
+    batches than the memory budget allows are submitted ahead of the consumer.
+    """
+    lock = threading.Lock()
+    submitted = []
+
+    def encode(texts):
+        with lock:
+            submitted.append(texts[0])
+        time.sleep(0.001 * (len(submitted) % 3))
+        return np.array([[float(t), 0.0] for t in texts])
+
+    def numbers():
+        for i in range(20):
+            yield str(i), {"n": i}
+
+    # 2-dim float32 rows: 1 MiB holds 131072 rows, i.e. far more than 2 * workers batches.
+    out = []
+    for embeddings, meta in encode_batches(encode, chunked(numbers(), 3), workers=4, batch_size=3):
+        out.append((embeddings[:, 0].tolist(), [m["n"] for m in meta]))
+        assert len(submitted) <= 1 + len(out) + 2 * 4
+    assert [ids for _, ids in out] == [list(range(i, min(i + 3, 20))) for i in range(0, 20, 3)]
+    assert all(vec == [float(n) for n in ids] for vec, ids in out)
+
+    submitted.clear()
+    consumed = 0
+    tiny_budget = 2 * 3 * 4 / (1024 * 1024)  # room for a single 3-row batch
+    for _ in encode_batches(
+        encode, chunked(numbers(), 3), workers=4, batch_size=3, max_memory_mb=tiny_budget
+    ):
+        consumed += 1
+        assert len(submitted) <= consumed + 1
+
+
+def test_streaming_build_reports_progress_and_trains_on_sample(
+    mock_raw_log_file, temp_dir, monkeypatch
+):
+    """
+    Test that rebuilding from logs streams the source in batches, reports progress and
+    trains an approximate index on a sample while still indexing every entry.
+    """
+    entries = [{"timestamp": f"2024-01-01 10:{i:02d}:00", "content": f"e{i}"} for i in range(60)]
+    logs = {"2024-01-01": {"Ideas": {"General": entries}}}
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    monkeypatch.setattr(BaseIndexer, "_build_settings", staticmethod(lambda: (16, 2, 64.0)))
+    monkeypatch.setattr(
+        BaseIndexer,
+        "_index_settings",
+        staticmethod(lambda: ("hnsw", {"min_corpus_size": 10, "train_sample_size": 20}, False)),
+    )
+
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    calls = []
+
+    class RecordingModel:
+        def encode(self, texts, convert_to_numpy=True):
+            calls.append(len(texts))
+            return np.random.default_rng(len(calls)).random((len(texts), 8))
+
+    indexer.embedding_model = RecordingModel()
+    progress = []
+    assert indexer.build_index_from_logs(progress=lambda done, total: progress.append(done))
+
+    assert sorted(calls) == [12, 16, 16, 16]
+    assert progress == [16, 32, 48, 60]
+    assert indexer.index.ntotal == 60 and len(indexer.metadata) == 60
+    assert hasattr(indexer.index, "hnsw")
+    assert indexer.watermark == {"2024-01-01": {"Ideas": {"General": 60}}}
+    assert len(indexer.lexical_index) == 60
@@ -0,0 +1,83 @@
+import faiss
+import numpy as np
+import pytest
+
+from scripts.indexers.index_factory import benchmark_index, configure_search, create_index
+from tests.mocks.test_helpers import make_raw_indexer, make_fake_paths
+
+pytestmark = [pytest.mark.unit, pytest.mark.indexing]
+
+
+def _corpus(n=2000, dim=16):
+    return np.random.default_rng(1).standard_normal((n, dim)).astype("float32")
+
+
+@pytest.mark.parametrize(
+    "index_type, expected",
+    [
+        ("flat", faiss.IndexFlatL2),
+        ("ivf_flat", faiss.IndexIVFFlat),
+        ("hnsw", faiss.IndexHNSWFlat),
+    ],
+)
+def test_create_index_types(index_type, expected):
+    """
+    Test that each configured type yields the matching, trained FAISS index.
+    """
+    embeddings = _corpus()
+    index = create_index(embeddings, index_type, {"nprobe": 4})
+    assert isinstance(index, expected)
+    assert index.is_trained
+    index.add(embeddings)
+    assert index.ntotal == len(embeddings)
+
+
+def test_small_corpus_falls_back_to_flat():
+    """
+    Test that approximate types degrade to exact search below min_corpus_size,
+    and that IVF-PQ does so when there are too few vectors to train its codebooks.
+    """
+    assert isinstance(create_index(_corpus(n=50), "hnsw"), faiss.IndexFlatL2)
+    assert isinstance(create_index(_corpus(n=2000), "ivf_pq"), faiss.IndexFlatL2)
+
+
+def test_unknown_index_type_rejected():
+    with pytest.raises(ValueError):
+        create_index(_corpus(n=10), "annoy")
+
+
+def test_benchmark_reports_recall_against_flat():
+    """
+    Test that the benchmark compares against exact search (IVF with every cell probed is exact).
+    """
+    embeddings = _corpus()
+    index = create_index(embeddings, "ivf_flat", {"nlist": 8})
+    index.add(embeddings)
+    configure_search(index, {"nprobe": 8})
+
+    report = benchmark_index(index, embeddings, top_k=5, n_queries=20)
+    assert report["recall_at_k"] == pytest.approx(1.0)
+    assert report["n_queries"] == 20
+
+
+def test_build_index_uses_configured_type(mock_raw_log_file, temp_dir, mocker):
+    """
+    Test that BaseIndexer.build_index honours faiss_index_type and records a recall report.
+    """
+    mocker.patch(
+        "scripts.indexers.base_indexer.get_effective_config",
+        return_value={
+            "faiss_index_type": "hnsw",
+            "faiss_index_params": {"min_corpus_size": 1},
+            "faiss_report_on_build": True,
+        },
+    )
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    texts = [f"entry {i}" for i in range(20)]
+    assert indexer.build_index(texts, [{"id": i} for i in range(20)]) is True
+    assert isinstance(indexer.index, faiss.IndexHNSWFlat)
+    assert indexer.index_report is not None
+
+    indexer.load_index()
+    assert isinstance(indexer.index, faiss.IndexHNSWFlat)
+    assert indexer.index.hnsw.efSearch == 64
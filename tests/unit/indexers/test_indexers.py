@@ -41,6 +41,30 @@ class BaseIndexerTest:
         assert results
         assert results[0]["id"] == 1
 
+    def test_search_many_batches_queries(self, temp_dir):
+        """
+        Test that search_many embeds all queries in one model call and returns one
+        result list per query, matching the single-query search.
+        """
+        paths = make_fake_paths(temp_dir)
+        indexer = self.IndexerClass(paths=paths)
+        indexer.build_index(["This is a test.", "Something else."], [{"id": 1}, {"id": 2}])
+
+        calls = []
+        encode = indexer.embedding_model.encode
+
+        def recording_encode(texts, **kwargs):
+            calls.append(list(texts))
+            return encode(texts, **kwargs)
+
+        indexer.embedding_model.encode = recording_encode
+        results = indexer.search_many(["q1", "q2", "q3"], top_k=5)
+
+        assert calls == [["q1", "q2", "q3"]]
+        assert len(results) == 3
+        assert all(len(r) == 2 for r in results)  # FAISS -1 padding is dropped
+        assert results[0] == indexer.search("q1", top_k=5)
+
     def test_index_fails_on_empty_data(self, temp_dir):
         """
         Test that building an index with empty data returns False, indicating failure to index.
@@ -94,6 +118,7 @@ class BaseIndexerTest:
         """
         indexer = self.IndexerClass(paths=make_fake_paths(temp_dir))
         indexer.index = None
+        indexer.autoload = False
         results = indexer.search("irrelevant")
         assert results == []
 
@@ -311,6 +336,26 @@ def test_summary_indexer_search_various_top_k(mock_correction_summaries_file, te
     assert len(results) <= top_k
 
 
+def test_indexers_share_the_cached_source_parse(mock_raw_log_file, temp_dir):
+    """
+    Test that indexers without a source reader take the file through the shared JSON
+    cache, so repeated loads of an unchanged file are not parsed again.
+    """
+    paths = make_fake_paths(temp_dir)
+    first, second = make_raw_indexer(paths), make_raw_indexer(paths)
+    assert first._load_source()
+    assert second._load_source() is first._load_source()
+
+    append_to_log(
+        mock_raw_log_file,
+        "2024-01-02",
+        "Ideas",
+        "General",
+        {"timestamp": "2024-01-02 10:00:00", "content": "changed"},
+    )
+    assert "2024-01-02" in second._load_source()
+
+
 def test_summary_indexer_handles_missing_file(temp_dir):
     """
     Unit tests for RawLogIndexer and SummaryIndexer classes, including shared test logic for indexers.
@@ -354,3 +399,183 @@ def test_summary_indexer_handles_corrupt_json(mock_correction_summaries_file):
     texts, meta = indexer.load_entries()
     assert texts == []
     assert meta == []
+
+
+# ----------------- Incremental updates -----------------
+
+
+class CountingModel:
+    """Embedding model double that records how many texts were encoded."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        import numpy as np
+
+        self.encoded.extend(texts)
+        return np.array([[0.1] * 384 for _ in texts], dtype="float32")
+
+
+def test_raw_indexer_update_index_embeds_only_new_entries(mock_raw_log_file, temp_dir):
+    """
+    Test that update_index appends only entries beyond the high-water mark instead of
+    re-encoding the whole log.
+    """
+    logs = make_fake_logs("2024-01-01", "Ideas", "General", 3)
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    assert indexer.build_index_from_logs() is True
+    assert indexer.watermark == {"2024-01-01": {"Ideas": {"General": 3}}}
+
+    logs["2024-01-01"]["Ideas"]["General"].append({"timestamp": "t", "content": "new idea"})
+    logs["2024-01-02"] = {"Ideas": {"General": [{"timestamp": "t2", "content": "next day"}]}}
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+
+    indexer.embedding_model = CountingModel()
+    assert indexer.update_index() is True
+    assert indexer.embedding_model.encoded == ["new idea", "next day"]
+    assert indexer.index.ntotal == 5
+    assert len(indexer.metadata) == 5
+    assert indexer.watermark["2024-01-02"]["Ideas"]["General"] == 1
+
+
+def append_to_log(log_file, date, main_cat, subcat, entry):
+    """Appends `entry` to the raw log file, as the log manager does before indexing it."""
+    logs = json.loads(log_file.read_text(encoding="utf-8"))
+    logs.setdefault(date, {}).setdefault(main_cat, {}).setdefault(subcat, []).append(entry)
+    log_file.write_text(json.dumps(logs), encoding="utf-8")
+
+
+def test_raw_indexer_append_entries_persists_watermark(mock_raw_log_file, temp_dir):
+    """
+    Test that append_entries indexes the given items directly, and that flush persists the
+    advanced high-water mark alongside the metadata.
+    """
+    logs = make_fake_logs("2024-01-01", "Ideas", "General", 2)
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    paths = make_fake_paths(temp_dir)
+    indexer = make_raw_indexer(paths)
+    indexer.build_index_from_logs()
+
+    entry = {"timestamp": "t", "content": "fresh"}
+    append_to_log(mock_raw_log_file, "2024-01-01", "Ideas", "General", entry)
+    indexer.append_entries("2024-01-01", "Ideas", "General", [entry])
+    assert indexer.index.ntotal == 3
+    assert indexer.dirty
+    assert json.loads(indexer.watermark_path.read_text())["2024-01-01"]["Ideas"]["General"] == 2
+
+    indexer.flush()
+    assert not indexer.dirty
+    reloaded = make_raw_indexer(paths)
+    reloaded.load_index()
+    assert reloaded.watermark == {"2024-01-01": {"Ideas": {"General": 3}}}
+    assert reloaded.metadata[-1]["timestamp"] == "t"
+
+
+def test_appends_are_saved_after_flush_every_appends(mock_raw_log_file, temp_dir, monkeypatch):
+    """
+    Test that appended entries are written to the index files once per `index_flush_every`
+    appends rather than once per append.
+    """
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    assert indexer.build_index_from_logs() is True
+    monkeypatch.setattr(indexer, "_flush_settings", lambda: (3, 60.0))
+    saves = []
+    save_index = indexer.save_index
+    monkeypatch.setattr(indexer, "save_index", lambda: saves.append(1) or save_index())
+
+    for i in range(4):
+        entry = {"timestamp": f"2024-01-02 10:00:0{i}", "content": f"appended {i}"}
+        append_to_log(mock_raw_log_file, "2024-01-02", "Ideas", "General", entry)
+        assert indexer.append_entries("2024-01-02", "Ideas", "General", [entry]) is True
+    assert len(saves) == 1 and indexer.dirty
+    indexer.flush()
+    assert len(saves) == 2 and not indexer.dirty
+
+
+def test_raw_indexer_append_entries_catches_up_a_stale_watermark(mock_raw_log_file, temp_dir):
+    """
+    Test that append_entries indexes from the source instead when the high-water mark does
+    not end where the appended items start, so a missed append is not skipped for good.
+    """
+    logs = make_fake_logs("2024-01-01", "Ideas", "General", 2)
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    indexer.build_index_from_logs()
+
+    missed = {"timestamp": "t1", "content": "never indexed"}
+    entry = {"timestamp": "t2", "content": "fresh"}
+    append_to_log(mock_raw_log_file, "2024-01-01", "Ideas", "General", missed)
+    append_to_log(mock_raw_log_file, "2024-01-01", "Ideas", "General", entry)
+    assert indexer.append_entries("2024-01-01", "Ideas", "General", [entry]) is True
+
+    assert indexer.index.ntotal == 4
+    assert [row["timestamp"] for row in indexer.metadata][-2:] == ["t1", "t2"]
+    assert indexer.watermark == {"2024-01-01": {"Ideas": {"General": 4}}}
+
+
+def test_summary_indexer_update_index_falls_back_to_full_rebuild(
+    mock_correction_summaries_file, temp_dir
+):
+    """
+    Test that update_index performs a full rebuild when the source shrank below the
+    high-water mark, so stale vectors are never kept.
+    """
+    batch = {"corrected_summary": "S", "batch": 1, "correction_timestamp": "t"}
+    summaries = {"global": {"Ideas": {"General": [batch, dict(batch, batch=2)]}}}
+    mock_correction_summaries_file.write_text(json.dumps(summaries), encoding="utf-8")
+    indexer = make_summary_indexer(make_fake_paths(temp_dir))
+    indexer.build_index_from_logs()
+    assert indexer.index.ntotal == 2
+
+    summaries["global"]["Ideas"]["General"].pop()
+    mock_correction_summaries_file.write_text(json.dumps(summaries), encoding="utf-8")
+    assert indexer.update_index() is True
+    assert indexer.index.ntotal == 1
+    assert indexer.watermark == {"global": {"Ideas": {"General": 1}}}
+
+
+def test_raw_indexer_opens_lazily_and_copies_mmap_before_append(mock_raw_log_file, temp_dir):
+    """
+    Test that a persisted index is memory-mapped on first search rather than at
+    construction, and is swapped for an in-memory copy before new vectors are added.
+    """
+    paths = make_fake_paths(temp_dir)
+    assert make_raw_indexer(paths).build_index_from_logs() is True
+
+    lazy = make_raw_indexer(paths)
+    assert lazy.index is None
+    assert lazy.search("idea")
+    assert lazy.index_mmapped
+    before = lazy.index.ntotal
+
+    entry = {"timestamp": "2024-01-02 10:00:00", "content": "appended later"}
+    append_to_log(mock_raw_log_file, "2024-01-02", "Ideas", "General", entry)
+    assert lazy.append_entries("2024-01-02", "Ideas", "General", [entry]) is True
+    assert not lazy.index_mmapped
+    assert lazy.index.ntotal == before + 1
+
+
+def test_search_waits_for_a_writer_holding_the_indexer_lock(mock_raw_log_file, temp_dir):
+    """
+    Test that searches and appends serialize on the indexer lock, so a background writer
+    never swaps the index or metadata under a running search.
+    """
+    import threading
+
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    assert indexer.build_index_from_logs() is True
+    results = []
+    searcher = threading.Thread(target=lambda: results.append(indexer.hybrid_search("idea")))
+
+    with indexer.lock:  # A writer in the middle of append/save
+        searcher.start()
+        searcher.join(0.2)
+        assert searcher.is_alive() and not results
+        entry = {"timestamp": "2024-01-02 10:00:00", "content": "appended meanwhile"}
+        append_to_log(mock_raw_log_file, "2024-01-02", "Ideas", "General", entry)
+        assert indexer.append_entries("2024-01-02", "Ideas", "General", [entry]) is True
+
+    searcher.join(5)
+    assert results and results[0]
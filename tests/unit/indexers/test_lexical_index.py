@@ -0,0 +1,125 @@
+import json
+import shutil
+
+import numpy as np
+import pytest
+
+from scripts.indexers.lexical_index import BM25Index, reciprocal_rank_fusion, tokenize
+from tests.mocks.test_helpers import make_raw_indexer, make_fake_paths
+
+pytestmark = [pytest.mark.unit, pytest.mark.indexing]
+
+
+class ExplodingModel:
+    """Embedding model double that fails if the model is used at all."""
+
+    def encode(self, texts, convert_to_numpy=True):
+        raise AssertionError("embedding model must not be used")
+
+
+def test_bm25_ranks_rare_exact_terms_first(tmp_path):
+    """
+    Test that BM25 favours documents containing rare query terms and survives persistence.
+    """
+    index = BM25Index.from_texts(
+        ["fix ticket ZX-4821 in parser", "parser ideas", "ticket triage ideas", "unrelated"]
+    )
+    assert tokenize("ZX-4821!") == ["zx", "4821"]
+    assert [doc for doc, _ in index.search("zx-4821 ticket", top_k=3)] == [0, 2]
+    assert index.search("nothing matches") == []
+
+    expected = index.search("parser", top_k=5)
+    index.save(tmp_path / "bm25")
+    reloaded = BM25Index.load(tmp_path / "bm25")
+    assert reloaded.search("parser", top_k=5) == expected
+
+
+def test_bm25_persists_as_mmapped_arrays_and_merges_appends(tmp_path):
+    """
+    Test that a saved index is plain JSON and .npy files opened memory-mapped, and that
+    documents appended after loading are searchable and merged into the next save.
+    """
+    BM25Index.from_texts(["alpha beta", "beta gamma"]).save(tmp_path / "bm25")
+    assert not list(tmp_path.rglob("*.pkl"))
+    loaded = BM25Index.load(tmp_path / "bm25")
+    assert isinstance(loaded._doc_ids, np.memmap)
+
+    loaded.add(["gamma delta", "alpha"])
+    fresh = BM25Index.from_texts(["alpha beta", "beta gamma", "gamma delta", "alpha"])
+    for query in ("alpha", "gamma", "delta beta"):
+        assert loaded.search(query, top_k=4) == pytest.approx(fresh.search(query, top_k=4))
+
+    saved = loaded.save(tmp_path / "bm25")
+    assert len(saved) == 4 and not saved._postings
+    assert saved.search("alpha gamma", top_k=4) == pytest.approx(
+        fresh.search("alpha gamma", top_k=4)
+    )
+    assert sorted(p.name for p in (tmp_path / "bm25").iterdir() if p.suffix == ".npy") == [
+        f"{name}.g2.npy" for name in ("doc_ids", "doc_lengths", "offsets", "tfs")
+    ]
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([[1, 2, 3], [3, 1]], k=60)
+    assert [doc for doc, _ in fused] == [1, 3, 2]
+
+
+def test_raw_indexer_lexical_search_skips_embedding_model(mock_raw_log_file, temp_dir):
+    """
+    Test that keyword search on a persisted raw index never encodes, and that appended
+    entries become searchable lexically.
+    """
+    logs = {
+        "2024-01-01": {
+            "Ideas": {
+                "General": [
+                    {"timestamp": "2024-01-01 09:00:00", "content": "Refactor parser for ZX-4821"},
+                    {"timestamp": "2024-01-01 10:00:00", "content": "Garden watering schedule"},
+                ]
+            }
+        }
+    }
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    paths = make_fake_paths(temp_dir)
+    assert make_raw_indexer(paths).build_index_from_logs() is True
+    assert make_raw_indexer(paths).lexical_index_path.exists()
+
+    reader = make_raw_indexer(paths)
+    reader.embedding_model = ExplodingModel()
+    results = reader.lexical_search("zx-4821", top_k=5)
+    assert [r["timestamp"] for r in results] == ["2024-01-01 09:00:00"]
+    assert results[0]["lexical_score"] > 0
+
+    writer = make_raw_indexer(paths)
+    entry = {"timestamp": "2024-01-02 08:00:00", "content": "Ticket ZX-9000 follow-up"}
+    logs["2024-01-02"] = {"Ideas": {"General": [entry]}}
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    assert writer.append_entries("2024-01-02", "Ideas", "General", [entry]) is True
+    assert writer.lexical_search("zx-9000", top_k=5)[0]["timestamp"] == "2024-01-02 08:00:00"
+
+
+def test_missing_lexical_index_is_rebuilt_without_encoding(mock_raw_log_file, temp_dir):
+    """
+    Test that a raw index whose BM25 files are gone rebuilds only the BM25 index from the
+    log texts, without the embedding model.
+    """
+    logs = {
+        "2024-01-01": {
+            "Ideas": {
+                "General": [
+                    {"timestamp": "2024-01-01 09:00:00", "content": "Refactor parser for ZX-4821"},
+                    {"timestamp": "2024-01-01 10:00:00", "content": "Garden watering schedule"},
+                ]
+            }
+        }
+    }
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    paths = make_fake_paths(temp_dir)
+    assert make_raw_indexer(paths).build_index_from_logs() is True
+
+    reader = make_raw_indexer(paths)
+    shutil.rmtree(reader.lexical_index_path)
+    reader.embedding_model = ExplodingModel()
+    results = reader.lexical_search("garden", top_k=5)
+    assert [r["timestamp"] for r in results] == ["2024-01-01 10:00:00"]
+    assert reader.lexical_index_path.exists()
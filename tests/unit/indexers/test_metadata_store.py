@@ -0,0 +1,151 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from scripts.indexers.metadata_store import ColumnarMetadata, select_rows
+from tests.mocks.test_helpers import make_raw_indexer, make_fake_paths
+
+pytestmark = [pytest.mark.unit, pytest.mark.indexing]
+
+
+def _rows(n):
+    return [
+        {
+            "date": "2024-01-01",
+            "main_category": "Ideas",
+            "subcategory": "General" if i % 2 else "Other",
+            "timestamp": f"2024-01-01 10:{i:05d}",
+            "batch": i // 5 if i % 7 else None,
+        }
+        for i in range(n)
+    ]
+
+
+def test_round_trip_is_memory_mapped_and_interned(tmp_path):
+    """
+    Test that saved metadata reloads equal to the source rows, with categories stored
+    as integer codes and timestamps as fixed-width arrays backed by memory maps.
+    """
+    rows = _rows(2000)
+    store = ColumnarMetadata.from_rows(rows).save(tmp_path / "meta.cols")
+
+    assert store == rows
+    assert store[-1] == rows[-1]
+    assert store[3:5] == rows[3:5]
+    subcategory = store.column("subcategory")
+    assert subcategory.kind == "category" and subcategory.table == ["Other", "General"]
+    assert store.column("timestamp").kind == "str"
+    assert isinstance(store.column("timestamp").values, np.memmap)
+
+
+def test_appends_and_schema_changes_survive_save(tmp_path):
+    """
+    Test that appended rows, new keys and values of a new type are merged on save.
+    """
+    store = ColumnarMetadata.from_rows([{"id": 1}, {"id": 2}]).save(tmp_path / "meta.cols")
+    store.extend([{"id": "three", "extra": True}, {}])
+    expected = [{"id": 1}, {"id": 2}, {"id": "three", "extra": True}, {}]
+    assert store == expected
+
+    reloaded = store.save(tmp_path / "meta.cols")
+    assert reloaded == expected
+    assert reloaded.stored_length == 4
+    assert sorted(p.name for p in (tmp_path / "meta.cols").glob("*.npy"))[0].startswith("c0.g2")
+
+
+def test_indexer_migrates_legacy_pickle(mock_raw_log_file, temp_dir):
+    """
+    Test that an index saved with pickled metadata still loads and is migrated on save.
+    """
+    paths = make_fake_paths(temp_dir)
+    indexer = make_raw_indexer(paths)
+    assert indexer.build_index_from_logs() is True
+    rows = list(indexer.metadata)
+
+    # Simulate an index written before the columnar store existed.
+    for path in indexer.metadata_store_path.iterdir():
+        path.unlink()
+    indexer.metadata_store_path.rmdir()
+    with open(indexer.metadata_path, "wb") as f:
+        pickle.dump(rows, f)
+
+    legacy = make_raw_indexer(paths)
+    legacy.load_index()
+    assert legacy.metadata == rows
+
+    legacy.save_index()
+    assert not indexer.metadata_path.exists()
+    assert isinstance(legacy.metadata, ColumnarMetadata)
+    assert legacy.metadata == rows
+
+
+def test_select_rows_matches_on_codes_and_pending_rows(tmp_path):
+    """
+    Test that columnar filtering agrees with row-by-row filtering, including appended rows
+    and summaries whose date key is not a date.
+    """
+    rows = _rows(50)
+    rows[10]["date"] = "global"
+    rows[10]["timestamp"] = "2024-03-05 08:00:00"
+    store = ColumnarMetadata.from_rows(rows[:40]).save(tmp_path / "meta.cols")
+    store.extend(rows[40:])
+
+    filters = {"subcategory": ["General"], "date_from": "2024-01-01", "date_to": "2024-01-31"}
+    expected = [i for i in range(50) if rows[i]["subcategory"] == "General" and i != 10]
+    assert select_rows(store, filters).tolist() == expected
+    assert select_rows(rows, filters).tolist() == expected
+    assert select_rows(store, {"date_from": "2024-03-01"}).tolist() == [10]
+    assert select_rows(store, {"main_category": "Missing"}).tolist() == []
+    with pytest.raises(ValueError):
+        select_rows(store, {"author": "me"})
+
+
+def test_filtered_search_only_returns_matching_rows(mock_raw_log_file, temp_dir):
+    """
+    Test that filters restrict indexer search results before ranking.
+    """
+    logs = {
+        "2024-01-01": {
+            "Ideas": {"General": [{"timestamp": "2024-01-01 09:00:00", "content": "a"}]}
+        },
+        "2024-02-01": {
+            "Ideas": {"General": [{"timestamp": "2024-02-01 09:00:00", "content": "b"}]},
+            "Work": {"Tasks": [{"timestamp": "2024-02-01 10:00:00", "content": "c"}]},
+        },
+    }
+    mock_raw_log_file.write_text(json.dumps(logs), encoding="utf-8")
+    indexer = make_raw_indexer(make_fake_paths(temp_dir))
+    assert indexer.build_index_from_logs() is True
+
+    results = indexer.search("anything", top_k=5, filters={"date_from": "2024-02-01"})
+    assert sorted(r["timestamp"] for r in results) == ["2024-02-01 09:00:00", "2024-02-01 10:00:00"]
+    results = indexer.search(
+        "anything", top_k=5, filters={"main_category": "Ideas", "date_to": "2024-01-31"}
+    )
+    assert [r["timestamp"] for r in results] == ["2024-01-01 09:00:00"]
+    assert indexer.search("anything", filters={"subcategory": "Nope"}) == []
+    lexical = indexer.lexical_search("b c", filters={"main_category": "Work"})
+    assert [r["subcategory"] for r in lexical] == ["Tasks"]
+
+
+def test_filter_selections_follow_metadata_changes(temp_dir):
+    """
+    Test that cached filter selections are per indexer and are invalidated when metadata
+    is replaced or extended, even when the new metadata object reuses the old one's id.
+    """
+    first = make_raw_indexer(make_fake_paths(temp_dir / "a"))
+    second = make_raw_indexer(make_fake_paths(temp_dir / "b"))
+    assert first.watermark is not second.watermark
+    first.metadata = [{"main_category": "Ideas", "subcategory": "General", "date": "2024-01-01"}]
+    filters = {"main_category": "Ideas"}
+    assert first.candidate_ids(filters).tolist() == [0]
+    second.metadata = []
+    assert second.candidate_ids(filters).tolist() == []
+
+    first.metadata.append(dict(first.metadata[0]))
+    first._metadata_generation += 1
+    assert first.candidate_ids(filters).tolist() == [0, 1]
+    first.metadata = [{"main_category": "Work", "subcategory": "Tasks", "date": "2024-01-01"}]
+    assert first.candidate_ids(filters).tolist() == []
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from scripts.ai.async_ai_summarizer import AsyncAISummarizer
+from scripts.unified_code_assistant.context_precompute import ContextPrecompute
+
+pytestmark = [pytest.mark.unit, pytest.mark.ai_mocked]
+
+
+class GatedSummarizer:
+    """Answers each prompt only after the test releases it."""
+
+    def __init__(self):
+        self.release = threading.Semaphore(0)
+        self.calls = []
+
+    def summarize_entry(self, text, subcategory=None):
+        self.release.acquire()
+        self.calls.append((text, subcategory))
+        return f"answer: {text}"
+
+
+def test_precompute_serves_partial_context_while_running():
+    summarizer = GatedSummarizer()
+    jobs = [
+        ("recommendation", "a.py", "fix a"),
+        ("module", "a.py", "describe a"),
+        ("module", "b.py", "describe b"),
+    ]
+    precompute = ContextPrecompute(
+        summarizer, {"a.py": None, "b.py": None, "c.py": "No functions."}, jobs
+    ).start()
+
+    assert precompute.snapshot() == ({"c.py": "No functions."}, {})
+    assert not precompute.done()
+
+    summarizer.release.release()
+    while precompute.progress()[0] < 1:
+        time.sleep(0.001)
+    assert precompute.snapshot()[1] == {"a.py": "answer: fix a"}
+
+    for _ in range(2):
+        summarizer.release.release()
+    assert precompute.wait(5)
+    summaries, recommendations = precompute.snapshot()
+    assert summaries == {
+        "a.py": "answer: describe a",
+        "b.py": "answer: describe b",
+        "c.py": "No functions.",
+    }
+    assert [sub for _, sub in summarizer.calls] == [
+        "Tooling & Automation",
+        "Module Functionality",
+        "Module Functionality",
+    ]
+    assert precompute.progress() == (3, 3)
+
+
+def test_precompute_overlaps_jobs_with_async_summarizer(fake_async_client):
+    client = fake_async_client()
+    summarizer = AsyncAISummarizer(client_factory=lambda: client)
+    summarizer.max_concurrency = 3
+    jobs = [("module", f"m{i}.py", f"describe {i}") for i in range(5)]
+    precompute = ContextPrecompute(summarizer, {f"m{i}.py": None for i in range(5)}, jobs).start()
+
+    assert precompute.wait(5)
+    summaries, _ = precompute.snapshot()
+    assert len(summaries) == 5 and all(summaries.values())
+    assert 1 < client.peak <= summarizer.max_concurrency
+
+
+def test_precompute_finishes_other_jobs_when_one_fails(fake_async_client):
+    class FailingSummarizer(AsyncAISummarizer):
+        async def summarize_entry_async(self, entry_text, subcategory=None, bypass_cache=False):
+            if entry_text == "describe 1":
+                raise RuntimeError("bad prompt")
+            return await super().summarize_entry_async(entry_text, subcategory, bypass_cache)
+
+    summarizer = FailingSummarizer(client_factory=fake_async_client)
+    jobs = [("module", f"m{i}.py", f"describe {i}") for i in range(3)]
+    precompute = ContextPrecompute(summarizer, {f"m{i}.py": None for i in range(3)}, jobs).start()
+
+    assert precompute.wait(5)
+    assert sorted(precompute.snapshot()[0]) == ["m0.py", "m2.py"]
+    assert precompute.progress() == (2, 3)
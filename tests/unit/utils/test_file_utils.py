@@ -10,6 +10,10 @@ from scripts.utils.file_utils import (
     read_json,
     make_backup,
     zip_python_files,
+    get_write_stats,
+    reset_write_stats,
+    json_cache_info,
+    clear_json_cache,
 )
 
 pytestmark = [pytest.mark.unit, pytest.mark.file_ops]
@@ -145,3 +149,74 @@ def test_write_and_read_json_with_invalid_data(tmp_path):
     write_json(path, data)
     result = read_json(path)
     assert result == data
+
+
+def test_write_json_is_atomic_compact_and_timed(tmp_path):
+    """
+    Test that write_json replaces the file atomically (a failed write leaves the old
+    file and no temp file behind), writes compact JSON on request and records timings.
+    """
+    path = tmp_path / "out" / "data.json"
+    reset_write_stats()
+    write_json(path, {"a": [1, 2], "é": "ü"})
+    assert "\n" in path.read_text(encoding="utf-8")
+
+    write_json(path, {"a": [1, 2], "é": "ü"}, indent=None)
+    assert path.read_text(encoding="utf-8") == '{"a":[1,2],"é":"ü"}'
+
+    with pytest.raises(TypeError):
+        write_json(path, {"bad": object()})
+    assert read_json(path) == {"a": [1, 2], "é": "ü"}
+    assert [p.name for p in path.parent.iterdir()] == ["data.json"]
+
+    stats = get_write_stats()
+    assert stats["writes"] == 2
+    assert stats["bytes"] > 0 and stats["seconds"] >= stats["max_seconds"] > 0
+
+
+def test_write_json_keeps_file_permissions(tmp_path):
+    """
+    Test that rewriting a file keeps its mode and that new files get the umask default
+    rather than the 0600 of the temp file.
+    """
+    path = tmp_path / "shared.json"
+    write_json(path, {"a": 1})
+    umask = os.umask(0)
+    os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    os.chmod(path, 0o640)
+    write_json(path, {"a": 2})
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_read_json_cache_validates_and_invalidates(tmp_path, monkeypatch):
+    """
+    Test that cached reads parse a file once, notice external changes through its
+    mtime and size, are invalidated by write_json and evict the least recently used file.
+    """
+    import scripts.utils.file_utils as fu
+
+    clear_json_cache()
+    path = tmp_path / "cached.json"
+    write_json(path, {"v": 1})
+    first = read_json(path, use_cache=True)
+    assert read_json(path, use_cache=True) is first
+    assert read_json(path) is not first
+    assert json_cache_info()["hits"] == 1 and json_cache_info()["misses"] == 1
+
+    write_json(path, {"v": 2})
+    assert read_json(path, use_cache=True) == {"v": 2}
+    path.write_text('{"v": 33}', encoding="utf-8")
+    assert read_json(path, use_cache=True) == {"v": 33}
+
+    monkeypatch.setattr(fu, "JSON_CACHE_MAX_ENTRIES", 2)
+    others = [tmp_path / f"other{i}.json" for i in range(2)]
+    for other in others:
+        write_json(other, {"other": True})
+        read_json(other, use_cache=True)
+    assert json_cache_info()["entries"] == 2
+    misses = json_cache_info()["misses"]
+    read_json(path, use_cache=True)
+    assert json_cache_info()["misses"] == misses + 1
+    clear_json_cache()
@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 # ✅ Correct absolute import based on project structure
 from scripts.utils.link_summaries_to_raw_logs import inject_entries_into_summaries
 
@@ -35,9 +37,10 @@ def test_inject_entries_into_summaries(tmp_path, monkeypatch):
         "scripts.utils.link_summaries_to_raw_logs.get_absolute_path",
         lambda path: str(raw_path if "zephyrus_log" in path else summaries_path),
     )
+    config = {"raw_log_path": str(raw_path), "correction_summaries_path": str(summaries_path)}
     monkeypatch.setattr(
         "scripts.utils.link_summaries_to_raw_logs.get_config_value",
-        lambda conf, key, default=None: str(raw_path if "raw_log" in key else summaries_path),
+        lambda conf, key, default=None: config.get(key, default),
     )
 
     inject_entries_into_summaries()
@@ -45,3 +48,42 @@ def test_inject_entries_into_summaries(tmp_path, monkeypatch):
     # Confirm entries injected
     updated = json.loads(summaries_path.read_text())
     assert updated["Test"]["Flow"][0]["entries"] == ["entry A", "entry B"]
+
+
+def test_inject_entries_reads_the_sharded_backend(tmp_path, monkeypatch):
+    """
+    Tests that raw entries are read through the configured storage backend, so a sharded
+    log is used instead of its renamed single-file original, and that the SQLite backend
+    is refused.
+    """
+    from scripts.core.log_storage import create_log_storage
+
+    raw_path = tmp_path / "zephyrus_log.json"
+    summaries_path = tmp_path / "correction_summaries.json"
+    raw_path.write_text(json.dumps({"2024-01-01": {"Test": {"Flow": []}}}), encoding="utf-8")
+    sharded = create_log_storage("sharded", raw_path)
+    assert not raw_path.exists()
+    sharded.append(
+        "2024-01-01", "Test", "Flow", {"timestamp": "2024-01-01 10:00:00", "content": "entry A"}
+    )
+    summaries_path.write_text(json.dumps({"Test": {"Flow": [{"batch": "1-1"}]}}), encoding="utf-8")
+
+    config = {
+        "raw_log_path": str(raw_path),
+        "correction_summaries_path": str(summaries_path),
+        "log_storage_backend": "sharded",
+    }
+    monkeypatch.setattr("scripts.utils.link_summaries_to_raw_logs.load_config", lambda: {})
+    monkeypatch.setattr("scripts.utils.link_summaries_to_raw_logs.get_absolute_path", str)
+    monkeypatch.setattr(
+        "scripts.utils.link_summaries_to_raw_logs.get_config_value",
+        lambda conf, key, default=None: config.get(key, default),
+    )
+
+    inject_entries_into_summaries()
+    updated = json.loads(summaries_path.read_text())
+    assert updated["Test"]["Flow"][0]["entries"] == ["entry A"]
+
+    config["log_storage_backend"] = "sqlite"
+    with pytest.raises(RuntimeError):
+        inject_entries_into_summaries()